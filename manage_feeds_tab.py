@@ -1,35 +1,228 @@
+import bisect
 import json
+import mmap
+import os
+import re
+import sys
+from dataclasses import dataclass
+
+# ✅ Prefer orjson (Rust) for much faster parse/serialize; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ✅ pysimdjson parses fastest of all on the read path; wheels aren't available
+# everywhere, so it stays optional too
+try:
+    import simdjson
+    _PARSER = simdjson.Parser()  # reused so the parser keeps its internal buffers
+except ImportError:
+    _PARSER = None
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QLineEdit, QComboBox, QMessageBox
+    QListView, QLineEdit, QComboBox, QMessageBox, QCompleter, QInputDialog
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QTimer, QRunnable, QThreadPool,
+    QObject, Signal, Slot, QStringListModel
+)
+
+# Compiled once so add-feed clicks never recompile (and never backtrack badly)
+_URL_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE)
+
+# Compact row type: no per-feed dict overhead, attribute access instead of
+# key lookups. A slotted dataclass (not a namedtuple) so orjson serializes
+# it natively as {"name": ..., "url": ...} rather than a bare array.
+@dataclass(slots=True, frozen=True)
+class Feed:
+    name: str
+    url: str
+
+def _feed_default(o):
+    # json.dumps default hook for the stdlib fallback encoder
+    if isinstance(o, Feed):
+        return {"name": o.name, "url": o.url}
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+def _intern_feeds(data):
+    # Interning category names collapses strings the parser allocated fresh;
+    # packing rows into Feed tuples drops the two-key dict per feed entirely
+    return {
+        sys.intern(category): [Feed(f["name"], f["url"]) for f in feeds]
+        for category, feeds in data.items()
+    }
+
+def load_feeds_file(feeds_file):
+    """Read and parse the feeds JSON; safe to call from any thread."""
+    try:
+        with open(feeds_file, "rb") as file:
+            try:
+                # Zero-copy: simdjson scans the kernel page cache directly
+                # instead of a file.read() bytes duplicate
+                mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file can't be mapped
+                return {}
+            try:
+                if _PARSER is not None:
+                    # Export to a plain dict so the parsed doc (and its buffer
+                    # lifetime rules) never escape this function
+                    data = _PARSER.parse(mm).as_dict()
+                elif orjson is not None:
+                    data = orjson.loads(mm[:])  # orjson has no load(), only loads()
+                else:
+                    data = json.loads(mm[:])
+            finally:
+                mm.close()
+        return _intern_feeds(data)
+    except Exception:
+        return {}
+
+class LoadFeedsTaskSignals(QObject):
+    loaded = Signal(dict)
+
+class LoadFeedsTask(QRunnable):
+    """Loads the feeds file off the GUI thread so the tab shows instantly."""
+
+    def __init__(self, feeds_file):
+        super().__init__()
+        self.feeds_file = feeds_file
+        self.signals = LoadFeedsTaskSignals()
+
+    @Slot()
+    def run(self):
+        if _PARSER is not None:
+            # Lazy path: simdjson's parse is just the structural scan, so only
+            # the category keys are materialized here. The doc (and the mmap
+            # it reads from) stay alive until the tab exports categories.
+            try:
+                with open(self.feeds_file, "rb") as file:
+                    mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                doc = _PARSER.parse(mm)
+                keys = sorted(str(k) for k in doc.keys())
+                self.signals.loaded.emit({"doc": doc, "mm": mm, "keys": keys})
+                return
+            except Exception:
+                pass
+        data = load_feeds_file(self.feeds_file)
+        self.signals.loaded.emit({"data": data, "keys": sorted(data.keys())})
+
+class FeedListModel(QAbstractListModel):
+    """Read-only list model over one category's feeds, shown as "name — url"."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._formatted = []
+
+    def set_feeds(self, formatted):
+        # Swap in the preformatted rows for the current category in one reset
+        self.beginResetModel()
+        self._formatted = formatted
+        self.endResetModel()
+
+    def append_row(self, text):
+        # Mutates the shared formatted list in place so the cache stays in sync
+        row = len(self._formatted)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._formatted.append(text)
+        self.endInsertRows()
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._formatted[row]
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._formatted)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self._formatted[index.row()]
+        return None
 
 class ManageFeedsTab(QWidget):
     def __init__(self, feeds_file):
         super().__init__()
         self.feeds_file = feeds_file
-        self.feeds_data = self.load_feeds()
+        self.feeds_data = {}
+        self._categories = []  # kept sorted; see add_category
+        self._formatted_cache = {}  # category -> preformatted "name — url" strings
+        self._url_index = {}  # category -> set of URLs for O(1) duplicate checks
+        self._doc = None  # lazy simdjson document, dropped on first mutation
+        self._doc_mm = None  # the mmap backing _doc; must outlive it
+        self._dirty = False
+        self._last_saved_hash = None  # hash of the last payload written to disk
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)  # coalesce rapid edits into one write
+        self._save_timer.timeout.connect(self._flush_save)
         self.init_ui()
+        # Parse the feeds file in the background; the UI fills in when ready
+        self._load_task = LoadFeedsTask(self.feeds_file)
+        self._load_task.signals.loaded.connect(self._on_feeds_loaded, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._load_task)
+
+    def _on_feeds_loaded(self, payload):
+        self._categories = payload["keys"]
+        self._doc = payload.get("doc")
+        self._doc_mm = payload.get("mm")
+        if self._doc is None:
+            feeds_data = payload.get("data", {})
+            self.feeds_data = feeds_data
+            self._url_index = {cat: {f.url for f in lst} for cat, lst in feeds_data.items()}
+            self._refresh_name_completer()
+        self.category_combo.addItems(self._categories)
+        self.load_category_feeds()
+
+    def _refresh_name_completer(self):
+        # Lazily-held categories aren't included until they materialize
+        names = [f.name for lst in self.feeds_data.values() for f in lst]
+        self._name_model.setStringList(names)
+
+    def _ensure_category(self, category):
+        # Export one category out of the lazy doc the first time it's needed
+        if self._doc is not None and category not in self.feeds_data:
+            feeds = [Feed(f["name"], f["url"]) for f in self._doc[category].as_list()]
+            self.feeds_data[sys.intern(category)] = feeds
+            self._url_index[category] = {f.url for f in feeds}
+
+    def _materialize_all(self):
+        # Mutations operate on the full dict, so drop the lazy doc (and close
+        # its mmap) once every category has been exported
+        if self._doc is None:
+            return
+        for category in self._categories:
+            self._ensure_category(category)
+        self._doc = None
+        if self._doc_mm is not None:
+            self._doc_mm.close()
+            self._doc_mm = None
+        self._refresh_name_completer()
 
     def load_feeds(self):
-        try:
-            with open(self.feeds_file, "r") as file:
-                return json.load(file)
-        except Exception:
-            return {}
+        return load_feeds_file(self.feeds_file)
 
     def init_ui(self):
         layout = QVBoxLayout()
 
         self.category_combo = QComboBox()
-        self.category_combo.addItems(sorted(self.feeds_data.keys()))
+        self.category_combo.setPlaceholderText("Loading…")  # until the background load lands
+        self.category_combo.addItems(self._categories)
         self.category_combo.currentIndexChanged.connect(self.load_category_feeds)
 
-        self.feed_list = QListWidget()
+        self.feed_list = QListView()
+        self.feed_model = FeedListModel(self)
+        self.feed_list.setModel(self.feed_model)
 
         self.feed_name_input = QLineEdit()
         self.feed_name_input.setPlaceholderText("Feed name (e.g., UPI Odd News)")
+        # Completion runs C++-side against a shared model; we only refresh the
+        # string list when the catalog actually changes
+        self._name_model = QStringListModel(self)
+        self._name_completer = QCompleter(self._name_model, self)
+        self._name_completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.feed_name_input.setCompleter(self._name_completer)
 
         self.feed_url_input = QLineEdit()
         self.feed_url_input.setPlaceholderText("Feed URL")
@@ -42,8 +235,15 @@ class ManageFeedsTab(QWidget):
         delete_button.clicked.connect(self.delete_feed)
         save_button.clicked.connect(self.save_changes)
 
+        add_category_button = QPushButton("New Category")
+        add_category_button.clicked.connect(self._prompt_add_category)
+
+        category_row = QHBoxLayout()
+        category_row.addWidget(self.category_combo, 1)
+        category_row.addWidget(add_category_button)
+
         layout.addWidget(QLabel("Select Category:"))
-        layout.addWidget(self.category_combo)
+        layout.addLayout(category_row)
         layout.addWidget(self.feed_list)
         layout.addWidget(QLabel("Add New Feed:"))
         layout.addWidget(self.feed_name_input)
@@ -58,11 +258,42 @@ class ManageFeedsTab(QWidget):
         self.setLayout(layout)
         self.load_category_feeds()
 
+    def _prompt_add_category(self):
+        category, ok = QInputDialog.getText(self, "New Category", "Category name:")
+        category = category.strip()
+        if ok and category:
+            self.add_category(category)
+            self.category_combo.setCurrentText(category)
+
+    def add_category(self, category):
+        """Insert a new category, keeping the sorted list and combo in sync."""
+        if category in self._url_index or (self._doc is not None and category in self._categories):
+            return
+        self._materialize_all()
+        self.feeds_data[category] = []
+        self._url_index[category] = set()
+        bisect.insort(self._categories, category)  # O(log N) vs a full re-sort
+        self.category_combo.insertItem(self._categories.index(category), category)
+        self._mark_dirty()
+
     def load_category_feeds(self):
-        self.feed_list.clear()
         category = self.category_combo.currentText()
-        for feed in self.feeds_data.get(category, []):
-            self.feed_list.addItem(f"{feed['name']} — {feed['url']}")
+        items = self._formatted_cache.get(category)
+        if items is None:
+            self._ensure_category(category)
+            items = [f"{feed.name} — {feed.url}" for feed in self.feeds_data.get(category, [])]
+            self._formatted_cache[category] = items
+        # One model reset materializes every row in a single call — no per-item
+        # addItem loop (and no per-item Python→C++ crossing) remains here.
+        # Suspend painting/signals for the swap so Qt repaints exactly once.
+        self.feed_list.setUpdatesEnabled(False)
+        self.feed_list.blockSignals(True)
+        try:
+            self.feed_model.set_feeds(items)
+        finally:
+            self.feed_list.blockSignals(False)
+            self.feed_list.setUpdatesEnabled(True)
+            self.feed_list.viewport().update()
 
     def add_feed(self):
         name = self.feed_name_input.text().strip()
@@ -73,22 +304,81 @@ class ManageFeedsTab(QWidget):
             QMessageBox.warning(self, "Input Error", "Both name and URL are required.")
             return
 
-        self.feeds_data[category].append({"name": name, "url": url})
+        if not _URL_RE.match(url):
+            QMessageBox.warning(self, "Input Error", "Feed URL must be a valid http(s) URL.")
+            return
+
+        self._materialize_all()
+        if url in self._url_index.setdefault(category, set()):
+            QMessageBox.warning(self, "Duplicate Feed", "That URL is already in this category.")
+            return
+
+        self.feeds_data[category].append(Feed(name, url))
+        self._url_index[category].add(url)
+        # Insert just the new row; the model shares the cached formatted list,
+        # so no rebuild or cache invalidation is needed
+        self.feed_model.append_row(f"{name} — {url}")
         self.feed_name_input.clear()
         self.feed_url_input.clear()
-        self.load_category_feeds()
+        self._refresh_name_completer()
+        self._mark_dirty()
 
     def delete_feed(self):
-        row = self.feed_list.currentRow()
+        row = self.feed_list.currentIndex().row()
         if row >= 0:
+            self._materialize_all()
             category = self.category_combo.currentText()
-            del self.feeds_data[category][row]
-            self.load_category_feeds()
+            removed = self.feeds_data[category].pop(row)
+            self._url_index.get(category, set()).discard(removed.url)
+            self.feed_model.remove_row(row)
+            self._refresh_name_completer()
+            self._mark_dirty()
+
+    def _mark_dirty(self):
+        self._dirty = True
+        self._save_timer.start()  # restarting the timer debounces bursts of edits
+
+    def _flush_save(self):
+        if not self._dirty:
+            return
+        self._write_feeds()
+        self._dirty = False
+
+    def _write_feeds(self):
+        self._materialize_all()  # categories never touched may still be lazy
+        # Encode once, write once — avoids the many small writes json.dump
+        # issues. Both encoders walk the Feed rows directly (orjson handles
+        # dataclasses natively, stdlib via the default hook), so no
+        # intermediate whole-catalog dict copy is built.
+        if orjson is not None:
+            payload = orjson.dumps(self.feeds_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.feeds_data, indent=2, default=_feed_default).encode("utf-8")
+
+        # Skip the write (and its fsync) when nothing actually changed
+        payload_hash = hash(payload)
+        if payload_hash == self._last_saved_hash:
+            return False
+
+        # Write to a sidecar file and rename so a crash mid-write can't tear
+        # the live feeds file (os.replace is atomic on POSIX and Windows)
+        tmp = self.feeds_file + ".tmp"
+        with open(tmp, "wb", buffering=1 << 20) as file:
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, self.feeds_file)
+        self._last_saved_hash = payload_hash
+        return True
 
     def save_changes(self):
         try:
-            with open(self.feeds_file, "w") as file:
-                json.dump(self.feeds_data, file, indent=2)
-            QMessageBox.information(self, "Saved", "Feeds saved successfully.")
+            self._save_timer.stop()  # explicit save supersedes any pending flush
+            written = self._write_feeds()
+            self._dirty = False
+            if written:
+                QMessageBox.information(self, "Saved", "Feeds saved successfully.")
+            else:
+                QMessageBox.information(self, "Saved", "No changes to save.")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save feeds:\n{e}")
@@ -1,2006 +1,2819 @@
-import os
-import locale
-
-def safe_set_locale():
-    """Prevent RecursionError on Windows by safely setting a known good LC_TIME locale."""
-    for loc in [
-        'English_United States.1252',  # ✅ Windows
-        'en_US.UTF-8',                 # ✅ macOS/Linux
-        '',                            # ✅ User/system default
-        'C'                            # ✅ Last-resort fallback
-    ]:
-        try:
-            locale.setlocale(locale.LC_TIME, loc)
-            break
-        except locale.Error:
-            continue
-
-safe_set_locale()
-
-# ✅ Qt high DPI scaling fix
-os.environ["QT_SCALE_FACTOR_ROUNDING_POLICY"] = "PassThrough"
-
-# ✅ Import Qt first so High DPI policy can be set before QApplication is created
-from PySide6.QtCore import (
-    Qt, QUrl, QSize, QTimer, QRunnable, Slot, QThreadPool, QObject, Signal,
-    QTime, QEvent, QRect, QRegularExpression # Added QRegularExpression
-)
-from PySide6.QtGui import (
-    QGuiApplication, QDesktopServices, QPixmap, QIcon, QFont, QTextCharFormat,
-    QColor, QIntValidator, QRegularExpressionValidator # Added QRegularExpressionValidator
-)
-from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton,
-    QTabWidget, QListWidget, QListWidgetItem, QTextEdit, QHBoxLayout, QSlider,
-    QLineEdit, QComboBox, QMessageBox, QInputDialog, QTreeWidget, QTreeWidgetItem,
-    QHeaderView, QFileDialog, QCheckBox, QSpinBox, QSpacerItem, QSizePolicy,
-    QTimeEdit, QMenu, QStyledItemDelegate, QAbstractItemView, QDialog
-)
-
-# ✅ Set DPI rounding policy BEFORE any QWidget is created
-QGuiApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
-
-# ✅ Standard Library
-import sys
-import json
-import re
-import time
-from datetime import datetime, timedelta
-from collections import defaultdict
-import tempfile
-import shutil
-
-# ✅ 3rd Party Libraries
-import pytz
-import feedparser
-import requests
-
-# Constants
-FEEDS_FILE = "feeds.json"
-SETTINGS_FILE = "settings.json"
-REWRITE_OPTIONS_FILE = "rewrite_options.json"
-PROFILES_FILE = "character_profiles.json"
-RUNDOWN_FILE = "rundown.json"
-DEFAULT_FEEDS = [
-    {"name": "BBC News - World", "url": "http://feeds.bbci.co.uk/news/world/rss.xml"},
-    {"name": "Reuters - Top News", "url": "http://feeds.reuters.com/reuters/topNews"},
-    {"name": "The New York Times - Technology", "url": "https://rss.nytimes.com/services/xml/rss/nyt/Technology.xml"},
-    {"name": "CNN - Politics", "url": "http://rss.cnn.com/rss/cnn_politics.rss"},
-    {"name": "ESPN - Top", "url": "https://www.espn.com/espn/rss/news"},
-]
-
-# Ensure the 'images' directory exists
-IMAGES_DIR = "images"
-if not os.path.exists(IMAGES_DIR):
-    os.makedirs(IMAGES_DIR)
-
-# Worker for fetching stories in a separate thread
-class PullStoriesWorker(QRunnable):
-    def __init__(self, feeds, story_limit, parent_log_output=None):
-        super().__init__()
-        self.feeds = feeds
-        self.story_limit = story_limit
-        self.signals = PullStoriesWorkerSignals()
-        self.log_output = parent_log_output
-        self.load_settings()
-        self.change_font_scale(self.settings.get("font_scale", 0))
-        self.local_timezone = pytz.timezone(self.settings.get("timezone", "America/Chicago"))
-
-
-    @Slot()
-    def run(self):
-        all_stories = defaultdict(list)
-        for feed_info in self.feeds:
-            feed_name = feed_info["name"]
-            feed_url = feed_info["url"]
-
-            if self.log_output:
-                self.signals.log_message.emit(f"Fetching {feed_name} from {feed_url}...")
-            else:
-                print(f"Fetching {feed_name} from {feed_url}...")
-
-            try:
-                # Use requests for more robust fetching with timeout
-                response = requests.get(feed_url, timeout=10) # 10-second timeout
-                response.raise_for_status() # Raise an exception for HTTP errors (4xx or 5xx)
-                feed = feedparser.parse(response.content)
-
-                if feed.bozo:
-                    if self.log_output:
-                        self.signals.log_message.emit(f"Warning: Error parsing {feed_name}: {feed.bozo_exception}")
-                    else:
-                        print(f"Warning: Error parsing {feed_name}: {feed.bozo_exception}")
-                    continue
-
-                for i, entry in enumerate(feed.entries):
-                    if i >= self.story_limit:
-                        break
-
-                    title = entry.get('title', 'No Title').replace('\n', ' ').strip()
-                    link = entry.get('link', '#')
-                    summary = entry.get('summary', entry.get('description', 'No Summary')).replace('\n', ' ').strip()
-                    published_raw = entry.get('published') or entry.get('updated')
-                    published_parsed = None
-                    if published_raw:
-                        try:
-                            # Try parsing with feedparser's parsed_parsed
-                            if entry.get('published_parsed'):
-                                published_parsed = datetime(*entry.published_parsed[:6])
-                            elif entry.get('updated_parsed'):
-                                published_parsed = datetime(*entry.updated_parsed[:6])
-                            else:
-                                # Fallback to manual parsing if feedparser didn't parse it
-                                from dateutil import parser as dateparser
-                                published_parsed = dateparser.parse(published_raw)
-                        except Exception as e:
-                            if self.log_output:
-                                self.signals.log_message.emit(f"Warning: Could not parse date for '{title}': {e}")
-                            else:
-                                print(f"Warning: Could not parse date for '{title}': {e}")
-                            published_parsed = datetime.now() # Default to now on error
-                    else:
-                        published_parsed = datetime.now() # Default to now if no date provided
-
-                    # Convert to local timezone for display
-                    if published_parsed.tzinfo is None: # Assume UTC if no timezone info
-                        published_parsed = pytz.utc.localize(published_parsed)
-                    local_tz = pytz.timezone(self.signals.get_local_timezone.emit())
-                    published_local = published_parsed.astimezone(local_tz)
-                    date_display = published_local.strftime("%Y-%m-%d %H:%M")
-
-                    # Extract image URL
-                    image_url = None
-                    if 'media_content' in entry and entry.media_content:
-                        for media in entry.media_content:
-                            if media.get('type', '').startswith('image/'):
-                                image_url = media.get('url')
-                                break
-                    if not image_url and 'media_thumbnail' in entry and entry.media_thumbnail:
-                        if isinstance(entry.media_thumbnail, list) and entry.media_thumbnail:
-                            image_url = entry.media_thumbnail[0].get('url')
-                        elif isinstance(entry.media_thumbnail, dict):
-                            image_url = entry.media_thumbnail.get('url')
-
-                    if not image_url and 'links' in entry:
-                        for link_item in entry.links:
-                            if link_item.get('rel') == 'enclosure' and link_item.get('type', '').startswith('image/'):
-                                image_url = link_item.get('href')
-                                break
-                    
-                    # Basic categorization based on feed name
-                    category = "Other"
-                    if "technology" in feed_name.lower():
-                        category = "Technology"
-                    elif "sports" in feed_name.lower():
-                        category = "Sports"
-                    elif "politics" in feed_name.lower():
-                        category = "Politics"
-                    elif "world" in feed_name.lower() or "international" in feed_name.lower():
-                        category = "World News"
-                    elif "business" in feed_name.lower():
-                        category = "Business"
-                    elif "entertainment" in feed_name.lower():
-                        category = "Entertainment"
-                    # Add more categories as needed
-
-                    all_stories[category].append({
-                        "title": title,
-                        "link": link,
-                        "summary": summary,
-                        "source": feed_name,
-                        "pub_date": date_display,
-                        "image_url": image_url,
-                        "category": category, # Store category with story
-                        "rewritten": False, # Flag for rewrite status
-                        "original_summary": summary # Store original for reference
-                    })
-                if self.log_output:
-                    self.signals.log_message.emit(f"Finished fetching {feed_name}.")
-                else:
-                    print(f"Finished fetching {feed_name}.")
-
-            except requests.exceptions.RequestException as e:
-                if self.log_output:
-                    self.signals.log_message.emit(f"Error fetching {feed_name} from {feed_url}: {e}")
-                else:
-                    print(f"Error fetching {feed_name} from {feed_url}: {e}")
-            except Exception as e:
-                if self.log_output:
-                    self.signals.log_message.emit(f"An unexpected error occurred for {feed_name}: {e}")
-                else:
-                    print(f"An unexpected error occurred for {feed_name}: {e}")
-
-        self.signals.stories_ready.emit(all_stories)
-
-class PullStoriesWorkerSignals(QObject):
-    stories_ready = Signal(dict)
-    log_message = Signal(str)
-    get_local_timezone = Signal(str) # Signal to request local timezone from main thread
-
-class RundownItemDelegate(QStyledItemDelegate):
-    def __init__(self, parent=None, tree_widget=None):
-        super().__init__(parent)
-        self.tree_widget = tree_widget
-        self.edit_mode = False
-        self.duration_validator = QRegularExpressionValidator(QRegularExpression(r"^\d{1,2}:\d{2}$")) # HH:MM or H:MM or MM:SS or M:SS
-        self.text_height_cache = {} # Cache for text height calculations
-
-    def createEditor(self, parent, option, index):
-        if index.column() == 2:  # Duration column
-            editor = QLineEdit(parent)
-            editor.setValidator(self.duration_validator)
-            self.edit_mode = True
-            return editor
-        elif index.column() == 3: # Backtime column (QTimeEdit)
-            editor = QTimeEdit(parent)
-            editor.setDisplayFormat("h:mm AP")
-            editor.setCalendarPopup(False)
-            self.edit_mode = True
-            return editor
-        elif index.column() == 0: # Headline column
-            # Use a QTextEdit for multi-line editing
-            editor = QTextEdit(parent)
-            self.edit_mode = True
-            return editor
-        return super().createEditor(parent, option, index)
-
-    def setEditorData(self, editor, index):
-        if index.column() == 2:  # Duration column
-            value = index.model().data(index, Qt.EditRole)
-            editor.setText(value)
-        elif index.column() == 3: # Backtime column
-            value = index.model().data(index, Qt.EditRole)
-            if value:
-                time_obj = datetime.strptime(value, "%I:%M %p").time() if "AM" in value or "PM" in value else datetime.strptime(value, "%H:%M").time()
-                editor.setTime(time_obj)
-            else:
-                editor.setTime(QTime(0, 0)) # Default to 00:00
-        elif index.column() == 0: # Headline column
-            editor.setText(index.model().data(index, Qt.EditRole))
-        else:
-            super().setEditorData(editor, index)
-
-    def setModelData(self, editor, model, index):
-        if index.column() == 2:  # Duration column
-            text = editor.text()
-            if self.duration_validator.validate(text, 0)[0] == QRegularExpressionValidator.Acceptable:
-                model.setData(index, text, Qt.EditRole)
-            else:
-                # Optionally revert or show error if invalid
-                pass
-        elif index.column() == 3: # Backtime column
-            model.setData(index, editor.time().toString("h:mm AP"), Qt.EditRole)
-        elif index.column() == 0: # Headline column
-            model.setData(index, editor.toPlainText(), Qt.EditRole)
-        else:
-            super().setModelData(editor, model, index)
-        self.edit_mode = False # Exit edit mode
-
-    def updateEditorGeometry(self, editor, option, index):
-        if index.column() == 0: # Headline column
-            editor.setGeometry(option.rect)
-        else:
-            super().updateEditorGeometry(editor, option, index)
-
-    def sizeHint(self, option, index):
-        if index.column() == 0: # Headline column
-            # Calculate height based on content
-            text = index.data(Qt.DisplayRole)
-            if not text:
-                return super().sizeHint(option, index)
-
-            # Use a cache to avoid re-calculating for the same text
-            if text in self.text_height_cache:
-                return QSize(option.rect.width(), self.text_height_cache[text])
-
-            document = QTextDocument()
-            document.setDefaultFont(option.font)
-            document.setHtml(text) # Or setText if not rich text
-            document.setTextWidth(option.rect.width()) # Constrain width
-
-            height = int(document.size().height()) + 10 # Add some padding
-            self.text_height_cache[text] = height
-            return QSize(option.rect.width(), height)
-
-        return super().sizeHint(option, index)
-
-class NewsAggregatorApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-
-        # ✅ Load settings once
-        loaded = self.load_settings()
-        self.settings = loaded if loaded is not None else {
-            "dark_mode": False,
-            "font_scale": 0,
-            "timezone": "America/Chicago"
-        }
-
-        QTimer.singleShot(0, self.apply_saved_font_scale)
-
-        self.setWindowTitle("News Aggregator")
-        self.filter_category_dropdown = QComboBox()
-        self.teleprompter_text_edit = QTextEdit()
-        self.teleprompter_text_edit.setReadOnly(True)
-
-        self.tabs = QTabWidget()
-        self.setCentralWidget(self.tabs)
-        self.statusBar().showMessage("Ready")
-        self.threadpool = QThreadPool()
-
-        self.apply_dark_mode(self.settings.get("dark_mode", False))
-
-        self.character_profiles = self.load_profiles()
-        self.rewrite_options = self.load_rewrite_options()
-        self.style_definitions = self.rewrite_options.get("Style", {})
-        self.tone_definitions = self.rewrite_options.get("Tone", {})
-        self.length_definitions = self.rewrite_options.get("Length", {})
-
-        self.profile_tooltips = {
-            name: profile.get("description", "")
-            for name, profile in self.character_profiles.items()
-        }
-
-        self.current_expanded_item = None
-        self.current_rundown_filename = None
-        self._recalculating_backtimes = False
-
-        self.setup_settings_tab()
-        self.setup_feed_manager_tab()
-        self.setup_articles_tab()
-        self.setup_rundown_tab()
-
-        self.tabs.currentChanged.connect(self.on_tab_changed)
-        self.installEventFilter(self)
-        self.showMaximized()
-
-
-    def eventFilter(self, obj, event):
-        if event.type() == QEvent.KeyPress and event.key() == Qt.Key_Escape and self.tabs.currentIndex() == self.tabs.indexOf(self.rundown_tab):
-            if self.rundown_delegate.edit_mode:
-                # If in edit mode, discard changes and exit edit
-                self.rundown_tree.closePersistentEditor(self.rundown_tree.currentIndex())
-                self.rundown_delegate.edit_mode = False
-                return True # Event handled
-        return super().eventFilter(obj, event)
-
-    def load_profiles(self):
-        try:
-            with open(PROFILES_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {
-                "Default Narrator": {
-                    "description": "A standard, objective news narrator.",
-                    "prompt": "You are an objective news narrator."
-                },
-                "Sarcastic Reporter": {
-                    "description": "A reporter with a cynical and sarcastic tone.",
-                    "prompt": "You are a cynical and sarcastic news reporter."
-                }
-            }
-        except json.JSONDecodeError:
-            QMessageBox.warning(self, "Error", f"Could not parse {PROFILES_FILE}. Creating new default.")
-            return {
-                "Default Narrator": {
-                    "description": "A standard, objective news narrator.",
-                    "prompt": "You are an objective news narrator."
-                },
-                "Sarcastic Reporter": {
-                    "description": "A reporter with a cynical and sarcastic tone.",
-                    "prompt": "You are a cynical and sarcastic news reporter."
-                }
-            }
-
-    def save_profiles(self):
-        try:
-            with open(PROFILES_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.character_profiles, f, indent=4)
-        except IOError as e:
-            QMessageBox.critical(self, "Save Error", f"Could not save character profiles: {e}")
-
-    def load_rewrite_options(self):
-        try:
-            with open(REWRITE_OPTIONS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {
-                "Style": {
-                    "Standard": "Rewrite in a standard, journalistic style.",
-                    "Conversational": "Rewrite in a conversational, informal style.",
-                    "Academic": "Rewrite in a formal, academic style with precise language."
-                },
-                "Tone": {
-                    "Objective": "Maintain a neutral and objective tone.",
-                    "Humorous": "Inject humor and wit into the summary.",
-                    "Serious": "Maintain a serious and grave tone."
-                },
-                "Length": {
-                    "Concise": "Make the summary very brief (around 50 words).",
-                    "Standard": "Make the summary a standard length (around 150 words).",
-                    "Detailed": "Provide a detailed summary (around 300 words)."
-                }
-            }
-        except json.JSONDecodeError:
-            QMessageBox.warning(self, "Error", f"Could not parse {REWRITE_OPTIONS_FILE}. Creating new default.")
-            return {
-                "Style": {
-                    "Standard": "Rewrite in a standard, journalistic style.",
-                    "Conversational": "Rewrite in a conversational, informal style.",
-                    "Academic": "Rewrite in a formal, academic style with precise language."
-                },
-                "Tone": {
-                    "Objective": "Maintain a neutral and objective tone.",
-                    "Humorous": "Inject humor and wit into the summary.",
-                    "Serious": "Maintain a serious and grave tone."
-                },
-                "Length": {
-                    "Concise": "Make the summary very brief (around 50 words).",
-                    "Standard": "Make the summary a standard length (around 150 words).",
-                    "Detailed": "Provide a detailed summary (around 300 words)."
-                }
-            }
-
-    def save_rewrite_options(self):
-        try:
-            with open(REWRITE_OPTIONS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.rewrite_options, f, indent=4)
-        except IOError as e:
-            QMessageBox.critical(self, "Save Error", f"Could not save rewrite options: {e}")
-
-    def load_settings(self):
-        try:
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {"dark_mode": False, "font_scale": 0, "timezone": "America/Chicago"} # Default settings
-        except json.JSONDecodeError:
-            QMessageBox.warning(self, "Error", f"Could not parse {SETTINGS_FILE}. Resetting settings.")
-            return {"dark_mode": False, "font_scale": 0, "timezone": "America/Chicago"} # Default settings
-
-    def save_settings(self):
-        self.settings["dark_mode"] = self.dark_mode_checkbox.isChecked()
-        self.settings["font_scale"] = self.font_scale_spinbox.value()
-        self.settings["timezone"] = self.timezone_combo.currentText()
-        self.settings["profiles"] = self.character_profiles
-        self.settings["rewrite_options"] = self.rewrite_options
-
-        try:
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=4, ensure_ascii=False)
-            self.statusBar().showMessage("✅ Settings saved", 3000)
-        except IOError as e:
-            QMessageBox.critical(self, "Save Error", f"Could not save settings: {e}")
-
-    def load_settings(self):
-        try:
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                self.settings = json.load(f)
-        except (IOError, json.JSONDecodeError):
-            self.settings = {}
-
-
-    def apply_dark_mode(self, enabled):
-        self.settings["dark_mode"] = enabled
-        if enabled:
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: #2e2e2e;
-                    color: #f0f0f0;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #444;
-                }
-                QTabBar::tab {
-                    background: #3a3a3a;
-                    color: #f0f0f0;
-                    border: 1px solid #444;
-                    border-bottom-color: #3a3a3a;
-                    padding: 8px;
-                }
-                QTabBar::tab:selected {
-                    background: #2e2e2e;
-                    border-bottom-color: #2e2e2e;
-                }
-                QListWidget, QTextEdit, QLineEdit, QComboBox, QTreeWidget, QSpinBox, QTimeEdit {
-                    background-color: #3a3a3a;
-                    color: #f0f0f0;
-                    border: 1px solid #555;
-                }
-                QPushButton {
-                    background-color: #555;
-                    color: #f0f0f0;
-                    border: 1px solid #666;
-                    padding: 5px 10px;
-                }
-                QPushButton:hover {
-                    background-color: #666;
-                }
-                QLabel {
-                    color: #f0f0f0;
-                }
-                QHeaderView::section {
-                    background-color: #4a4a4a;
-                    color: #f0f0f0;
-                    padding: 4px;
-                    border: 1px solid #555;
-                }
-                QMessageBox {
-                    background-color: #2e2e2e;
-                    color: #f0f0f0;
-                }
-                QMessageBox QLabel {
-                    color: #f0f0f0;
-                }
-                QMessageBox QPushButton {
-                    background-color: #555;
-                    color: #f0f0f0;
-                }
-                QMenu {
-                    background-color: #3a3a3a;
-                    color: #f0f0f0;
-                    border: 1px solid #555;
-                }
-                QMenu::item:selected {
-                    background-color: #555;
-                }
-                QListView::item:selected {
-                    background-color: #0078d7; /* Standard selection blue */
-                    color: white;
-                }
-                QTreeWidget::item:selected {
-                    background-color: #0078d7; /* Standard selection blue */
-                    color: white;
-                }
-            """)
-        else:
-            self.setStyleSheet("") # Clear stylesheet for light mode
-
-    def apply_saved_font_scale(self):
-        font_scale = self.settings.get("font_scale", 0)
-        default_font = QApplication.font()
-        # Use the already initialized teleprompter_text_edit
-        self.teleprompter_text_edit.setFont(QFont("Arial", default_font.pointSize() + 5 + font_scale)) # Larger for teleprompter
-
-        # Apply to general application font if not 0
-        if font_scale != 0:
-            new_font = QFont(default_font.family(), default_font.pointSize() + font_scale)
-            QApplication.setFont(new_font)
-        else:
-            # Reset to system default if scale is 0
-            QApplication.setFont(QGuiApplication.font())
-
-    def closeEvent(self, event):
-        self.settings["dark_mode"] = self.dark_mode_checkbox.isChecked()
-        self.settings["font_scale"] = self.font_scale_spinbox.value()
-        self.settings["timezone"] = self.timezone_combo.currentText()
-        self.save_settings()
-        event.accept()
-
-
-    def setup_settings_tab(self):
-        self.settings_tab = QWidget()
-        layout = QVBoxLayout(self.settings_tab)
-
-        # Dark Mode Toggle
-        dark_mode_layout = QHBoxLayout()
-        dark_mode_label = QLabel("Dark Mode:")
-        self.dark_mode_checkbox = QCheckBox()
-        self.dark_mode_checkbox.setChecked(self.settings.get("dark_mode", False))
-        self.dark_mode_checkbox.stateChanged.connect(lambda state: self.apply_dark_mode(state == Qt.Checked))
-        dark_mode_layout.addWidget(dark_mode_label)
-        dark_mode_layout.addWidget(self.dark_mode_checkbox)
-        dark_mode_layout.addStretch()
-        layout.addLayout(dark_mode_layout)
-
-        # Font Scaling
-        font_scale_layout = QHBoxLayout()
-        font_scale_label = QLabel("Font Scale:")
-        self.font_scale_spinbox = QSpinBox()
-        self.font_scale_spinbox.setMinimum(-5)
-        self.font_scale_spinbox.setMaximum(5)
-        self.font_scale_spinbox.setValue(self.settings.get("font_scale", 0))
-        self.font_scale_spinbox.valueChanged.connect(self.change_font_scale)
-        font_scale_layout.addWidget(font_scale_label)
-        font_scale_layout.addWidget(self.font_scale_spinbox)
-        font_scale_layout.addStretch()
-        layout.addLayout(font_scale_layout)
-
-        # Timezone Setting
-        timezone_layout = QHBoxLayout()
-        timezone_label = QLabel("Local Timezone:")
-        self.timezone_combo = QComboBox()
-        # Populate with common timezones
-        for tz in pytz.common_timezones:
-            self.timezone_combo.addItem(tz)
-        current_tz = self.settings.get("timezone", "America/Chicago")
-        self.timezone_combo.setCurrentText(current_tz)
-        self.timezone_combo.currentTextChanged.connect(self.change_timezone)
-        timezone_layout.addWidget(timezone_label)
-        timezone_layout.addWidget(self.timezone_combo)
-        timezone_layout.addStretch()
-        layout.addLayout(timezone_layout)
-
-        # Add profile management section
-        layout.addWidget(QLabel("<h2>Character Profiles</h2>"))
-        self.profile_list = QListWidget()
-        self.profile_list.currentItemChanged.connect(self.display_profile_details)
-        layout.addWidget(self.profile_list)
-
-        profile_buttons_layout = QHBoxLayout()
-        self.add_profile_button = QPushButton("Add Profile")
-        self.add_profile_button.clicked.connect(self.add_profile)
-        self.edit_profile_button = QPushButton("Edit Profile")
-        self.edit_profile_button.clicked.connect(self.edit_profile)
-        self.delete_profile_button = QPushButton("Delete Profile")
-        self.delete_profile_button.clicked.connect(self.delete_profile)
-        profile_buttons_layout.addWidget(self.add_profile_button)
-        profile_buttons_layout.addWidget(self.edit_profile_button)
-        profile_buttons_layout.addWidget(self.delete_profile_button)
-        layout.addLayout(profile_buttons_layout)
-
-        self.profile_name_edit = QLineEdit()
-        self.profile_name_edit.setPlaceholderText("Profile Name")
-        self.profile_prompt_edit = QTextEdit()
-        self.profile_prompt_edit.setPlaceholderText("Profile Prompt for AI")
-        self.profile_description_edit = QLineEdit()
-        self.profile_description_edit.setPlaceholderText("Short Description (for tooltip)")
-
-        layout.addWidget(QLabel("Profile Name:"))
-        layout.addWidget(self.profile_name_edit)
-        layout.addWidget(QLabel("Profile Prompt:"))
-        layout.addWidget(self.profile_prompt_edit)
-        layout.addWidget(QLabel("Profile Description:"))
-        layout.addWidget(self.profile_description_edit)
-
-        # Add rewrite options management section
-        layout.addWidget(QLabel("<h2>Rewrite Options</h2>"))
-        rewrite_options_layout = QVBoxLayout()
-
-        # Style Options
-        self.style_list_widget = QListWidget()
-        self.style_list_widget.currentItemChanged.connect(lambda: self.display_rewrite_option_details("Style", self.style_list_widget))
-        rewrite_options_layout.addWidget(QLabel("<h3>Styles</h3>"))
-        rewrite_options_layout.addWidget(self.style_list_widget)
-
-        style_buttons_layout = QHBoxLayout()
-        self.add_style_button = QPushButton("Add Style")
-        self.add_style_button.clicked.connect(lambda: self.add_rewrite_option("Style"))
-        self.edit_style_button = QPushButton("Edit Style")
-        self.edit_style_button.clicked.connect(lambda: self.edit_rewrite_option("Style", self.style_list_widget))
-        self.delete_style_button = QPushButton("Delete Style")
-        self.delete_style_button.clicked.connect(lambda: self.delete_rewrite_option("Style", self.style_list_widget))
-        style_buttons_layout.addWidget(self.add_style_button)
-        style_buttons_layout.addWidget(self.edit_style_button)
-        style_buttons_layout.addWidget(self.delete_style_button)
-        rewrite_options_layout.addLayout(style_buttons_layout)
-
-        # Tone Options
-        self.tone_list_widget = QListWidget()
-        self.tone_list_widget.currentItemChanged.connect(lambda: self.display_rewrite_option_details("Tone", self.tone_list_widget))
-        rewrite_options_layout.addWidget(QLabel("<h3>Tones</h3>"))
-        rewrite_options_layout.addWidget(self.tone_list_widget)
-
-        tone_buttons_layout = QHBoxLayout()
-        self.add_tone_button = QPushButton("Add Tone")
-        self.add_tone_button.clicked.connect(lambda: self.add_rewrite_option("Tone"))
-        self.edit_tone_button = QPushButton("Edit Tone")
-        self.edit_tone_button.clicked.connect(lambda: self.edit_rewrite_option("Tone", self.tone_list_widget))
-        self.delete_tone_button = QPushButton("Delete Tone")
-        self.delete_tone_button.clicked.connect(lambda: self.delete_rewrite_option("Tone", self.tone_list_widget))
-        tone_buttons_layout.addWidget(self.add_tone_button)
-        tone_buttons_layout.addWidget(self.edit_tone_button)
-        tone_buttons_layout.addWidget(self.delete_tone_button)
-        rewrite_options_layout.addLayout(tone_buttons_layout)
-
-        # Length Options
-        self.length_list_widget = QListWidget()
-        self.length_list_widget.currentItemChanged.connect(lambda: self.display_rewrite_option_details("Length", self.length_list_widget))
-        rewrite_options_layout.addWidget(QLabel("<h3>Lengths</h3>"))
-        rewrite_options_layout.addWidget(self.length_list_widget)
-
-        length_buttons_layout = QHBoxLayout()
-        self.add_length_button = QPushButton("Add Length")
-        self.add_length_button.clicked.connect(lambda: self.add_rewrite_option("Length"))
-        self.edit_length_button = QPushButton("Edit Length")
-        self.edit_length_button.clicked.connect(lambda: self.edit_rewrite_option("Length", self.length_list_widget))
-        self.delete_length_button = QPushButton("Delete Length")
-        self.delete_length_button.clicked.connect(lambda: self.delete_rewrite_option("Length", self.length_list_widget))
-        length_buttons_layout.addWidget(self.add_length_button)
-        length_buttons_layout.addWidget(self.edit_length_button)
-        length_buttons_layout.addWidget(self.delete_length_button)
-        rewrite_options_layout.addLayout(length_buttons_layout)
-
-        self.rewrite_option_name_edit = QLineEdit()
-        self.rewrite_option_name_edit.setPlaceholderText("Option Name")
-        self.rewrite_option_description_edit = QTextEdit()
-        self.rewrite_option_description_edit.setPlaceholderText("Option Description for AI")
-
-        rewrite_options_layout.addWidget(QLabel("Option Name:"))
-        rewrite_options_layout.addWidget(self.rewrite_option_name_edit)
-        rewrite_options_layout.addWidget(QLabel("Option Description:"))
-        rewrite_options_layout.addWidget(self.rewrite_option_description_edit)
-
-        layout.addLayout(rewrite_options_layout)
-
-        # Save settings when user changes inputs
-        self.dark_mode_checkbox.stateChanged.connect(self.save_settings)
-        self.font_scale_spinbox.valueChanged.connect(self.save_settings)
-        self.timezone_combo.currentTextChanged.connect(self.save_settings)
-
-        layout.addStretch() # Pushes all content to the top
-        self.tabs.addTab(self.settings_tab, "Settings")
-        self.populate_profile_list()
-        self.populate_rewrite_option_lists()
-
-    def change_font_scale(self, value):
-        self.settings["font_scale"] = value
-        self.save_settings()
-        self.apply_saved_font_scale() # Re-apply font scale
-
-    def change_timezone(self, timezone_str):
-        self.settings["timezone"] = timezone_str
-        self.save_settings()
-
-    def populate_profile_list(self):
-        self.profile_list.clear()
-        for name in self.character_profiles.keys():
-            item = QListWidgetItem(name)
-            self.profile_list.addItem(item)
-        if self.profile_list.count() > 0:
-            self.profile_list.setCurrentRow(0)
-
-    def display_profile_details(self, current_item, previous_item):
-        if current_item:
-            profile_name = current_item.text()
-            profile = self.character_profiles.get(profile_name, {})
-            self.profile_name_edit.setText(profile_name)
-            self.profile_prompt_edit.setText(profile.get("prompt", ""))
-            self.profile_description_edit.setText(profile.get("description", ""))
-        else:
-            self.profile_name_edit.clear()
-            self.profile_prompt_edit.clear()
-            self.profile_description_edit.clear()
-
-    def add_profile(self):
-        name = self.profile_name_edit.text().strip()
-        prompt = self.profile_prompt_edit.toPlainText().strip()
-        description = self.profile_description_edit.text().strip()
-
-        if not name:
-            QMessageBox.warning(self, "Input Error", "Profile name cannot be empty.")
-            return
-
-        if name in self.character_profiles:
-            QMessageBox.warning(self, "Duplicate Profile", f"Profile '{name}' already exists. Use 'Edit Profile' to modify.")
-            return
-
-        self.character_profiles[name] = {"prompt": prompt, "description": description}
-        self.profile_tooltips[name] = description # Update tooltip cache
-        self.save_profiles()
-        self.populate_profile_list()
-        self.profile_list.setCurrentItem(self.profile_list.findItems(name, Qt.MatchExactly)[0])
-
-    def edit_profile(self):
-        current_item = self.profile_list.currentItem()
-        if not current_item:
-            QMessageBox.warning(self, "Selection Error", "Please select a profile to edit.")
-            return
-
-        original_name = current_item.text()
-        new_name = self.profile_name_edit.text().strip()
-        new_prompt = self.profile_prompt_edit.toPlainText().strip()
-        new_description = self.profile_description_edit.text().strip()
-
-        if not new_name:
-            QMessageBox.warning(self, "Input Error", "Profile name cannot be empty.")
-            return
-
-        if original_name != new_name and new_name in self.character_profiles:
-            QMessageBox.warning(self, "Duplicate Profile", f"Profile '{new_name}' already exists.")
-            return
-
-        # If name changed, delete old entry and add new one
-        if original_name != new_name:
-            del self.character_profiles[original_name]
-            if original_name in self.profile_tooltips:
-                del self.profile_tooltips[original_name]
-
-        self.character_profiles[new_name] = {"prompt": new_prompt, "description": new_description}
-        self.profile_tooltips[new_name] = new_description
-        self.save_profiles()
-        self.populate_profile_list()
-        self.profile_list.setCurrentItem(self.profile_list.findItems(new_name, Qt.MatchExactly)[0])
-
-    def delete_profile(self):
-        current_item = self.profile_list.currentItem()
-        if not current_item:
-            QMessageBox.warning(self, "Selection Error", "Please select a profile to delete.")
-            return
-
-        profile_name = current_item.text()
-        reply = QMessageBox.question(self, "Delete Profile",
-                                     f"Are you sure you want to delete profile '{profile_name}'?",
-                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-        if reply == QMessageBox.Yes:
-            del self.character_profiles[profile_name]
-            if profile_name in self.profile_tooltips:
-                del self.profile_tooltips[profile_name]
-            self.save_profiles()
-            self.populate_profile_list()
-
-    def populate_rewrite_option_lists(self):
-        self.style_list_widget.clear()
-        for name in self.style_definitions.keys():
-            self.style_list_widget.addItem(name)
-        if self.style_list_widget.count() > 0:
-            self.style_list_widget.setCurrentRow(0)
-
-        self.tone_list_widget.clear()
-        for name in self.tone_definitions.keys():
-            self.tone_list_widget.addItem(name)
-        if self.tone_list_widget.count() > 0:
-            self.tone_list_widget.setCurrentRow(0)
-
-        self.length_list_widget.clear()
-        for name in self.length_definitions.keys():
-            self.length_list_widget.addItem(name)
-        if self.length_list_widget.count() > 0:
-            self.length_list_widget.setCurrentRow(0)
-
-    def display_rewrite_option_details(self, option_type, list_widget):
-        current_item = list_widget.currentItem()
-        definitions = getattr(self, f"{option_type.lower()}_definitions")
-        if current_item:
-            option_name = current_item.text()
-            description = definitions.get(option_name, "")
-            self.rewrite_option_name_edit.setText(option_name)
-            self.rewrite_option_description_edit.setText(description)
-        else:
-            self.rewrite_option_name_edit.clear()
-            self.rewrite_option_description_edit.clear()
-
-    def add_rewrite_option(self, option_type):
-        name = self.rewrite_option_name_edit.text().strip()
-        description = self.rewrite_option_description_edit.toPlainText().strip()
-        definitions = getattr(self, f"{option_type.lower()}_definitions")
-        list_widget = getattr(self, f"{option_type.lower()}_list_widget")
-
-        if not name:
-            QMessageBox.warning(self, "Input Error", "Option name cannot be empty.")
-            return
-        if name in definitions:
-            QMessageBox.warning(self, "Duplicate Option", f"Option '{name}' already exists. Use 'Edit' to modify.")
-            return
-
-        definitions[name] = description
-        self.save_rewrite_options()
-        self.populate_rewrite_option_lists()
-        list_widget.setCurrentItem(list_widget.findItems(name, Qt.MatchExactly)[0])
-
-    def edit_rewrite_option(self, option_type, list_widget):
-        current_item = list_widget.currentItem()
-        if not current_item:
-            QMessageBox.warning(self, "Selection Error", f"Please select a {option_type} option to edit.")
-            return
-
-        original_name = current_item.text()
-        new_name = self.rewrite_option_name_edit.text().strip()
-        new_description = self.rewrite_option_description_edit.toPlainText().strip()
-        definitions = getattr(self, f"{option_type.lower()}_definitions")
-
-        if not new_name:
-            QMessageBox.warning(self, "Input Error", "Option name cannot be empty.")
-            return
-        if original_name != new_name and new_name in definitions:
-            QMessageBox.warning(self, "Duplicate Option", f"Option '{new_name}' already exists.")
-            return
-
-        if original_name != new_name:
-            del definitions[original_name]
-        definitions[new_name] = new_description
-        self.save_rewrite_options()
-        self.populate_rewrite_option_lists()
-        list_widget.setCurrentItem(list_widget.findItems(new_name, Qt.MatchExactly)[0])
-
-    def delete_rewrite_option(self, option_type, list_widget):
-        current_item = list_widget.currentItem()
-        if not current_item:
-            QMessageBox.warning(self, "Selection Error", f"Please select a {option_type} option to delete.")
-            return
-
-        option_name = current_item.text()
-        reply = QMessageBox.question(self, "Delete Option",
-                                     f"Are you sure you want to delete '{option_name}'?",
-                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-        if reply == QMessageBox.Yes:
-            definitions = getattr(self, f"{option_type.lower()}_definitions")
-            del definitions[option_name]
-            self.save_rewrite_options()
-            self.populate_rewrite_option_lists()
-
-    def setup_feed_manager_tab(self):
-        self.feed_manager_tab = QWidget()
-        layout = QVBoxLayout(self.feed_manager_tab)
-
-        self.feed_list = QListWidget()
-        self.feed_list.currentItemChanged.connect(self.display_feed_details)
-        layout.addWidget(self.feed_list)
-
-        form_layout = QVBoxLayout()
-        self.feed_name_edit = QLineEdit()
-        self.feed_name_edit.setPlaceholderText("Feed Name")
-        self.feed_url_edit = QLineEdit()
-        self.feed_url_edit.setPlaceholderText("Feed URL")
-
-        form_layout.addWidget(QLabel("Feed Name:"))
-        form_layout.addWidget(self.feed_name_edit)
-        form_layout.addWidget(QLabel("Feed URL:"))
-        form_layout.addWidget(self.feed_url_edit)
-        layout.addLayout(form_layout)
-
-        buttons_layout = QHBoxLayout()
-        self.add_feed_button = QPushButton("Add Feed")
-        self.add_feed_button.clicked.connect(self.add_feed)
-        self.edit_feed_button = QPushButton("Edit Feed")
-        self.edit_feed_button.clicked.connect(self.edit_feed)
-        self.delete_feed_button = QPushButton("Delete Feed")
-        self.delete_feed_button.clicked.connect(self.delete_feed)
-
-        buttons_layout.addWidget(self.add_feed_button)
-        buttons_layout.addWidget(self.edit_feed_button)
-        buttons_layout.addWidget(self.delete_feed_button)
-        layout.addLayout(buttons_layout)
-
-        layout.addStretch()
-
-        self.tabs.addTab(self.feed_manager_tab, "Feed Manager")
-        self.load_feeds_from_file() # Load feeds initially
-
-    def load_feeds_from_file(self):
-        try:
-            with open(FEEDS_FILE, 'r', encoding='utf-8') as f:
-                feeds = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            feeds = DEFAULT_FEEDS
-            self.save_feeds_to_file(feeds) # Save defaults if file not found or invalid JSON
-
-        self.feed_list.clear()
-        for feed in feeds:
-            item = QListWidgetItem(feed["name"])
-            item.setData(Qt.UserRole, feed["url"]) # Store URL in UserRole
-            self.feed_list.addItem(item)
-        if self.feed_list.count() > 0:
-            self.feed_list.setCurrentRow(0)
-
-        # Clear and re-populate the filter_category_dropdown
-        # This widget is now initialized in __init__
-        self.filter_category_dropdown.clear()
-        self.filter_category_dropdown.addItems(["All", "Technology", "Sports", "Politics", "World News", "Business", "Entertainment"])
-        # You might want to update categories dynamically based on loaded feeds later.
-
-    def save_feeds_to_file(self, feeds):
-        try:
-            with open(FEEDS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(feeds, f, indent=4)
-        except IOError as e:
-            QMessageBox.critical(self, "Save Error", f"Could not save feeds: {e}")
-
-    def display_feed_details(self, current_item, previous_item):
-        if current_item:
-            self.feed_name_edit.setText(current_item.text())
-            self.feed_url_edit.setText(current_item.data(Qt.UserRole))
-        else:
-            self.feed_name_edit.clear()
-            self.feed_url_edit.clear()
-
-    def add_feed(self):
-        name = self.feed_name_edit.text().strip()
-        url = self.feed_url_edit.text().strip()
-
-        if not name or not url:
-            QMessageBox.warning(self, "Input Error", "Feed name and URL cannot be empty.")
-            return
-
-        feeds = self.get_current_feeds()
-        for feed in feeds:
-            if feed["name"] == name:
-                QMessageBox.warning(self, "Duplicate Feed", f"Feed '{name}' already exists.")
-                return
-
-        feeds.append({"name": name, "url": url})
-        self.save_feeds_to_file(feeds)
-        self.load_feeds_from_file() # Reload list to show new feed
-        self.feed_list.setCurrentItem(self.feed_list.findItems(name, Qt.MatchExactly)[0]) # Select new feed
-
-    def edit_feed(self):
-        current_item = self.feed_list.currentItem()
-        if not current_item:
-            QMessageBox.warning(self, "Selection Error", "Please select a feed to edit.")
-            return
-
-        original_name = current_item.text()
-        new_name = self.feed_name_edit.text().strip()
-        new_url = self.feed_url_edit.text().strip()
-
-        if not new_name or not new_url:
-            QMessageBox.warning(self, "Input Error", "Feed name and URL cannot be empty.")
-            return
-
-        feeds = self.get_current_feeds()
-        for feed in feeds:
-            if feed["name"] == original_name:
-                feed["name"] = new_name
-                feed["url"] = new_url
-                break
-        self.save_feeds_to_file(feeds)
-        self.load_feeds_from_file() # Reload list
-        self.feed_list.setCurrentItem(self.feed_list.findItems(new_name, Qt.MatchExactly)[0]) # Select updated feed
-
-
-    def delete_feed(self):
-        current_item = self.feed_list.currentItem()
-        if not current_item:
-            QMessageBox.warning(self, "Selection Error", "Please select a feed to delete.")
-            return
-
-        feed_name = current_item.text()
-        reply = QMessageBox.question(self, "Delete Feed",
-                                     f"Are you sure you want to delete feed '{feed_name}'?",
-                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-        if reply == QMessageBox.Yes:
-            feeds = [f for f in self.get_current_feeds() if f["name"] != feed_name]
-            self.save_feeds_to_file(feeds)
-            self.load_feeds_from_file() # Reload list
-
-    def get_current_feeds(self):
-        feeds = []
-        for i in range(self.feed_list.count()):
-            item = self.feed_list.item(i)
-            feeds.append({"name": item.text(), "url": item.data(Qt.UserRole)})
-        return feeds
-
-    def setup_articles_tab(self):
-        self.articles_tab = QWidget()
-        layout = QVBoxLayout()
-
-        # Top controls
-        controls_row_top = QHBoxLayout()
-        self.slider_label = QLabel("Stories per feed: 10")
-        self.story_limit_slider = QSlider(Qt.Horizontal)
-        self.story_limit_slider.setMinimum(1)
-        self.story_limit_slider.setMaximum(50)
-        self.story_limit_slider.setValue(10)
-        self.story_limit_slider.setFixedWidth(300)
-        self.story_limit_slider.valueChanged.connect(
-            lambda val: self.slider_label.setText(f"Stories per feed: {val}")
-        )
-
-        # Add filter category dropdown here
-        filter_category_label = QLabel("Category:")
-        # self.filter_category_dropdown is already initialized in __init__
-        self.filter_category_dropdown.addItems(["All", "Technology", "Sports", "Politics", "World News", "Business", "Entertainment"]) # Adjust categories as needed
-        self.filter_category_dropdown.currentIndexChanged.connect(self.filter_articles) # Connect to your filtering logic
-
-        self.pull_button = QPushButton("Pull Stories")
-        self.pull_button.clicked.connect(self.pull_stories)
-
-        controls_row_top.addWidget(self.slider_label)
-        controls_row_top.addWidget(self.story_limit_slider)
-        controls_row_top.addSpacing(20) # Add some space
-        controls_row_top.addWidget(filter_category_label)
-        controls_row_top.addWidget(self.filter_category_dropdown)
-        controls_row_top.addStretch()
-        controls_row_top.addWidget(self.pull_button)
-
-        # Tree setup
-        self.articles_tree = QTreeWidget()
-        self.articles_tree.setColumnCount(3)
-        self.articles_tree.setHeaderLabels(["Headline", "Source", "Date"])
-
-        self.articles_tree.setIconSize(QSize(80, 80)) # Reduces size to prevent encroaching on checkbox
-
-        self.articles_tree.setStyleSheet("""
-            QTreeView::indicator {
-                width: 20px;
-                height: 20px;
-                margin-left: 6px;
-                margin-right: 10px;
-            }
-
-            QTreeWidget::item {
-                min-height: 60px;
-                padding: 0px;
-            }
-
-            QTreeWidget::icon {
-                margin-left: 4px;
-                margin-right: 4px;
-            }
-        """)
-
-        self.articles_tree.header().setSectionResizeMode(QHeaderView.Interactive)
-        self.articles_tree.setSortingEnabled(True)
-        self.articles_tree.itemDoubleClicked.connect(self.open_article)
-        self.articles_tree.itemClicked.connect(self.toggle_category_expand)
-
-        layout.addLayout(controls_row_top)
-        layout.addWidget(self.articles_tree)
-
-        # Set default column widths after widget is added
-        self.articles_tree.setColumnWidth(0, 1000) # Title w/ checkbox + icon
-        self.articles_tree.setColumnWidth(1, 300) # Source
-        self.articles_tree.setColumnWidth(2, 200) # Date
-
-        # Bottom controls
-        controls_row_bottom = QHBoxLayout()
-        self.log_output = QTextEdit()
-        self.log_output.setReadOnly(True)
-        self.log_output.setFixedHeight(100)
-        layout.addWidget(QLabel("Log Output"))
-        layout.addWidget(self.log_output)
-
-        self.send_to_rundown_button = QPushButton("Send to Rundown")
-        self.send_to_rundown_button.clicked.connect(self.send_to_rundown)
-        controls_row_bottom.addStretch()
-        controls_row_bottom.addWidget(self.send_to_rundown_button)
-
-        layout.addLayout(controls_row_bottom)
-
-        self.articles_tab.setLayout(layout)
-        self.tabs.addTab(self.articles_tab, "Articles")
-        QTimer.singleShot(0, self.set_article_column_widths)
-
-    def set_article_column_widths(self):
-        # This is a safe way to set column widths after the widget is visible
-        # It needs to be called after the widget has been laid out by Qt
-        self.articles_tree.setColumnWidth(0, self.articles_tree.width() * 0.5) # Example: 50% for Headline
-        self.articles_tree.setColumnWidth(1, self.articles_tree.width() * 0.25) # Example: 25% for Source
-        self.articles_tree.setColumnWidth(2, self.articles_tree.width() * 0.15) # Example: 15% for Date
-
-    def filter_articles(self, index):
-        """
-        Filters the articles displayed in articles_tree based on the selected category.
-        """
-        selected_category = self.filter_category_dropdown.currentText()
-        self.articles_tree.clear() # Clear existing items
-
-        # For demonstration, let's assume you have a way to access
-        # your full list of stories, perhaps stored in self.all_pulled_stories
-        # after the PullStoriesWorker finishes.
-        # You would iterate through your stories and add only those matching
-        # the selected_category to the articles_tree.
-
-        # Example placeholder logic:
-        # if hasattr(self, 'all_pulled_stories'):
-        #     for category, stories in self.all_pulled_stories.items():
-        #         if selected_category == "All" or category == selected_category:
-        #             for story_data in stories:
-        #                 # Add story_data to articles_tree
-        #                 # You'll need to adapt your existing logic for adding items
-        #                 # For example:
-        #                 item = QTreeWidgetItem([story_data["title"], story_data["source"], story_data["pub_date"]])
-        #                 item.setData(0, Qt.UserRole, story_data) # Store full data
-        #                 self.articles_tree.addTopLevelItem(item)
-
-        # For now, let's just log a message to show it's working
-        self.log_output.append(f"Filtering articles by: {selected_category}")
-
-        # After filtering, you might want to re-expand/collapse categories as needed
-        # self.articles_tree.expandAll() or self.articles_tree.collapseAll()
-        # and re-apply column widths if they are dynamic.
-        self.set_article_column_widths() # Ensure columns are correct after refresh
-
-    def pull_stories(self):
-        self.log_output.clear()
-        self.log_output.append("Starting to pull stories...")
-        current_feeds = self.get_current_feeds()
-        story_limit = self.story_limit_slider.value()
-
-        if not current_feeds:
-            self.log_output.append("No feeds configured. Please add feeds in the Feed Manager tab.")
-            return
-
-        # Disable the pull button while fetching
-        self.pull_button.setEnabled(False)
-        self.pull_button.setText("Pulling...")
-
-        worker = PullStoriesWorker(current_feeds, story_limit, self.log_output)
-        worker.signals.stories_ready.connect(self.display_stories)
-        worker.signals.log_message.emit = lambda msg: self.log_output.append(msg) # Redirect worker logs
-        worker.signals.get_local_timezone.connect(lambda: self.settings.get("timezone", "America/Chicago"))
-        self.threadpool.start(worker)
-
-    def display_stories(self, all_stories):
-        self.articles_tree.clear()
-        self.all_pulled_stories = all_stories # Store all stories for filtering later
-
-        # Create a mapping for category sorting order
-        category_order = {
-            "All": 0, "Technology": 1, "Sports": 2, "Politics": 3, "World News": 4,
-            "Business": 5, "Entertainment": 6, "Other": 7
-        }
-
-        # Sort categories by custom order and then alphabetically for others
-        sorted_categories = sorted(all_stories.keys(), key=lambda x: (category_order.get(x, len(category_order)), x))
-
-        for category in sorted_categories:
-            stories = all_stories[category]
-            if not stories:
-                continue
-
-            category_item = QTreeWidgetItem(self.articles_tree, [category, "", ""])
-            category_item.setFlags(category_item.flags() & ~Qt.ItemIsSelectable) # Make category not selectable
-            category_item.setExpanded(True) # Start expanded
-
-            for story_data in stories:
-                item = QTreeWidgetItem(category_item)
-                item.setText(0, story_data["title"])
-                item.setText(1, story_data["source"])
-                item.setText(2, story_data["pub_date"])
-                item.setData(0, Qt.UserRole, story_data) # Store full data
-
-                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                item.setCheckState(0, Qt.Unchecked) # Start unchecked
-
-                # Load and set image
-                if story_data.get("image_url"):
-                    image_path = self.download_image(story_data["image_url"])
-                    if image_path:
-                        pixmap = QPixmap(image_path)
-                        if not pixmap.isNull():
-                            item.setIcon(0, QIcon(pixmap))
-                else:
-                    # Set a default icon if no image URL is present
-                    item.setIcon(0, QIcon(QPixmap("images/default_news_icon.png"))) # Ensure you have a default icon
-
-        self.articles_tree.expandAll()
-        self.log_output.append("Stories pulled successfully.")
-        self.pull_button.setEnabled(True)
-        self.pull_button.setText("Pull Stories")
-        self.set_article_column_widths()
-
-
-    def download_image(self, url):
-        try:
-            # Create a unique filename based on the URL's hash
-            filename = os.path.join(IMAGES_DIR, f"{hash(url)}.png") # Using PNG as a common format
-            if os.path.exists(filename):
-                return filename # Return cached image if exists
-
-            response = requests.get(url, stream=True, timeout=5)
-            response.raise_for_status()
-
-            with open(filename, 'wb') as out_file:
-                shutil.copyfileobj(response.raw, out_file)
-            del response
-            return filename
-        except Exception as e:
-            # self.log_output.append(f"Error downloading image from {url}: {e}")
-            return None # Indicate failure
-
-    def open_article(self, item, column):
-        if item.parent(): # Only open if it's a child (actual article)
-            story_data = item.data(0, Qt.UserRole)
-            if story_data and story_data["link"] and story_data["link"] != '#':
-                QDesktopServices.openUrl(QUrl(story_data["link"]))
-
-    def toggle_category_expand(self, item, column):
-        # This handles clicks on both category headers and article items
-        if not item.parent(): # It's a category header
-            item.setExpanded(not item.isExpanded())
-            # Collapse other categories if desired (optional)
-            # if item.isExpanded():
-            #     for i in range(self.articles_tree.topLevelItemCount()):
-            #         top_item = self.articles_tree.topLevelItem(i)
-            #         if top_item != item and top_item.isExpanded():
-            #             top_item.setExpanded(False)
-
-    def send_to_rundown(self):
-        selected_stories = []
-        for i in range(self.articles_tree.topLevelItemCount()):
-            category_item = self.articles_tree.topLevelItem(i)
-            for j in range(category_item.childCount()):
-                article_item = category_item.child(j)
-                if article_item.checkState(0) == Qt.Checked:
-                    story_data = article_item.data(0, Qt.UserRole)
-                    # Add unique ID if not present
-                    if "id" not in story_data:
-                        story_data["id"] = str(hash(story_data["link"] + story_data["title"]))
-                    selected_stories.append(story_data)
-
-        if not selected_stories:
-            QMessageBox.warning(self, "No Selection", "Please select at least one article to send to rundown.")
-            return
-
-        current_rundown_items = self.get_rundown_items()
-        new_items_added = 0
-        for story in selected_stories:
-            # Check if item already exists in rundown by link or a unique ID
-            exists = False
-            for rundown_item in current_rundown_items:
-                if rundown_item.get("link") == story.get("link") or rundown_item.get("id") == story.get("id"):
-                    exists = True
-                    break
-            if not exists:
-                # Add default values for rundown properties
-                story_for_rundown = story.copy() # Don't modify original story_data
-                story_for_rundown["duration"] = "00:30" # Default 30 seconds
-                story_for_rundown["order"] = len(current_rundown_items) + new_items_added # Sequential order
-                story_for_rundown["backtime"] = "" # Will be calculated
-                story_for_rundown["active"] = True # Default active
-                story_for_rundown["teleprompter_text"] = story_for_rundown["summary"] # Initial teleprompter text
-                story_for_rundown["profile"] = "Default Narrator" # Default profile
-                story_for_rundown["style"] = "Standard"
-                story_for_rundown["tone"] = "Objective"
-                story_for_rundown["length"] = "Standard"
-                current_rundown_items.append(story_for_rundown)
-                new_items_added += 1
-
-        if new_items_added > 0:
-            self.update_rundown_tree(current_rundown_items)
-            self.calculate_backtimes() # Recalculate after adding
-            QMessageBox.information(self, "Sent to Rundown", f"{new_items_added} new articles sent to Rundown tab.")
-            self.tabs.setCurrentWidget(self.rundown_tab) # Switch to rundown tab
-        else:
-            QMessageBox.information(self, "No New Articles", "All selected articles are already in the rundown.")
-
-    def setup_rundown_tab(self):
-        self.rundown_tab = QWidget()
-        layout = QVBoxLayout(self.rundown_tab)
-
-        # Controls row
-        controls_row = QHBoxLayout()
-        self.new_rundown_button = QPushButton("New Rundown")
-        self.new_rundown_button.clicked.connect(self.new_rundown)
-        self.load_rundown_button = QPushButton("Load Rundown")
-        self.load_rundown_button.clicked.connect(self.load_rundown)
-        self.save_rundown_button = QPushButton("Save Rundown")
-        self.save_rundown_button.clicked.connect(self.save_rundown)
-        self.save_rundown_as_button = QPushButton("Save Rundown As...")
-        self.save_rundown_as_button.clicked.connect(self.save_rundown_as)
-
-        controls_row.addWidget(self.new_rundown_button)
-        controls_row.addWidget(self.load_rundown_button)
-        controls_row.addWidget(self.save_rundown_button)
-        controls_row.addWidget(self.save_rundown_as_button)
-        controls_row.addStretch() # Pushes buttons to the left
-
-        # Add rundown clock display
-        self.rundown_clock_label = QLabel("Backtime: --:--:--")
-        font = self.rundown_clock_label.font()
-        font.setPointSize(font.pointSize() + 10) # Make it bigger
-        font.setBold(True)
-        self.rundown_clock_label.setFont(font)
-        self.rundown_clock_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        controls_row.addWidget(self.rundown_clock_label)
-
-        layout.addLayout(controls_row)
-
-        # Rundown Tree setup
-        self.rundown_tree = QTreeWidget()
-        self.rundown_tree.setColumnCount(6)
-        self.rundown_tree.setHeaderLabels(["Title", "Source", "Duration", "Backtime", "Character", "Active"])
-        self.rundown_tree.header().setSectionResizeMode(QHeaderView.Interactive)
-        self.rundown_tree.setColumnWidth(0, 400) # Title
-        self.rundown_tree.setColumnWidth(1, 150) # Source
-        self.rundown_tree.setColumnWidth(2, 80)  # Duration
-        self.rundown_tree.setColumnWidth(3, 100) # Backtime
-        self.rundown_tree.setColumnWidth(4, 150) # Character
-        self.rundown_tree.setColumnWidth(5, 60) # Active
-        self.rundown_tree.setDragDropMode(QAbstractItemView.InternalMove) # Enable drag-and-drop reordering
-        self.rundown_tree.setDropIndicatorShown(True)
-        self.rundown_tree.itemChanged.connect(self.handle_rundown_item_changed)
-        self.rundown_tree.customContextMenuRequested.connect(self.show_rundown_context_menu)
-        self.rundown_tree.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.rundown_tree.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked)
-
-        self.rundown_delegate = RundownItemDelegate(self, self.rundown_tree)
-        self.rundown_tree.setItemDelegateForColumn(0, self.rundown_delegate) # For multiline title
-        self.rundown_tree.setItemDelegateForColumn(2, self.rundown_delegate) # For duration validation
-        self.rundown_tree.setItemDelegateForColumn(3, self.rundown_delegate) # For time editing
-
-        layout.addWidget(self.rundown_tree)
-
-        # Teleprompter and Rewrite section
-        teleprompter_rewrite_layout = QHBoxLayout()
-
-        # Teleprompter controls
-        teleprompter_layout = QVBoxLayout()
-        teleprompter_layout.addWidget(QLabel("<h2>Teleprompter</h2>"))
-        # self.teleprompter_text_edit is already initialized in __init__
-        teleprompter_layout.addWidget(self.teleprompter_text_edit)
-
-        teleprompter_controls_layout = QHBoxLayout()
-        self.select_character_combo = QComboBox()
-        self.select_character_combo.setToolTip("Select a character profile for rewriting.")
-        self.select_character_combo.currentTextChanged.connect(self.on_character_changed)
-        teleprompter_controls_layout.addWidget(QLabel("Character:"))
-        teleprompter_controls_layout.addWidget(self.select_character_combo)
-
-        self.apply_to_teleprompter_button = QPushButton("Apply to Teleprompter")
-        self.apply_to_teleprompter_button.clicked.connect(self.apply_teleprompter_text)
-        teleprompter_controls_layout.addWidget(self.apply_to_teleprompter_button)
-        teleprompter_controls_layout.addStretch()
-        teleprompter_layout.addLayout(teleprompter_controls_layout)
-
-        teleprompter_rewrite_layout.addLayout(teleprompter_layout)
-
-
-        # Rewrite controls
-        rewrite_options_widget = QWidget()
-        rewrite_options_layout = QVBoxLayout(rewrite_options_widget)
-        rewrite_options_layout.addWidget(QLabel("<h2>Rewrite Options</h2>"))
-
-        # Style
-        style_layout = QHBoxLayout()
-        self.style_combo = QComboBox()
-        self.style_combo.setToolTip("Select a rewriting style.")
-        style_layout.addWidget(QLabel("Style:"))
-        style_layout.addWidget(self.style_combo)
-        style_layout.addStretch()
-        rewrite_options_layout.addLayout(style_layout)
-
-        # Tone
-        tone_layout = QHBoxLayout()
-        self.tone_combo = QComboBox()
-        self.tone_combo.setToolTip("Select a rewriting tone.")
-        tone_layout.addWidget(QLabel("Tone:"))
-        tone_layout.addWidget(self.tone_combo)
-        tone_layout.addStretch()
-        rewrite_options_layout.addLayout(tone_layout)
-
-        # Length
-        length_layout = QHBoxLayout()
-        self.length_combo = QComboBox()
-        self.length_combo.setToolTip("Select desired length.")
-        length_layout.addWidget(QLabel("Length:"))
-        length_layout.addWidget(self.length_combo)
-        length_layout.addStretch()
-        rewrite_options_layout.addLayout(length_layout)
-
-        self.rewrite_button = QPushButton("Rewrite Selected")
-        self.rewrite_button.clicked.connect(self.rewrite_selected_article)
-        rewrite_options_layout.addWidget(self.rewrite_button)
-        rewrite_options_layout.addStretch() # Pushes content to the top
-
-        teleprompter_rewrite_layout.addWidget(rewrite_options_widget)
-
-        layout.addLayout(teleprompter_rewrite_layout)
-
-        self.tabs.addTab(self.rundown_tab, "Rundown")
-        self.load_rundown() # Load default or last rundown
-        self.populate_character_dropdown()
-        self.populate_rewrite_dropdowns()
-
-        # Timer for backtime calculation
-        self.backtime_timer = QTimer(self)
-        self.backtime_timer.setInterval(1000) # Update every second
-        self.backtime_timer.timeout.connect(self.update_backtime_clock)
-        self.backtime_timer.start()
-
-    def new_rundown(self):
-        reply = QMessageBox.question(self, "New Rundown",
-                                     "Create a new, empty rundown? Any unsaved changes will be lost.",
-                                     QMessageBox.Yes | QMessageBox.No)
-        if reply == QMessageBox.Yes:
-            self.update_rundown_tree([])
-            self.current_rundown_filename = None
-            self.statusBar().showMessage("New rundown created.")
-            self.calculate_backtimes() # Recalculate for empty rundown
-            self.teleprompter_text_edit.clear()
-
-    def load_rundown(self):
-        filename, _ = QFileDialog.getOpenFileName(self, "Load Rundown", "", "Rundown Files (*.json);;All Files (*)")
-        if filename:
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    rundown_data = json.load(f)
-                self.update_rundown_tree(rundown_data)
-                self.current_rundown_filename = filename
-                self.statusBar().showMessage(f"Rundown loaded from {os.path.basename(filename)}")
-                self.calculate_backtimes()
-                self.teleprompter_text_edit.clear()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Could not load rundown: {e}")
-
-    def save_rundown(self):
-        if self.current_rundown_filename:
-            self._save_rundown_to_file(self.current_rundown_filename)
-        else:
-            self.save_rundown_as()
-
-    def save_rundown_as(self):
-        filename, _ = QFileDialog.getSaveFileName(self, "Save Rundown As", "", "Rundown Files (*.json);;All Files (*)")
-        if filename:
-            if not filename.lower().endswith(".json"):
-                filename += ".json"
-            self._save_rundown_to_file(filename)
-            self.current_rundown_filename = filename
-
-    def _save_rundown_to_file(self, filename):
-        try:
-            rundown_data = self.get_rundown_items()
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(rundown_data, f, indent=4)
-            self.statusBar().showMessage(f"Rundown saved to {os.path.basename(filename)}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not save rundown: {e}")
-
-    def get_rundown_items(self):
-        rundown_items = []
-        for i in range(self.rundown_tree.topLevelItemCount()):
-            item = self.rundown_tree.topLevelItem(i)
-            story_data = item.data(0, Qt.UserRole)
-            if story_data: # Ensure it's valid story data
-                # Update with current values from the tree
-                story_data["duration"] = item.text(2)
-                story_data["backtime"] = item.text(3)
-                story_data["profile"] = item.text(4)
-                story_data["active"] = item.checkState(5) == Qt.Checked
-                # Note: "teleprompter_text" needs to be handled via item selection/saving separately
-                rundown_items.append(story_data)
-        return rundown_items
-
-    def update_rundown_tree(self, rundown_data):
-        self.rundown_tree.clear()
-        for i, story_data in enumerate(rundown_data):
-            item = QTreeWidgetItem(self.rundown_tree)
-            item.setText(0, story_data["title"])
-            item.setText(1, story_data["source"])
-            item.setText(2, story_data.get("duration", "00:00"))
-            item.setText(3, story_data.get("backtime", "00:00 AM")) # Placeholder
-            item.setText(4, story_data.get("profile", "Default Narrator"))
-            item.setCheckState(5, Qt.Checked if story_data.get("active", True) else Qt.Unchecked)
-            item.setData(0, Qt.UserRole, story_data) # Store full data
-
-            item.setFlags(item.flags() | Qt.ItemIsEditable | Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled)
-
-            # Set a tooltip for the character column
-            profile_name = story_data.get("profile", "Default Narrator")
-            tooltip = self.profile_tooltips.get(profile_name, "No description available.")
-            item.setToolTip(4, tooltip)
-
-        self.rundown_tree.expandAll()
-        self.rundown_tree.setColumnWidth(0, self.rundown_tree.width() * 0.4) # Adjust column width dynamically
-        self.rundown_tree.setColumnWidth(1, self.rundown_tree.width() * 0.15)
-        self.rundown_tree.setColumnWidth(2, self.rundown_tree.width() * 0.1)
-        self.rundown_tree.setColumnWidth(3, self.rundown_tree.width() * 0.1)
-        self.rundown_tree.setColumnWidth(4, self.rundown_tree.width() * 0.15)
-        self.rundown_tree.setColumnWidth(5, self.rundown_tree.width() * 0.05)
-
-
-    def handle_rundown_item_changed(self, item, column):
-        story_data = item.data(0, Qt.UserRole)
-        if story_data:
-            if column == 2: # Duration changed
-                new_duration_str = item.text(2)
-                story_data["duration"] = new_duration_str
-                self.calculate_backtimes()
-            elif column == 4: # Character changed
-                new_profile = item.text(4)
-                story_data["profile"] = new_profile
-                tooltip = self.profile_tooltips.get(new_profile, "No description available.")
-                item.setToolTip(4, tooltip) # Update tooltip
-            elif column == 5: # Active checkbox changed
-                story_data["active"] = item.checkState(5) == Qt.Checked
-                self.calculate_backtimes()
-            elif column == 0: # Title changed (if edited directly)
-                story_data["title"] = item.text(0)
-
-            # Recalculate item height for multiline if column 0 changed
-            if column == 0:
-                self.rundown_delegate.text_height_cache.clear() # Clear cache for recalculation
-                self.rundown_tree.setRowHeight(self.rundown_tree.indexOfTopLevelItem(item), self.rundown_delegate.sizeHint(self.rundown_tree.viewOptions(), item.index()).height())
-
-
-    def calculate_backtimes(self):
-        if self._recalculating_backtimes:
-            return # Prevent re-entry
-
-        self._recalculating_backtimes = True
-        try:
-            total_duration_seconds = 0
-            # First pass: calculate total duration of active items
-            for i in range(self.rundown_tree.topLevelItemCount()):
-                item = self.rundown_tree.topLevelItem(i)
-                story_data = item.data(0, Qt.UserRole)
-                if story_data and story_data.get("active", True):
-                    duration_str = item.text(2)
-                    seconds = NewsAggregatorApp.parse_duration_string(duration_str)
-                    if seconds is not None:
-                        total_duration_seconds += seconds
-                    else:
-                        self.log_output.append(f"Invalid duration format for '{item.text(0)}': {duration_str}")
-
-            # Get current time for backtime calculation reference
-            now = datetime.now()
-            # If a backtime has been set for the last item, use that as the show's end time
-            last_item_backtime_str = ""
-            if self.rundown_tree.topLevelItemCount() > 0:
-                last_item = self.rundown_tree.topLevelItem(self.rundown_tree.topLevelItemCount() - 1)
-                last_item_backtime_str = last_item.text(3) # Get last item's backtime
-
-            show_end_time = None
-            if last_item_backtime_str:
-                parsed_time = NewsAggregatorApp.parse_backtime_string(last_item_backtime_str)
-                if parsed_time:
-                    # Construct datetime for today with the parsed time
-                    show_end_time = datetime(now.year, now.month, now.day,
-                                             parsed_time.hour, parsed_time.minute, parsed_time.second)
-                    # If the parsed time is in the past compared to now, assume it's for tomorrow
-                    if show_end_time < now and (now - show_end_time).total_seconds() > 3600: # More than 1 hour difference
-                        show_end_time += timedelta(days=1)
-                else:
-                    self.log_output.append(f"Invalid backtime format for last item: {last_item_backtime_str}")
-
-            if show_end_time is None:
-                # Default: Show ends in the near future (e.g., 30 minutes from now, rounded to nearest minute)
-                show_end_time = now + timedelta(minutes=30)
-                show_end_time = show_end_time.replace(second=0, microsecond=0) # Round to nearest minute
-
-            current_time = show_end_time
-            # Second pass: calculate individual backtimes
-            for i in range(self.rundown_tree.topLevelItemCount() - 1, -1, -1):
-                item = self.rundown_tree.topLevelItem(i)
-                story_data = item.data(0, Qt.UserRole)
-
-                duration_seconds = 0
-                if story_data and story_data.get("active", True):
-                    duration_str = item.text(2)
-                    seconds = NewsAggregatorApp.parse_duration_string(duration_str)
-                    if seconds is not None:
-                        duration_seconds = seconds
-
-                current_time -= timedelta(seconds=duration_seconds)
-                item.setText(3, current_time.strftime("%I:%M %p")) # Format as HH:MM AM/PM
-
-            # Update the main rundown clock display
-            self.rundown_clock_label.setText(f"Backtime: {current_time.strftime('%I:%M:%S %p')}")
-
-        finally:
-            self._recalculating_backtimes = False # Allow re-entry
-
-    def update_backtime_clock(self):
-        if self.rundown_tree.topLevelItemCount() > 0:
-            first_item = self.rundown_tree.topLevelItem(0)
-            first_item_backtime_str = first_item.text(3)
-            parsed_time = NewsAggregatorApp.parse_backtime_string(first_item_backtime_str)
-
-            if parsed_time:
-                now = datetime.now()
-                # Construct datetime for today with the parsed time
-                target_datetime = datetime(now.year, now.month, now.day,
-                                           parsed_time.hour, parsed_time.minute, parsed_time.second)
-
-                # If the target time is in the past, assume it's for tomorrow
-                if target_datetime < now and (now - target_datetime).total_seconds() > 3600: # More than 1 hour difference
-                    target_datetime += timedelta(days=1)
-
-                time_remaining = target_datetime - now
-                total_seconds = int(time_remaining.total_seconds())
-
-                if total_seconds < 0:
-                    display_text = "Show Over"
-                else:
-                    hours, remainder = divmod(total_seconds, 3600)
-                    minutes, seconds = divmod(remainder, 60)
-                    display_text = f"Show Starts In: {hours:02}:{minutes:02}:{seconds:02}"
-                self.rundown_clock_label.setText(display_text)
-            else:
-                self.rundown_clock_label.setText("Backtime: --:--:--")
-        else:
-            self.rundown_clock_label.setText("Backtime: --:--:--") # No items, no backtime
-
-    def show_rundown_context_menu(self, position):
-        item = self.rundown_tree.itemAt(position)
-        menu = QMenu()
-
-        if item:
-            move_up_action = QAction("Move Up", self)
-            move_up_action.triggered.connect(lambda: self.move_rundown_item(item, -1))
-            menu.addAction(move_up_action)
-
-            move_down_action = QAction("Move Down", self)
-            move_down_action.triggered.connect(lambda: self.move_rundown_item(item, 1))
-            menu.addAction(move_down_action)
-
-            delete_action = QAction("Delete Item", self)
-            delete_action.triggered.connect(lambda: self.delete_rundown_item(item))
-            menu.addAction(delete_action)
-
-            # --- Rewrite Options Submenu ---
-            rewrite_menu = menu.addMenu("Rewrite Teleprompter Text")
-
-            # Character Profile submenu
-            character_menu = rewrite_menu.addMenu("Character Profile")
-            for profile_name in self.character_profiles.keys():
-                action = QAction(profile_name, self)
-                action.setToolTip(self.profile_tooltips.get(profile_name, ""))
-                action.triggered.connect(lambda checked, p=profile_name: self.set_item_profile(item, p))
-                character_menu.addAction(action)
-
-            # Style submenu
-            style_menu = rewrite_menu.addMenu("Style")
-            for style_name in self.style_definitions.keys():
-                action = QAction(style_name, self)
-                action.setToolTip(self.style_definitions.get(style_name, ""))
-                action.triggered.connect(lambda checked, s=style_name: self.set_item_rewrite_option(item, "style", s))
-                style_menu.addAction(action)
-
-            # Tone submenu
-            tone_menu = rewrite_menu.addMenu("Tone")
-            for tone_name in self.tone_definitions.keys():
-                action = QAction(tone_name, self)
-                action.setToolTip(self.tone_definitions.get(tone_name, ""))
-                action.triggered.connect(lambda checked, t=tone_name: self.set_item_rewrite_option(item, "tone", t))
-                tone_menu.addAction(action)
-
-            # Length submenu
-            length_menu = rewrite_menu.addMenu("Length")
-            for length_name in self.length_definitions.keys():
-                action = QAction(length_name, self)
-                action.setToolTip(self.length_definitions.get(length_name, ""))
-                action.triggered.connect(lambda checked, l=length_name: self.set_item_rewrite_option(item, "length", l))
-                length_menu.addAction(action)
-
-            # Separator for rewrite action
-            rewrite_menu.addSeparator()
-            rewrite_selected_action = QAction("Generate Rewritten Text", self)
-            rewrite_selected_action.triggered.connect(lambda: self.rewrite_selected_article(item))
-            rewrite_menu.addAction(rewrite_selected_action)
-
-            # --- Open Original Article ---
-            open_original_action = QAction("Open Original Article", self)
-            open_original_action.triggered.connect(lambda: self.open_article(item, 0)) # Re-use open_article
-            menu.addAction(open_original_action)
-
-        menu.exec(self.rundown_tree.mapToGlobal(position))
-
-    def set_item_profile(self, item, profile_name):
-        story_data = item.data(0, Qt.UserRole)
-        if story_data:
-            story_data["profile"] = profile_name
-            item.setText(4, profile_name) # Update displayed character
-            tooltip = self.profile_tooltips.get(profile_name, "No description available.")
-            item.setToolTip(4, tooltip) # Update tooltip
-
-    def set_item_rewrite_option(self, item, option_type, option_name):
-        story_data = item.data(0, Qt.UserRole)
-        if story_data:
-            story_data[option_type] = option_name
-            # Optionally update UI if you decide to display these settings directly in the tree
-
-    def move_rundown_item(self, item, direction):
-        current_row = self.rundown_tree.indexOfTopLevelItem(item)
-        new_row = current_row + direction
-
-        if 0 <= new_row < self.rundown_tree.topLevelItemCount():
-            # Get data for selected item
-            item_data = item.data(0, Qt.UserRole)
-            # Remove item from current position
-            self.rundown_tree.takeTopLevelItem(current_row)
-
-            # Insert item at new position
-            new_item = QTreeWidgetItem()
-            new_item.setText(0, item_data["title"])
-            new_item.setText(1, item_data["source"])
-            new_item.setText(2, item_data["duration"])
-            new_item.setText(3, item_data["backtime"])
-            new_item.setText(4, item_data["profile"])
-            new_item.setCheckState(5, Qt.Checked if item_data["active"] else Qt.Unchecked)
-            new_item.setData(0, Qt.UserRole, item_data)
-            new_item.setFlags(item.flags() | Qt.ItemIsEditable | Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled) # Retain flags
-            new_item.setToolTip(4, self.profile_tooltips.get(item_data["profile"], "No description available.")) # Re-add tooltip
-
-            self.rundown_tree.insertTopLevelItem(new_row, new_item)
-            self.rundown_tree.setCurrentItem(new_item) # Select the moved item
-            self.calculate_backtimes() # Recalculate backtimes after reordering
-
-    def delete_rundown_item(self, item):
-        reply = QMessageBox.question(self, "Delete Rundown Item",
-                                     f"Are you sure you want to delete '{item.text(0)}' from the rundown?",
-                                     QMessageBox.Yes | QMessageBox.No)
-        if reply == QMessageBox.Yes:
-            root = self.rundown_tree.invisibleRootItem()
-            root.removeChild(item)
-            self.calculate_backtimes() # Recalculate backtimes after deletion
-            self.teleprompter_text_edit.clear() # Clear teleprompter if deleted item was selected
-
-    def on_tab_changed(self, index):
-        if self.tabs.widget(index) == self.rundown_tab:
-            self.calculate_backtimes() # Recalculate when rundown tab is shown
-
-    def populate_character_dropdown(self):
-        self.select_character_combo.clear()
-        for name in self.character_profiles.keys():
-            self.select_character_combo.addItem(name)
-            # Add tooltip for each item in the combo box
-            self.select_character_combo.setItemData(
-                self.select_character_combo.findText(name),
-                self.profile_tooltips.get(name, ""),
-                Qt.ToolTipRole
-            )
-        # Select the profile of the currently selected rundown item if available
-        current_item = self.rundown_tree.currentItem()
-        if current_item:
-            story_data = current_item.data(0, Qt.UserRole)
-            if story_data and "profile" in story_data:
-                self.select_character_combo.setCurrentText(story_data["profile"])
-
-
-    def on_character_changed(self, profile_name):
-        current_item = self.rundown_tree.currentItem()
-        if current_item:
-            story_data = current_item.data(0, Qt.UserRole)
-            if story_data:
-                story_data["profile"] = profile_name
-                # self.update_rundown_tree_item(current_item, story_data) # Update tree item if needed
-
-    def populate_rewrite_dropdowns(self):
-        self.style_combo.clear()
-        for name, desc in self.style_definitions.items():
-            self.style_combo.addItem(name)
-            self.style_combo.setItemData(self.style_combo.findText(name), desc, Qt.ToolTipRole)
-
-        self.tone_combo.clear()
-        for name, desc in self.tone_definitions.items():
-            self.tone_combo.addItem(name)
-            self.tone_combo.setItemData(self.tone_combo.findText(name), desc, Qt.ToolTipRole)
-
-        self.length_combo.clear()
-        for name, desc in self.length_definitions.items():
-            self.length_combo.addItem(name)
-            self.length_combo.setItemData(self.length_combo.findText(name), desc, Qt.ToolTipRole)
-
-        # Connect signals
-        self.style_combo.currentTextChanged.connect(lambda text: self.update_selected_item_rewrite_option("style", text))
-        self.tone_combo.currentTextChanged.connect(lambda text: self.update_selected_item_rewrite_option("tone", text))
-        self.length_combo.currentTextChanged.connect(lambda text: self.update_selected_item_rewrite_option("length", text))
-
-        # Update dropdowns based on currently selected item in rundown_tree
-        self.on_rundown_item_selected(self.rundown_tree.currentItem(), None)
-
-
-    def update_selected_item_rewrite_option(self, option_type, option_name):
-        current_item = self.rundown_tree.currentItem()
-        if current_item:
-            story_data = current_item.data(0, Qt.UserRole)
-            if story_data:
-                story_data[option_type] = option_name
-                # self.update_rundown_tree_item(current_item, story_data) # If you want to update tree display
-
-    def rewrite_selected_article(self, item=None):
-        if not item: # Called from button, get current selection
-            item = self.rundown_tree.currentItem()
-
-        if not item:
-            QMessageBox.warning(self, "No Article Selected", "Please select an article in the rundown to rewrite.")
-            return
-
-        story_data = item.data(0, Qt.UserRole)
-        if not story_data:
-            QMessageBox.warning(self, "Error", "Selected item has no story data.")
-            return
-
-        original_summary = story_data.get("original_summary", story_data.get("summary", "No summary available."))
-        selected_profile_name = story_data.get("profile", self.select_character_combo.currentText())
-        selected_style_name = story_data.get("style", self.style_combo.currentText())
-        selected_tone_name = story_data.get("tone", self.tone_combo.currentText())
-        selected_length_name = story_data.get("length", self.length_combo.currentText())
-
-        profile_prompt = self.character_profiles.get(selected_profile_name, {}).get("prompt", "You are an objective news narrator.")
-        style_prompt = self.style_definitions.get(selected_style_name, "")
-        tone_prompt = self.tone_definitions.get(selected_tone_name, "")
-        length_prompt = self.length_definitions.get(selected_length_name, "")
-
-        # Construct a combined prompt for the AI (replace with actual AI call)
-        ai_prompt = (
-            f"{profile_prompt} {style_prompt} {tone_prompt} {length_prompt}\n"
-            f"Rewrite the following news summary: {original_summary}"
-        ).strip()
-
-        # Simulate AI rewriting (replace with actual API call)
-        self.log_output.append(f"Rewriting for '{story_data['title']}' with profile '{selected_profile_name}'...")
-        self.log_output.append(f"AI Prompt (simulated): {ai_prompt[:100]}...") # Show a snippet of the prompt
-        # In a real application, you would make an API call here
-        rewritten_text = f"[[Rewritten by AI for {selected_profile_name} in {selected_style_name}, {selected_tone_name}, {selected_length_name} style]]\n\n" + original_summary # Placeholder
-
-        story_data["teleprompter_text"] = rewritten_text
-        story_data["rewritten"] = True
-        self.teleprompter_text_edit.setText(rewritten_text)
-        self.log_output.append(f"Rewriting for '{story_data['title']}' complete.")
-
-    def on_rundown_item_selected(self, current, previous):
-        if current:
-            story_data = current.data(0, Qt.UserRole)
-            if story_data:
-                self.teleprompter_text_edit.setText(story_data.get("teleprompter_text", story_data.get("summary", "")))
-
-                # Update character dropdown
-                profile = story_data.get("profile")
-                if profile and profile in self.character_profiles:
-                    self.select_character_combo.setCurrentText(profile)
-
-                # Update rewrite options dropdowns
-                self.style_combo.setCurrentText(story_data.get("style", "Standard"))
-                self.tone_combo.setCurrentText(story_data.get("tone", "Objective"))
-                self.length_combo.setCurrentText(story_data.get("length", "Standard"))
-
-        else:
-            self.teleprompter_text_edit.clear()
-            self.select_character_combo.setCurrentIndex(0) # Default to first item
-            self.style_combo.setCurrentIndex(0)
-            self.tone_combo.setCurrentIndex(0)
-            self.length_combo.setCurrentIndex(0)
-
-    def apply_teleprompter_text(self):
-        current_item = self.rundown_tree.currentItem()
-        if current_item:
-            story_data = current_item.data(0, Qt.UserRole)
-            if story_data:
-                story_data["teleprompter_text"] = self.teleprompter_text_edit.toPlainText()
-                QMessageBox.information(self, "Text Applied", "Teleprompter text updated for selected article.")
-        else:
-            QMessageBox.warning(self, "No Article Selected", "Please select an article in the rundown to apply text to.")
-
-    @staticmethod
-    def parse_duration_string(duration_str):
-        """Parse HH:MM or MM:SS duration string into total seconds."""
-        if not isinstance(duration_str, str):
-            return None
-        parts = list(map(int, duration_str.split(':')))
-        try:
-            if len(parts) == 2:
-                minutes, seconds = parts
-                if 0 <= seconds < 60:
-                    return minutes * 60 + seconds
-            elif len(parts) == 3:
-                hours, minutes, seconds = parts
-                if 0 <= minutes < 60 and 0 <= seconds < 60:
-                    return hours * 3600 + minutes * 60 + seconds
-            return None
-        except (ValueError, TypeError):
-            return None
-
-    @staticmethod
-    def parse_backtime_string(bt_str):
-        """Try multiple time formats and return a datetime.time object or None."""
-        if not bt_str or not bt_str.strip():
-            return None
-
-        formats = ("%I:%M:%S %p", "%I:%M %p", "%H:%M:%S", "%H:%M")
-        for fmt in formats:
-            try:
-                return datetime.strptime(bt_str.strip(), fmt).time()
-            except ValueError:
-                continue
-        return None
-
-def launch_app():
-    import os
-    os.environ["QT_SCALE_FACTOR_ROUNDING_POLICY"] = "PassThrough"
-
-    from PySide6.QtWidgets import QApplication
-    from PySide6.QtCore import Qt
-
-    # Removed: QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True) - Handled by QGuiApplication.setHighDpiScaleFactorRoundingPolicy earlier
-
-    QApplication.setStyle("Fusion")
-    app = QApplication(sys.argv)
-    app.setStyleSheet("""
-        QTreeView::indicator {
-            width: 32px;
-            height: 32px;
-        }
-        QTreeWidget::item {
-            min-height: 80px; /* Adjust based on icon size and desired spacing */
-        }
-    """)
-
-    main_window = NewsAggregatorApp()
-    main_window.show()
-    sys.exit(app.exec())
-
-if __name__ == "__main__":
+import os
+import sys
+import locale
+
+# Try the locale for this platform first instead of always starting with
+# the Windows name (which raises locale.Error everywhere else)
+_PREFERRED_LOCALE = {
+    'win32': 'English_United States.1252',
+    'darwin': 'en_US.UTF-8',
+}.get(sys.platform, 'en_US.UTF-8')
+
+def safe_set_locale():
+    """Prevent RecursionError on Windows by safely setting a known good LC_TIME locale."""
+    for loc in [
+        _PREFERRED_LOCALE,  # ✅ Platform-specific first choice
+        '',                 # ✅ User/system default
+        'C'                 # ✅ Last-resort fallback
+    ]:
+        try:
+            locale.setlocale(locale.LC_TIME, loc)
+            break
+        except locale.Error:
+            continue
+
+safe_set_locale()
+
+# ✅ Qt high DPI scaling fix
+os.environ["QT_SCALE_FACTOR_ROUNDING_POLICY"] = "PassThrough"
+
+# ✅ Import Qt first so High DPI policy can be set before QApplication is created
+from PySide6.QtCore import (
+    Qt, QUrl, QSize, QTimer, QRunnable, Slot, QThreadPool, QObject, Signal,
+    QTime, QEvent, QRect, QRegularExpression, # Added QRegularExpression
+    QAbstractItemModel, QModelIndex, QSortFilterProxyModel
+)
+from PySide6.QtGui import (
+    QAction, QGuiApplication, QDesktopServices, QPixmap, QIcon, QFont, QTextCharFormat,
+    QColor, QIntValidator, QRegularExpressionValidator, # Added QRegularExpressionValidator
+    QTextDocument, QFontMetrics
+)
+from PySide6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton,
+    QTabWidget, QListWidget, QListWidgetItem, QTextEdit, QHBoxLayout, QSlider,
+    QLineEdit, QComboBox, QMessageBox, QInputDialog, QTreeWidget, QTreeWidgetItem,
+    QHeaderView, QFileDialog, QCheckBox, QSpinBox, QSpacerItem, QSizePolicy,
+    QTimeEdit, QMenu, QStyledItemDelegate, QAbstractItemView, QDialog, QTreeView
+)
+
+# ✅ Set DPI rounding policy BEFORE any QWidget is created
+QGuiApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+
+# ✅ Standard Library
+import hashlib
+import io
+import json
+import functools
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, time as dt_time
+from email.utils import parsedate_to_datetime
+from collections import defaultdict
+import tempfile
+import shutil
+
+# ✅ 3rd Party Libraries
+import pytz
+import feedparser
+import requests
+
+# ✅ Prefer orjson (Rust) for rundown load/save; fall back to stdlib json
+# (same optional-import pattern as manage_feeds_tab)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ✅ Shared HTTP session: keep-alive + pooled connections across all feed
+# fetches (urllib3's pool is thread-safe, so worker threads share it too)
+_HTTP_SESSION = requests.Session()
+_HTTP_ADAPTER = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=1)
+_HTTP_SESSION.mount("http://", _HTTP_ADAPTER)
+_HTTP_SESSION.mount("https://", _HTTP_ADAPTER)
+
+# ✅ pytz.timezone walks the zoneinfo DB per call; cache resolved tzinfo
+# objects so repeat lookups (worker spawns, settings reloads) are dict hits
+@functools.lru_cache(maxsize=64)
+def _get_tz(name):
+    return pytz.timezone(name)
+
+# ✅ Parsed-JSON cache keyed by path; entries are reused until the file's
+# mtime changes, so settings/profiles/options don't re-parse on every call
+_JSON_CACHE = {}
+
+def _load_json_cached(path):
+    st = os.stat(path).st_mtime_ns  # propagates FileNotFoundError to the caller
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == st:
+        return cached[1]
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    _JSON_CACHE[path] = (st, data)
+    return data
+
+# Constants
+FEEDS_FILE = "feeds.json"
+SETTINGS_FILE = "settings.json"
+REWRITE_OPTIONS_FILE = "rewrite_options.json"
+PROFILES_FILE = "character_profiles.json"
+FEED_CACHE_FILE = "feed_cache.json"  # ETag/Last-Modified + parsed stories per feed URL
+# Collapse any run of whitespace (newlines, tabs, doubled spaces) to one space
+_WS_RE = re.compile(r"\s+")
+# Rundown durations: MM:SS or H:MM:SS, compiled once instead of split/int per call
+_DUR_RE = re.compile(r"^(?:(\d{1,3}):)?(\d{1,2}):(\d{2})$")
+
+# ✅ Module-level memoized time parsers. The wrappers on the class strip
+# their input before keying the cache, so " 08:00 AM" and "08:00 AM" hit
+# the same entry instead of each burning a slot
+@functools.lru_cache(maxsize=4096)
+def _parse_duration_cached(duration_str):
+    match = _DUR_RE.match(duration_str)
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    minutes, seconds = int(minutes), int(seconds)
+    if seconds >= 60:
+        return None
+    if hours is not None:
+        if minutes >= 60:
+            return None
+        return int(hours) * 3600 + minutes * 60 + seconds
+    return minutes * 60 + seconds
+
+_BACKTIME_FORMATS = ("%I:%M:%S %p", "%I:%M %p", "%H:%M:%S", "%H:%M")
+
+@functools.lru_cache(maxsize=4096)
+def _parse_backtime_cached(bt_str):
+    # Fast path for plain 24 h strings ("14:30", "08:00:00"): strptime's
+    # format compilation dominates for inputs this small, and split+int
+    # covers them without it. AM/PM strings fall through to strptime.
+    if bt_str[:1].isdigit() and bt_str[-1:].isdigit():
+        parts = bt_str.split(":")
+        if len(parts) in (2, 3) and all(p.isdigit() for p in parts):
+            hour, minute = int(parts[0]), int(parts[1])
+            second = int(parts[2]) if len(parts) == 3 else 0
+            if hour < 24 and minute < 60 and second < 60:
+                return dt_time(hour, minute, second)
+            return None
+
+    # The app writes backtimes itself as "%I:%M %p", so that shape is the
+    # overwhelmingly common input — parse it by hand as well and leave
+    # strptime for genuinely foreign strings
+    head, sep, suffix = bt_str.rpartition(" ")
+    if sep:
+        ampm = suffix.upper()
+        if ampm in ("AM", "PM"):
+            parts = head.split(":")
+            if len(parts) in (2, 3) and all(p.isdigit() for p in parts):
+                hour, minute = int(parts[0]), int(parts[1])
+                second = int(parts[2]) if len(parts) == 3 else 0
+                if 1 <= hour <= 12 and minute < 60 and second < 60:
+                    hour = hour % 12 + (12 if ampm == "PM" else 0)
+                    return dt_time(hour, minute, second)
+            return None
+
+    for fmt in _BACKTIME_FORMATS:
+        try:
+            return datetime.strptime(bt_str, fmt).time()
+        except ValueError:
+            continue
+    return None
+
+# App-wide stylesheet; a module constant so launch_app hands Qt one
+# already-built string rather than constructing it at launch time
+_APP_QSS = """
+    QTreeView::indicator {
+        width: 32px;
+        height: 32px;
+    }
+    QTreeWidget::item {
+        min-height: 80px; /* Adjust based on icon size and desired spacing */
+    }
+"""
+RUNDOWN_FILE = "rundown.json"
+# Feed-name keyword -> category label, checked in order (first match wins)
+CATEGORY_RULES = [
+    ("technology", "Technology"),
+    ("sports", "Sports"),
+    ("politics", "Politics"),
+    ("world", "World News"),
+    ("international", "World News"),
+    ("business", "Business"),
+    ("entertainment", "Entertainment"),
+    # Add more categories as needed
+]
+DEFAULT_FEEDS = [
+    {"name": "BBC News - World", "url": "http://feeds.bbci.co.uk/news/world/rss.xml"},
+    {"name": "Reuters - Top News", "url": "http://feeds.reuters.com/reuters/topNews"},
+    {"name": "The New York Times - Technology", "url": "https://rss.nytimes.com/services/xml/rss/nyt/Technology.xml"},
+    {"name": "CNN - Politics", "url": "http://rss.cnn.com/rss/cnn_politics.rss"},
+    {"name": "ESPN - Top", "url": "https://www.espn.com/espn/rss/news"},
+]
+DEFAULT_SETTINGS = {"dark_mode": False, "font_scale": 0, "timezone": "America/Chicago"}
+# Fallback rewrite prompt when a profile is missing or has no prompt text
+DEFAULT_PROMPT = "You are an objective news narrator."
+DEFAULT_PROFILES = {
+    "Default Narrator": {
+        "description": "A standard, objective news narrator.",
+        "prompt": "You are an objective news narrator."
+    },
+    "Sarcastic Reporter": {
+        "description": "A reporter with a cynical and sarcastic tone.",
+        "prompt": "You are a cynical and sarcastic news reporter."
+    }
+}
+DEFAULT_REWRITE_OPTIONS = {
+    "Style": {
+        "Standard": "Rewrite in a standard, journalistic style.",
+        "Conversational": "Rewrite in a conversational, informal style.",
+        "Academic": "Rewrite in a formal, academic style with precise language."
+    },
+    "Tone": {
+        "Objective": "Maintain a neutral and objective tone.",
+        "Humorous": "Inject humor and wit into the summary.",
+        "Serious": "Maintain a serious and grave tone."
+    },
+    "Length": {
+        "Concise": "Make the summary very brief (around 50 words).",
+        "Standard": "Make the summary a standard length (around 150 words).",
+        "Detailed": "Provide a detailed summary (around 300 words)."
+    }
+}
+
+# Ensure the 'images' directory exists
+IMAGES_DIR = "images"
+os.makedirs(IMAGES_DIR, exist_ok=True)
+
+def _extract_image(entry):
+    """Return the first image URL from an entry's media/enclosure fields."""
+    media_content = entry.get('media_content')
+    if media_content:
+        url = next((m.get('url') for m in media_content
+                    if m.get('type', '').startswith('image/')), None)
+        if url:
+            return url
+    thumbnail = entry.get('media_thumbnail')
+    if thumbnail:
+        if isinstance(thumbnail, list):
+            url = thumbnail[0].get('url')
+        elif isinstance(thumbnail, dict):
+            url = thumbnail.get('url')
+        else:
+            url = None
+        if url:
+            return url
+    links = entry.get('links')
+    if links:
+        return next((link_item.get('href') for link_item in links
+                     if link_item.get('rel') == 'enclosure'
+                     and link_item.get('type', '').startswith('image/')), None)
+    return None
+
+# Worker for fetching stories in a separate thread
+class PullStoriesWorker(QRunnable):
+    def __init__(self, feeds, story_limit, parent_log_output=None):
+        super().__init__()
+        self.feeds = feeds
+        self.story_limit = story_limit
+        self.signals = PullStoriesWorkerSignals()
+        self.log_output = parent_log_output
+        # Resolve the local timezone once up front; per-entry lookups (or
+        # signal round-trips) are never needed
+        try:
+            settings = _load_json_cached(SETTINGS_FILE)
+        except (IOError, json.JSONDecodeError):
+            settings = {}
+        self.local_timezone = _get_tz(settings.get("timezone", "America/Chicago"))
+
+
+    @Slot()
+    def run(self):
+        self._feed_cache = self._load_feed_cache()
+        # Feed fetching is IO-bound, so fan the feeds out across a small
+        # thread pool instead of downloading them one at a time. Each feed
+        # returns its own (name, category, stories) tuple, so the workers
+        # never share a mutable dict; the main thread does the merge.
+        max_workers = min(8, len(self.feeds)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._fetch_one, self.feeds))
+
+        self._save_feed_cache()
+        self.signals.stories_ready.emit(results)
+
+    @staticmethod
+    def _load_feed_cache():
+        try:
+            with open(FEED_CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (IOError, json.JSONDecodeError):
+            return {}
+
+    def _save_feed_cache(self):
+        try:
+            with open(FEED_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self._feed_cache, f)
+        except IOError:
+            pass  # the cache is best-effort; next pull just fetches everything
+
+    def _fetch_one(self, feed_info):
+        """Fetch and parse one feed; runs on a pool thread.
+
+        Returns a (feed_name, category, stories) tuple so the pool threads
+        never touch a shared dict.
+        """
+        feed_name = feed_info["name"]
+        feed_url = feed_info["url"]
+        stories = []
+
+        # Category depends only on the feed name, so classify once per feed
+        # instead of re-scanning keywords for every entry
+        fn_lower = feed_name.lower()
+        category = next((label for keyword, label in CATEGORY_RULES if keyword in fn_lower), "Other")
+
+        date_cache = {}  # rounded minute -> formatted local date, per fetch
+
+        if self.log_output:
+            self.signals.log_message.emit(f"Fetching {feed_name} from {feed_url}...")
+        else:
+            print(f"Fetching {feed_name} from {feed_url}...")
+
+        try:
+            # Conditional GET: replay the validators from the last pull so
+            # unchanged feeds come back as an empty 304
+            cached = self._feed_cache.get(feed_url, {})
+            headers = {"Accept-Encoding": "gzip, deflate"}
+            # The cache only holds stories up to the limit in force when it
+            # was written, so if the slider has since grown past that, skip
+            # the validators and force a full fetch
+            if len(cached.get("stories", [])) >= self.story_limit:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+            # Use the shared session so warm connections skip TCP/TLS handshakes
+            with _HTTP_SESSION.get(feed_url, timeout=10, headers=headers, stream=True) as response: # 10-second timeout
+                if response.status_code == 304:
+                    if self.log_output:
+                        self.signals.log_message.emit(f"{feed_name} unchanged; using cached stories.")
+                    else:
+                        print(f"{feed_name} unchanged; using cached stories.")
+                    return feed_name, category, cached.get("stories", [])[:self.story_limit]
+                response.raise_for_status() # Raise an exception for HTTP errors (4xx or 5xx)
+                # Let feedparser read straight off the socket instead of
+                # buffering the whole (decoded) body into response.content
+                response.raw.decode_content = True
+                # The aggregator only reads titles/summaries/links, so skip
+                # feedparser's HTML sanitization and relative-URI resolution passes
+                feed = feedparser.parse(
+                    response.raw,
+                    resolve_relative_uris=False,
+                    sanitize_html=False,
+                )
+
+            if feed.bozo:
+                if self.log_output:
+                    self.signals.log_message.emit(f"Warning: Error parsing {feed_name}: {feed.bozo_exception}")
+                else:
+                    print(f"Warning: Error parsing {feed_name}: {feed.bozo_exception}")
+                return feed_name, category, stories
+
+            for i, entry in enumerate(feed.entries):
+                if i >= self.story_limit:
+                    break
+
+                title = _WS_RE.sub(' ', entry.get('title', 'No Title')).strip()
+                link = entry.get('link', '#')
+                summary = _WS_RE.sub(' ', entry.get('summary', entry.get('description', 'No Summary'))).strip()
+                # feedparser normalizes dates to a UTC struct_time; when it's
+                # there, build the datetime straight from it (tagged UTC) and
+                # skip the raw-string path entirely
+                time_tuple = entry.get('published_parsed') or entry.get('updated_parsed')
+                if time_tuple:
+                    published_parsed = datetime(*time_tuple[:6], tzinfo=pytz.utc)
+                else:
+                    published_raw = entry.get('published') or entry.get('updated')
+                    if published_raw:
+                        try:
+                            # RSS dates are overwhelmingly RFC 822, which the
+                            # stdlib parses an order of magnitude faster than
+                            # dateutil; keep dateutil as the last resort
+                            try:
+                                published_parsed = parsedate_to_datetime(published_raw)
+                            except (TypeError, ValueError):
+                                from dateutil import parser as dateparser
+                                published_parsed = dateparser.parse(published_raw)
+                        except Exception as e:
+                            if self.log_output:
+                                self.signals.log_message.emit(f"Warning: Could not parse date for '{title}': {e}")
+                            else:
+                                print(f"Warning: Could not parse date for '{title}': {e}")
+                            published_parsed = datetime.now() # Default to now on error
+                    else:
+                        published_parsed = datetime.now() # Default to now if no date provided
+
+                # Convert to local timezone for display
+                if published_parsed.tzinfo is None: # Assume UTC if no timezone info
+                    published_parsed = pytz.utc.localize(published_parsed)
+                # Bursts of entries often share a publish minute; memoize the
+                # astimezone + strftime work per rounded minute
+                minute_key = int(published_parsed.timestamp()) // 60
+                date_display = date_cache.get(minute_key)
+                if date_display is None:
+                    date_display = published_parsed.astimezone(self.local_timezone).strftime("%Y-%m-%d %H:%M")
+                    date_cache[minute_key] = date_display
+
+                image_url = _extract_image(entry)
+
+                stories.append({
+                    "title": title,
+                    "link": link,
+                    "summary": summary,
+                    "source": feed_name,
+                    "pub_date": date_display,
+                    "image_url": image_url,
+                    "category": category, # Store category with story
+                    "rewritten": False, # Flag for rewrite status
+                    "original_summary": summary # Store original for reference
+                })
+            # Remember the validators (and parsed stories) for the next pull
+            self._feed_cache[feed_url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "stories": stories,
+            }
+
+            if self.log_output:
+                self.signals.log_message.emit(f"Finished fetching {feed_name}.")
+            else:
+                print(f"Finished fetching {feed_name}.")
+
+        except requests.exceptions.RequestException as e:
+            if self.log_output:
+                self.signals.log_message.emit(f"Error fetching {feed_name} from {feed_url}: {e}")
+            else:
+                print(f"Error fetching {feed_name} from {feed_url}: {e}")
+        except Exception as e:
+            if self.log_output:
+                self.signals.log_message.emit(f"An unexpected error occurred for {feed_name}: {e}")
+            else:
+                print(f"An unexpected error occurred for {feed_name}: {e}")
+
+        return feed_name, category, stories
+
+class PullStoriesWorkerSignals(QObject):
+    stories_ready = Signal(list)
+    log_message = Signal(str)
+
+def _image_cache_path(url):
+    """Local cache filename for a story image URL.
+
+    Uses a stable blake2b digest — builtin hash() is salted per process, so
+    names derived from it never match across runs and the cache misses 100%
+    of the time after a restart.
+    """
+    digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(IMAGES_DIR, digest + ".png") # Using PNG as a common format
+
+def _cached_image(url):
+    """Return the cached file for url if it is already on disk, else None."""
+    path = _image_cache_path(url)
+    return path if os.path.exists(path) else None
+
+def download_image(url):
+    """Fetch url into the image cache; returns the local path or None."""
+    try:
+        filename = _image_cache_path(url)
+        if os.path.exists(filename):
+            return filename # Return cached image if exists
+
+        response = _HTTP_SESSION.get(url, stream=True, timeout=5)
+        response.raise_for_status()
+
+        with open(filename, 'wb') as out_file:
+            shutil.copyfileobj(response.raw, out_file)
+        return filename
+    except Exception:
+        return None # Indicate failure
+
+class ImageFetchSignals(QObject):
+    done = Signal(str, str)  # url, local path ("" on failure)
+
+class ImageFetchWorker(QRunnable):
+    """Downloads one story image on the thread pool.
+
+    Uses the shared pooled session, so concurrent fetches reuse warm
+    connections instead of paying a handshake per image. The GUI thread
+    only enqueues these workers and consumes their done signal — no
+    network call ever blocks the event loop.
+    """
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+        self.signals = ImageFetchSignals()
+
+    @Slot()
+    def run(self):
+        path = download_image(self.url)
+        self.signals.done.emit(self.url, path or "")
+
+class RewriteSignals(QObject):
+    done = Signal(dict, str)  # story_data, rewritten text
+
+class RewriteWorker(QRunnable):
+    """Runs one teleprompter rewrite on the thread pool.
+
+    The AI call is still simulated, but a real one is a blocking network
+    round-trip — running it here keeps the rundown responsive while a
+    rewrite (or a batch of them) is in flight. The GUI thread consumes
+    the done signal to store and display the result.
+    """
+    def __init__(self, story_data, ai_prompt, header, original_summary):
+        super().__init__()
+        self.story_data = story_data
+        self.ai_prompt = ai_prompt
+        self.header = header
+        self.original_summary = original_summary
+        self.signals = RewriteSignals()
+
+    @Slot()
+    def run(self):
+        # In a real application, you would make an API call here using
+        # self.ai_prompt; the header + summary placeholder stands in for it.
+        # Accumulate through StringIO so a streaming API can buf.write each
+        # token with amortized O(N) growth instead of O(N^2) string +=
+        buf = io.StringIO()
+        buf.write(self.header)
+        buf.write(self.original_summary)
+        self.signals.done.emit(self.story_data, buf.getvalue())
+
+class StartupDataTaskSignals(QObject):
+    loaded = Signal(dict)
+
+class StartupDataTask(QRunnable):
+    """Reads the startup JSON files on a pool thread.
+
+    Only does file I/O and parsing here; parse failures come back as warning
+    strings so the main thread can show the QMessageBox itself.
+    """
+    def __init__(self):
+        super().__init__()
+        self.signals = StartupDataTaskSignals()
+
+    @Slot()
+    def run(self):
+        result = {"warnings": []}
+        for key, path in (("settings", SETTINGS_FILE),
+                          ("profiles", PROFILES_FILE),
+                          ("rewrite_options", REWRITE_OPTIONS_FILE)):
+            try:
+                result[key] = _load_json_cached(path)
+            except FileNotFoundError:
+                result[key] = None  # caller substitutes the defaults
+            except json.JSONDecodeError:
+                result[key] = None
+                result["warnings"].append(f"Could not parse {path}. Using defaults.")
+        self.signals.loaded.emit(result)
+
+class RundownTreeWidget(QTreeWidget):
+    """QTreeWidget that reports internal drag-and-drop reorders.
+
+    InternalMove drops never emit rowsMoved — QTreeWidget takes the
+    dragged items out and re-inserts them — so the owner passes a
+    callback that runs once the drop has landed and the rows are in
+    their final order.
+    """
+
+    def __init__(self, parent=None, on_reorder=None):
+        super().__init__(parent)
+        self._on_reorder = on_reorder
+
+    def dropEvent(self, event):
+        super().dropEvent(event)
+        if self._on_reorder is not None:
+            self._on_reorder()
+
+class RundownItemDelegate(QStyledItemDelegate):
+    # Compiled once at class level; every delegate instance shares the same
+    # PCRE program instead of re-compiling it per construction
+    _DURATION_RE = QRegularExpression(r"^\d{1,2}:\d{2}$") # HH:MM or H:MM or MM:SS or M:SS
+    _DURATION_VALIDATOR = QRegularExpressionValidator(_DURATION_RE)
+
+    def __init__(self, parent=None, tree_widget=None):
+        super().__init__(parent)
+        self.tree_widget = tree_widget
+        self.edit_mode = False
+        self.duration_validator = RundownItemDelegate._DURATION_VALIDATOR
+        self.text_height_cache = {} # Cache for text height calculations
+
+    def createEditor(self, parent, option, index):
+        if index.column() == 2:  # Duration column
+            editor = QLineEdit(parent)
+            editor.setValidator(self.duration_validator)
+            self.edit_mode = True
+            return editor
+        elif index.column() == 3: # Backtime column (QTimeEdit)
+            editor = QTimeEdit(parent)
+            editor.setDisplayFormat("h:mm AP")
+            editor.setCalendarPopup(False)
+            self.edit_mode = True
+            return editor
+        elif index.column() == 0: # Headline column
+            # Use a QTextEdit for multi-line editing
+            editor = QTextEdit(parent)
+            self.edit_mode = True
+            return editor
+        return super().createEditor(parent, option, index)
+
+    def setEditorData(self, editor, index):
+        if index.column() == 2:  # Duration column
+            value = index.model().data(index, Qt.EditRole)
+            editor.setText(value)
+        elif index.column() == 3: # Backtime column
+            value = index.model().data(index, Qt.EditRole)
+            if value:
+                editor.setTime(self._parse_backtime(value))
+            else:
+                editor.setTime(QTime(0, 0)) # Default to 00:00
+        elif index.column() == 0: # Headline column
+            editor.setText(index.model().data(index, Qt.EditRole))
+        else:
+            super().setEditorData(editor, index)
+
+    @staticmethod
+    def _parse_backtime(value):
+        """Parse "h:mm" / "h:mm AM" strings into a QTime without strptime
+        (which re-parses the format and consults LC_TIME on every call)."""
+        s = value.strip()
+        ampm = s[-2:].upper() if s[-2:].upper() in ("AM", "PM") else None
+        if ampm:
+            s = s[:-2].strip()
+        try:
+            hours, minutes = s.split(":")
+            hours = int(hours)
+            minutes = int(minutes)
+        except ValueError:
+            return QTime(0, 0)
+        if ampm == "PM" and hours != 12:
+            hours += 12
+        elif ampm == "AM" and hours == 12:
+            hours = 0
+        return QTime(hours, minutes)
+
+    def setModelData(self, editor, model, index):
+        if index.column() == 2:  # Duration column
+            text = editor.text()
+            if self.duration_validator.validate(text, 0)[0] == QRegularExpressionValidator.Acceptable:
+                model.setData(index, text, Qt.EditRole)
+            else:
+                # Optionally revert or show error if invalid
+                pass
+        elif index.column() == 3: # Backtime column
+            model.setData(index, editor.time().toString("h:mm AP"), Qt.EditRole)
+        elif index.column() == 0: # Headline column
+            model.setData(index, editor.toPlainText(), Qt.EditRole)
+        else:
+            super().setModelData(editor, model, index)
+        self.edit_mode = False # Exit edit mode
+
+    def updateEditorGeometry(self, editor, option, index):
+        if index.column() == 0: # Headline column
+            editor.setGeometry(option.rect)
+        else:
+            super().updateEditorGeometry(editor, option, index)
+
+    def sizeHint(self, option, index):
+        if index.column() == 0: # Headline column
+            # Calculate height based on content
+            text = index.data(Qt.DisplayRole)
+            if not text:
+                return super().sizeHint(option, index)
+
+            # Cache by (text, width) — a width-only key returns stale heights
+            # as soon as the column is resized
+            width = option.rect.width()
+            height = self.text_height_cache.get((text, width))
+            if height is None:
+                if "<" not in text:
+                    # Plain headlines: font metrics are much cheaper than
+                    # building a QTextDocument just to measure
+                    metrics = QFontMetrics(option.font)
+                    height = metrics.boundingRect(0, 0, width, 10000, Qt.TextWordWrap, text).height() + 10
+                else:
+                    document = QTextDocument()
+                    document.setDefaultFont(option.font)
+                    document.setHtml(text)
+                    document.setTextWidth(width) # Constrain width
+                    height = int(document.size().height()) + 10 # Add some padding
+                self.text_height_cache[(text, width)] = height
+            return QSize(width, height)
+
+        return super().sizeHint(option, index)
+
+class StoriesModel(QAbstractItemModel):
+    """Two-level model behind the articles tree: category rows with story rows
+    beneath them.
+
+    Holds the pulled story dicts directly and answers data() on demand, so
+    only rows the view actually paints cost anything — no per-story widget
+    allocation, and icons are only loaded for visible rows.
+    """
+    HEADERS = ("Headline", "Source", "Date")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._categories = []      # ordered category names
+        self._stories_by_cat = {}  # category name -> list of story dicts
+        self._checks = {}          # (category row, story row) -> Qt.CheckState
+        self._icon_cache = {}      # url -> QIcon, shared across loads
+        self._icon_missing = set() # urls known absent from disk; skip re-stat
+        self._default_icon = None  # decoded once, shared by every image-less row
+
+    def load(self, all_stories, category_key):
+        """Replace the contents with a fresh pull in one model reset."""
+        self.beginResetModel()
+        self._categories = sorted((c for c in all_stories if all_stories[c]), key=category_key)
+        self._stories_by_cat = {c: all_stories[c] for c in self._categories}
+        self._checks = {}
+        self.endResetModel()
+
+    # --- QAbstractItemModel plumbing -------------------------------------
+    # Category indexes carry internalId 0; story indexes carry their
+    # category's row + 1 so parent() can be computed without back-pointers.
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index):
+        iid = index.internalId()
+        if iid == 0:
+            return QModelIndex()
+        return self.createIndex(iid - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._categories)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return len(self._stories_by_cat[self._categories[parent.row()]])
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if index.internalId() == 0:
+            return Qt.ItemIsEnabled  # category headers are not selectable
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        iid = index.internalId()
+        if iid == 0:
+            if role == Qt.DisplayRole and index.column() == 0:
+                return self._categories[index.row()]
+            return None
+
+        story = self._stories_by_cat[self._categories[iid - 1]][index.row()]
+        if role == Qt.DisplayRole:
+            column = index.column()
+            if column == 0:
+                return story["title"]
+            if column == 1:
+                return story["source"]
+            return story["pub_date"]
+        if role == Qt.CheckStateRole and index.column() == 0:
+            return self._checks.get((iid - 1, index.row()), Qt.Unchecked)
+        if role == Qt.DecorationRole and index.column() == 0:
+            return self._icon_for(story)
+        if role == Qt.UserRole:
+            return story
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role == Qt.CheckStateRole and index.internalId() != 0 and index.column() == 0:
+            self._checks[(index.internalId() - 1, index.row())] = Qt.CheckState(value)
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            return True
+        return False
+
+    # --- helpers ----------------------------------------------------------
+
+    def _icon_for(self, story):
+        url = story.get("image_url")
+        if not url:
+            if self._default_icon is None:
+                self._default_icon = QIcon(QPixmap("images/default_news_icon.png"))
+            return self._default_icon
+        icon = self._icon_cache.get(url)
+        if icon is not None:
+            return icon
+        # Disk probe only — downloads happen on the thread pool, which
+        # pushes the real icon in via set_icon() once the file lands.
+        # Remember misses so repaints don't stat() the same path repeatedly.
+        if url in self._icon_missing:
+            return None
+        path = _cached_image(url)
+        if path:
+            icon = QIcon(path)
+            self._icon_cache[url] = icon
+            return icon
+        self._icon_missing.add(url)
+        return None
+
+    def has_icon(self, url):
+        return url in self._icon_cache
+
+    def set_icon(self, url, icon):
+        """Install a freshly downloaded icon and repaint the rows that use it."""
+        self._icon_cache[url] = icon
+        self._icon_missing.discard(url)
+        create_index = self.createIndex
+        emit_changed = self.dataChanged.emit
+        roles = [Qt.DecorationRole]
+        for cat_row, cat in enumerate(self._categories):
+            for row, story in enumerate(self._stories_by_cat[cat]):
+                if story.get("image_url") == url:
+                    index = create_index(row, 0, cat_row + 1)
+                    emit_changed(index, index, roles)
+
+    def category_at(self, row):
+        return self._categories[row]
+
+    def checked_stories(self):
+        """Return the story dicts whose rows are currently checked."""
+        return [
+            self._stories_by_cat[self._categories[cat_row]][row]
+            for (cat_row, row), state in self._checks.items()
+            if state == Qt.Checked
+        ]
+
+class CategoryFilterProxy(QSortFilterProxyModel):
+    """Filters the articles tree to one category without rebuilding rows."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._category = ""  # empty means show everything
+
+    def set_category(self, category):
+        self._category = "" if category == "All" else category
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._category:
+            return True
+        if source_parent.isValid():
+            return True  # story rows follow their category header
+        return self.sourceModel().category_at(source_row) == self._category
+
+class NewsAggregatorApp(QMainWindow):
+    def __init__(self):
+        super().__init__()
+
+        self.setWindowTitle("News Aggregator")
+        self.filter_category_dropdown = QComboBox()
+        # Populate the fixed category list exactly once; the old code added
+        # these again on every feed load, duplicating the entries
+        self.filter_category_dropdown.addItems(["All", "Technology", "Sports", "Politics", "World News", "Business", "Entertainment"])
+        self.teleprompter_text_edit = QTextEdit()
+        self.teleprompter_text_edit.setReadOnly(True)
+
+        self.tabs = QTabWidget()
+        self.setCentralWidget(self.tabs)
+        self.statusBar().showMessage("Loading...")
+        self.threadpool = QThreadPool()
+
+        self.current_expanded_item = None
+        self.current_rundown_filename = None
+        self._recalculating_backtimes = False
+        self._backtime_pending = False
+        # Canonical rundown storage; the tree widget is just a view of it
+        self._rundown_items = []
+        # Tab switches only recalculate backtimes when an edit happened
+        self._rundown_dirty = True
+        # Backtime datetimes by row, kept by calculate_backtimes so a
+        # single-row duration/active edit can shift rows 0..k instead of
+        # recomputing the whole column
+        self._backtime_datetimes = []
+        # Clock-target cache: reparse the first item's backtime string only
+        # when its text changes, not on every 1 s timer tick
+        self._cached_target_str = None
+        self._cached_target_datetime = None
+        # Last rundown row the selection handler synced the editor pane to
+        self._last_selected_item = None
+        # Combined prompt prefixes keyed by (profile, style, tone, length);
+        # cleared whenever profiles or rewrite options change
+        self._prompt_prefix_cache = {}
+        # Cached right-click menu for the rundown tree (built on first use)
+        self._rundown_menu = None
+        self._rundown_menu_signature = None
+        self._context_item = None
+
+        # ✅ Debounced settings writer: rapid widget changes (spinbox drags,
+        # checkbox toggles) coalesce into one disk write per quiet period
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(250)
+        self._settings_save_timer.timeout.connect(self._do_save_settings)
+
+        # Same idea for the app-wide restyle a font-scale change triggers
+        self._font_scale_timer = QTimer(self)
+        self._font_scale_timer.setSingleShot(True)
+        self._font_scale_timer.setInterval(250)
+        self._font_scale_timer.timeout.connect(self._apply_font_scale_now)
+
+        # Shared dirty-file tracker: profile/option/feed mutations mark their
+        # file dirty and one timer flushes whatever accumulated, so a burst
+        # of edits costs one write per file instead of one per edit
+        self._dirty_files = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(250)
+        self._flush_timer.timeout.connect(self._flush_dirty)
+
+        # ✅ Read settings/profiles/rewrite options off the UI thread; the
+        # window shows immediately and the tabs are built once the data lands
+        self._startup_task = StartupDataTask()
+        self._startup_task.signals.loaded.connect(self._finish_startup, Qt.QueuedConnection)
+        self.threadpool.start(self._startup_task)
+
+        self.showMaximized()
+
+    def _finish_startup(self, result):
+        """Build the UI once the startup JSON has been read off-thread."""
+        self._startup_task = None
+        self.settings = result["settings"] if result["settings"] is not None else dict(DEFAULT_SETTINGS)
+        QTimer.singleShot(0, self.apply_saved_font_scale)
+        self.apply_dark_mode(self.settings.get("dark_mode", False))
+
+        self.character_profiles = (result["profiles"]
+                                   if result["profiles"] is not None else dict(DEFAULT_PROFILES))
+        # Intern the names once: they're reused as dict keys on every lookup,
+        # and interned keys compare by pointer inside the dict probe
+        self.character_profiles = {sys.intern(k): v for k, v in self.character_profiles.items()}
+        # Normalize once at load so selection handlers can index the keys
+        # directly instead of paying .get() defaults on every keystroke
+        for profile in self.character_profiles.values():
+            profile.setdefault("prompt", "")
+            profile.setdefault("description", "")
+        self.rewrite_options = (result["rewrite_options"]
+                                if result["rewrite_options"] is not None else dict(DEFAULT_REWRITE_OPTIONS))
+        for kind in ("Style", "Tone", "Length"):
+            self.rewrite_options[kind] = {sys.intern(k): v
+                                          for k, v in self.rewrite_options.get(kind, {}).items()}
+        self.style_definitions = self.rewrite_options["Style"]
+        self.tone_definitions = self.rewrite_options["Tone"]
+        self.length_definitions = self.rewrite_options["Length"]
+
+        # Fused prompt table so the rewrite path does single-dict lookups
+        # instead of .get(name, {}).get("prompt", ...) chains per call
+        self._rebuild_prompt_table()
+
+        # defaultdict so hot paths can index unknown profiles without a
+        # .get default-argument branch on every lookup
+        self.profile_tooltips = defaultdict(lambda: "No description available.", {
+            name: profile.get("description", "")
+            for name, profile in self.character_profiles.items()
+        })
+
+        # The Settings tab is a placeholder until first shown; its three list
+        # widgets and editors are only built for sessions that visit it
+        self.settings_tab = QWidget()
+        self._settings_tab_built = False
+        self.tabs.addTab(self.settings_tab, "Settings")
+
+        self.setup_feed_manager_tab()
+        self.setup_articles_tab()
+        self.setup_rundown_tab()
+
+        self.tabs.currentChanged.connect(self._maybe_init_settings_tab)
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+        # The settings tab may already be the current one (it is added first)
+        self._maybe_init_settings_tab(self.tabs.currentIndex())
+        self.installEventFilter(self)
+        self.statusBar().showMessage("Ready")
+
+        for msg in result["warnings"]:
+            QMessageBox.warning(self, "Error", msg)
+
+
+    def eventFilter(self, obj, event):
+        # The rundown tab may not exist yet while the startup data loads
+        if event.type() == QEvent.KeyPress and event.key() == Qt.Key_Escape and hasattr(self, "rundown_tab") and self.tabs.currentIndex() == self.tabs.indexOf(self.rundown_tab):
+            if self.rundown_delegate.edit_mode:
+                # If in edit mode, discard changes and exit edit
+                self.rundown_tree.closePersistentEditor(self.rundown_tree.currentIndex())
+                self.rundown_delegate.edit_mode = False
+                return True # Event handled
+        return super().eventFilter(obj, event)
+
+    def load_profiles(self):
+        try:
+            return _load_json_cached(PROFILES_FILE)
+        except FileNotFoundError:
+            return dict(DEFAULT_PROFILES)
+        except json.JSONDecodeError:
+            QMessageBox.warning(self, "Error", f"Could not parse {PROFILES_FILE}. Creating new default.")
+            return dict(DEFAULT_PROFILES)
+
+    def _rebuild_prompt_table(self):
+        # One fused (kind, name) -> prompt table instead of four separate
+        # dicts, so the rewrite path probes a single hash table
+        table = {}
+        for name, profile in self.character_profiles.items():
+            table[("profile", name)] = profile.get("prompt") or DEFAULT_PROMPT
+        for kind, definitions in (("style", self.style_definitions),
+                                  ("tone", self.tone_definitions),
+                                  ("length", self.length_definitions)):
+            for name, prompt in definitions.items():
+                table[(kind, name)] = prompt
+        self._prompt_table = table
+
+    def _mark_dirty(self, name):
+        self._dirty_files.add(name)
+        if name in ("profiles", "rewrite_options"):
+            # Prompt text may have changed; cached prefixes are stale
+            self._prompt_prefix_cache.clear()
+            self._rebuild_prompt_table()
+        self._flush_timer.start()
+
+    def _flush_dirty(self):
+        dirty, self._dirty_files = self._dirty_files, set()
+        if "profiles" in dirty:
+            self.save_profiles()
+        if "rewrite_options" in dirty:
+            self.save_rewrite_options()
+        if "feeds" in dirty:
+            self.save_feeds_to_file(self._feeds)
+
+    def save_profiles(self):
+        try:
+            # Atomic swap so a crash mid-write can't truncate the file
+            tmp = PROFILES_FILE + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.character_profiles, f, indent=4)
+            os.replace(tmp, PROFILES_FILE)
+        except IOError as e:
+            QMessageBox.critical(self, "Save Error", f"Could not save character profiles: {e}")
+
+    def load_rewrite_options(self):
+        try:
+            return _load_json_cached(REWRITE_OPTIONS_FILE)
+        except FileNotFoundError:
+            return dict(DEFAULT_REWRITE_OPTIONS)
+        except json.JSONDecodeError:
+            QMessageBox.warning(self, "Error", f"Could not parse {REWRITE_OPTIONS_FILE}. Creating new default.")
+            return dict(DEFAULT_REWRITE_OPTIONS)
+
+    def save_rewrite_options(self):
+        try:
+            # Atomic swap so a crash mid-write can't truncate the file
+            tmp = REWRITE_OPTIONS_FILE + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.rewrite_options, f, indent=4)
+            os.replace(tmp, REWRITE_OPTIONS_FILE)
+        except IOError as e:
+            QMessageBox.critical(self, "Save Error", f"Could not save rewrite options: {e}")
+
+    def load_settings(self):
+        try:
+            return _load_json_cached(SETTINGS_FILE)
+        except FileNotFoundError:
+            return dict(DEFAULT_SETTINGS)
+        except json.JSONDecodeError:
+            QMessageBox.warning(self, "Error", f"Could not parse {SETTINGS_FILE}. Resetting settings.")
+            return dict(DEFAULT_SETTINGS)
+
+    def save_settings(self):
+        # Slot-facing entry point: just (re)arm the debounce timer so a
+        # burst of widget changes becomes one write
+        self._settings_save_timer.start()
+
+    def _do_save_settings(self):
+        self.settings["dark_mode"] = self.dark_mode_checkbox.isChecked()
+        self.settings["font_scale"] = self.font_scale_spinbox.value()
+        self.settings["timezone"] = self.timezone_combo.currentText()
+        self.settings["profiles"] = self.character_profiles
+        self.settings["rewrite_options"] = self.rewrite_options
+
+        try:
+            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(self.settings, f, indent=4, ensure_ascii=False)
+            self.statusBar().showMessage("✅ Settings saved", 3000)
+        except IOError as e:
+            QMessageBox.critical(self, "Save Error", f"Could not save settings: {e}")
+
+    # The stylesheet is constant; build the string once instead of on every
+    # dark-mode toggle
+    _DARK_QSS = """
+                QMainWindow {
+                    background-color: #2e2e2e;
+                    color: #f0f0f0;
+                }
+                QTabWidget::pane {
+                    border: 1px solid #444;
+                }
+                QTabBar::tab {
+                    background: #3a3a3a;
+                    color: #f0f0f0;
+                    border: 1px solid #444;
+                    border-bottom-color: #3a3a3a;
+                    padding: 8px;
+                }
+                QTabBar::tab:selected {
+                    background: #2e2e2e;
+                    border-bottom-color: #2e2e2e;
+                }
+                QListWidget, QTextEdit, QLineEdit, QComboBox, QTreeWidget, QSpinBox, QTimeEdit {
+                    background-color: #3a3a3a;
+                    color: #f0f0f0;
+                    border: 1px solid #555;
+                }
+                QPushButton {
+                    background-color: #555;
+                    color: #f0f0f0;
+                    border: 1px solid #666;
+                    padding: 5px 10px;
+                }
+                QPushButton:hover {
+                    background-color: #666;
+                }
+                QLabel {
+                    color: #f0f0f0;
+                }
+                QHeaderView::section {
+                    background-color: #4a4a4a;
+                    color: #f0f0f0;
+                    padding: 4px;
+                    border: 1px solid #555;
+                }
+                QMessageBox {
+                    background-color: #2e2e2e;
+                    color: #f0f0f0;
+                }
+                QMessageBox QLabel {
+                    color: #f0f0f0;
+                }
+                QMessageBox QPushButton {
+                    background-color: #555;
+                    color: #f0f0f0;
+                }
+                QMenu {
+                    background-color: #3a3a3a;
+                    color: #f0f0f0;
+                    border: 1px solid #555;
+                }
+                QMenu::item:selected {
+                    background-color: #555;
+                }
+                QListView::item:selected {
+                    background-color: #0078d7; /* Standard selection blue */
+                    color: white;
+                }
+                QTreeWidget::item:selected {
+                    background-color: #0078d7; /* Standard selection blue */
+                    color: white;
+                }
+            """
+
+    def apply_dark_mode(self, enabled):
+        self.settings["dark_mode"] = enabled
+        self.setStyleSheet(self._DARK_QSS if enabled else "") # Clear stylesheet for light mode
+
+    def apply_saved_font_scale(self):
+        font_scale = self.settings.get("font_scale", 0)
+        default_font = QApplication.font()
+        # Use the already initialized teleprompter_text_edit
+        self.teleprompter_text_edit.setFont(QFont("Arial", default_font.pointSize() + 5 + font_scale)) # Larger for teleprompter
+
+        # Apply to general application font if not 0
+        if font_scale != 0:
+            new_font = QFont(default_font.family(), default_font.pointSize() + font_scale)
+            QApplication.setFont(new_font)
+        else:
+            # Reset to system default if scale is 0
+            QApplication.setFont(QGuiApplication.font())
+
+    def closeEvent(self, event):
+        # Flush synchronously — a pending debounce timer won't fire once the
+        # event loop stops. The widgets only exist if startup finished.
+        if hasattr(self, "dark_mode_checkbox"):
+            self._settings_save_timer.stop()
+            self._do_save_settings()
+        self._flush_timer.stop()
+        self._flush_dirty()
+        event.accept()
+
+
+    def _maybe_init_settings_tab(self, index):
+        if self._settings_tab_built or self.tabs.widget(index) is not self.settings_tab:
+            return
+        self._settings_tab_built = True
+        self.setup_settings_tab()
+
+    def setup_settings_tab(self):
+        # Fills in the placeholder widget added in _finish_startup
+        layout = QVBoxLayout(self.settings_tab)
+
+        # Dark Mode Toggle
+        dark_mode_layout = QHBoxLayout()
+        dark_mode_label = QLabel("Dark Mode:")
+        self.dark_mode_checkbox = QCheckBox()
+        self.dark_mode_checkbox.setChecked(self.settings.get("dark_mode", False))
+        self.dark_mode_checkbox.stateChanged.connect(lambda state: self.apply_dark_mode(state == Qt.Checked))
+        dark_mode_layout.addWidget(dark_mode_label)
+        dark_mode_layout.addWidget(self.dark_mode_checkbox)
+        dark_mode_layout.addStretch()
+        layout.addLayout(dark_mode_layout)
+
+        # Font Scaling
+        font_scale_layout = QHBoxLayout()
+        font_scale_label = QLabel("Font Scale:")
+        self.font_scale_spinbox = QSpinBox()
+        self.font_scale_spinbox.setMinimum(-5)
+        self.font_scale_spinbox.setMaximum(5)
+        self.font_scale_spinbox.setValue(self.settings.get("font_scale", 0))
+        self.font_scale_spinbox.valueChanged.connect(self.change_font_scale)
+        font_scale_layout.addWidget(font_scale_label)
+        font_scale_layout.addWidget(self.font_scale_spinbox)
+        font_scale_layout.addStretch()
+        layout.addLayout(font_scale_layout)
+
+        # Timezone Setting
+        timezone_layout = QHBoxLayout()
+        timezone_label = QLabel("Local Timezone:")
+        self.timezone_combo = QComboBox()
+        # Populate with common timezones in one batch — ~440 addItem calls
+        # would emit a model-change notification each
+        self.timezone_combo.blockSignals(True)
+        self.timezone_combo.addItems(list(pytz.common_timezones))
+        self.timezone_combo.blockSignals(False)
+        current_tz = self.settings.get("timezone", "America/Chicago")
+        self.timezone_combo.setCurrentText(current_tz)
+        self.timezone_combo.currentTextChanged.connect(self.change_timezone)
+        timezone_layout.addWidget(timezone_label)
+        timezone_layout.addWidget(self.timezone_combo)
+        timezone_layout.addStretch()
+        layout.addLayout(timezone_layout)
+
+        # Add profile management section
+        layout.addWidget(QLabel("<h2>Character Profiles</h2>"))
+        self.profile_list = QListWidget()
+        self.profile_list.currentItemChanged.connect(self.display_profile_details)
+        layout.addWidget(self.profile_list)
+
+        profile_buttons_layout = QHBoxLayout()
+        self.add_profile_button = QPushButton("Add Profile")
+        self.add_profile_button.clicked.connect(self.add_profile)
+        self.edit_profile_button = QPushButton("Edit Profile")
+        self.edit_profile_button.clicked.connect(self.edit_profile)
+        self.delete_profile_button = QPushButton("Delete Profile")
+        self.delete_profile_button.clicked.connect(self.delete_profile)
+        profile_buttons_layout.addWidget(self.add_profile_button)
+        profile_buttons_layout.addWidget(self.edit_profile_button)
+        profile_buttons_layout.addWidget(self.delete_profile_button)
+        layout.addLayout(profile_buttons_layout)
+
+        self.profile_name_edit = QLineEdit()
+        self.profile_name_edit.setPlaceholderText("Profile Name")
+        self.profile_prompt_edit = QTextEdit()
+        self.profile_prompt_edit.setPlaceholderText("Profile Prompt for AI")
+        self.profile_description_edit = QLineEdit()
+        self.profile_description_edit.setPlaceholderText("Short Description (for tooltip)")
+
+        layout.addWidget(QLabel("Profile Name:"))
+        layout.addWidget(self.profile_name_edit)
+        layout.addWidget(QLabel("Profile Prompt:"))
+        layout.addWidget(self.profile_prompt_edit)
+        layout.addWidget(QLabel("Profile Description:"))
+        layout.addWidget(self.profile_description_edit)
+
+        # Add rewrite options management section
+        layout.addWidget(QLabel("<h2>Rewrite Options</h2>"))
+        rewrite_options_layout = QVBoxLayout()
+
+        # One loop builds the three identical Style/Tone/Length sections;
+        # widget refs live in self._rewrite_kinds so the option methods do a
+        # single dict lookup instead of getattr on a formatted name
+        self._rewrite_kinds = {}
+        for kind, plural, definitions in (
+            ("Style", "Styles", self.style_definitions),
+            ("Tone", "Tones", self.tone_definitions),
+            ("Length", "Lengths", self.length_definitions),
+        ):
+            list_widget = QListWidget()
+            list_widget.currentItemChanged.connect(
+                lambda *_, k=kind, lw=list_widget: self.display_rewrite_option_details(k, lw))
+            rewrite_options_layout.addWidget(QLabel(f"<h3>{plural}</h3>"))
+            rewrite_options_layout.addWidget(list_widget)
+
+            buttons_layout = QHBoxLayout()
+            add_button = QPushButton(f"Add {kind}")
+            add_button.clicked.connect(lambda *_, k=kind: self.add_rewrite_option(k))
+            edit_button = QPushButton(f"Edit {kind}")
+            edit_button.clicked.connect(lambda *_, k=kind, lw=list_widget: self.edit_rewrite_option(k, lw))
+            delete_button = QPushButton(f"Delete {kind}")
+            delete_button.clicked.connect(lambda *_, k=kind, lw=list_widget: self.delete_rewrite_option(k, lw))
+            buttons_layout.addWidget(add_button)
+            buttons_layout.addWidget(edit_button)
+            buttons_layout.addWidget(delete_button)
+            rewrite_options_layout.addLayout(buttons_layout)
+
+            self._rewrite_kinds[kind] = {"list": list_widget, "defs": definitions}
+
+        self.rewrite_option_name_edit = QLineEdit()
+        self.rewrite_option_name_edit.setPlaceholderText("Option Name")
+        self.rewrite_option_description_edit = QTextEdit()
+        self.rewrite_option_description_edit.setPlaceholderText("Option Description for AI")
+
+        rewrite_options_layout.addWidget(QLabel("Option Name:"))
+        rewrite_options_layout.addWidget(self.rewrite_option_name_edit)
+        rewrite_options_layout.addWidget(QLabel("Option Description:"))
+        rewrite_options_layout.addWidget(self.rewrite_option_description_edit)
+
+        layout.addLayout(rewrite_options_layout)
+
+        # Save settings when user changes inputs
+        self.dark_mode_checkbox.stateChanged.connect(self.save_settings)
+        self.font_scale_spinbox.valueChanged.connect(self.save_settings)
+        self.timezone_combo.currentTextChanged.connect(self.save_settings)
+
+        layout.addStretch() # Pushes all content to the top
+        self.populate_profile_list()
+        self.populate_rewrite_option_lists()
+
+    def change_font_scale(self, value):
+        self.settings["font_scale"] = value
+        self.save_settings()
+        # Restyling the whole app per spinbox tick is expensive; wait for
+        # the drag to settle
+        self._font_scale_timer.start()
+
+    def _apply_font_scale_now(self):
+        self.apply_saved_font_scale() # Re-apply font scale
+        # Cached row heights were measured with the old font
+        if hasattr(self, "rundown_delegate"):
+            self.rundown_delegate.text_height_cache.clear()
+
+    def change_timezone(self, timezone_str):
+        self.settings["timezone"] = timezone_str
+        self.save_settings()
+
+    def populate_profile_list(self):
+        self.profile_list.clear()
+        # name -> item map so mutations don't need a findItems() scan
+        self._profile_items = {}
+        for name in self.character_profiles.keys():
+            item = QListWidgetItem(name)
+            self.profile_list.addItem(item)
+            self._profile_items[name] = item
+        if self.profile_list.count() > 0:
+            self.profile_list.setCurrentRow(0)
+
+    def display_profile_details(self, current_item, previous_item):
+        if current_item:
+            profile_name = current_item.text()
+            # One probe; the keys are guaranteed by load-time normalization
+            profile = self.character_profiles[profile_name]
+            self.profile_name_edit.setText(profile_name)
+            self.profile_prompt_edit.setText(profile["prompt"])
+            self.profile_description_edit.setText(profile["description"])
+        else:
+            self.profile_name_edit.clear()
+            self.profile_prompt_edit.clear()
+            self.profile_description_edit.clear()
+
+    def add_profile(self):
+        name = self.profile_name_edit.text().strip()
+        prompt = self.profile_prompt_edit.toPlainText().strip()
+        description = self.profile_description_edit.text().strip()
+
+        if not name:
+            QMessageBox.warning(self, "Input Error", "Profile name cannot be empty.")
+            return
+
+        if name in self.character_profiles:
+            QMessageBox.warning(self, "Duplicate Profile", f"Profile '{name}' already exists. Use 'Edit Profile' to modify.")
+            return
+
+        self.character_profiles[name] = {"prompt": prompt, "description": description}
+        self.profile_tooltips[name] = description # Update tooltip cache
+        self._mark_dirty("profiles")
+        # Append just the new row instead of rebuilding the whole list
+        item = QListWidgetItem(name)
+        self.profile_list.addItem(item)
+        self._profile_items[name] = item
+        self.profile_list.setCurrentItem(item)
+
+    def edit_profile(self):
+        current_item = self.profile_list.currentItem()
+        if not current_item:
+            QMessageBox.warning(self, "Selection Error", "Please select a profile to edit.")
+            return
+
+        original_name = current_item.text()
+        new_name = self.profile_name_edit.text().strip()
+        new_prompt = self.profile_prompt_edit.toPlainText().strip()
+        new_description = self.profile_description_edit.text().strip()
+
+        if not new_name:
+            QMessageBox.warning(self, "Input Error", "Profile name cannot be empty.")
+            return
+
+        if original_name != new_name and new_name in self.character_profiles:
+            QMessageBox.warning(self, "Duplicate Profile", f"Profile '{new_name}' already exists.")
+            return
+
+        # If name changed, delete old entry and add new one
+        if original_name != new_name:
+            del self.character_profiles[original_name]
+            self.profile_tooltips.pop(original_name, None)
+
+        self.character_profiles[new_name] = {"prompt": new_prompt, "description": new_description}
+        self.profile_tooltips[new_name] = new_description
+        self._mark_dirty("profiles")
+        # Retitle the existing row in place; no list rebuild, no lost scroll
+        if original_name != new_name:
+            current_item.setText(new_name)
+            self._profile_items[new_name] = self._profile_items.pop(original_name)
+        self.profile_list.setCurrentItem(current_item)
+
+    def delete_profile(self):
+        current_item = self.profile_list.currentItem()
+        if not current_item:
+            QMessageBox.warning(self, "Selection Error", "Please select a profile to delete.")
+            return
+
+        profile_name = current_item.text()
+        reply = QMessageBox.question(self, "Delete Profile",
+                                     f"Are you sure you want to delete profile '{profile_name}'?",
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            del self.character_profiles[profile_name]
+            self.profile_tooltips.pop(profile_name, None)
+            self._mark_dirty("profiles")
+            self.profile_list.takeItem(self.profile_list.row(current_item))
+            self._profile_items.pop(profile_name, None)
+
+    def populate_rewrite_option_lists(self):
+        # name -> item maps (one per kind) so mutations skip findItems()
+        self._option_items = {"Style": {}, "Tone": {}, "Length": {}}
+
+        for kind, entry in self._rewrite_kinds.items():
+            definitions = entry["defs"]
+            list_widget = entry["list"]
+            list_widget.clear()
+            items = self._option_items[kind]
+            for name in definitions.keys():
+                item = QListWidgetItem(name)
+                list_widget.addItem(item)
+                items[name] = item
+            if list_widget.count() > 0:
+                list_widget.setCurrentRow(0)
+
+    def display_rewrite_option_details(self, option_type, list_widget):
+        current_item = list_widget.currentItem()
+        if current_item:
+            option_name = current_item.text()
+            description = self._rewrite_kinds[option_type]["defs"].get(option_name, "")
+            self.rewrite_option_name_edit.setText(option_name)
+            self.rewrite_option_description_edit.setText(description)
+        else:
+            self.rewrite_option_name_edit.clear()
+            self.rewrite_option_description_edit.clear()
+
+    def add_rewrite_option(self, option_type):
+        name = self.rewrite_option_name_edit.text().strip()
+        description = self.rewrite_option_description_edit.toPlainText().strip()
+        entry = self._rewrite_kinds[option_type]
+        definitions = entry["defs"]
+        list_widget = entry["list"]
+
+        if not name:
+            QMessageBox.warning(self, "Input Error", "Option name cannot be empty.")
+            return
+        if name in definitions:
+            QMessageBox.warning(self, "Duplicate Option", f"Option '{name}' already exists. Use 'Edit' to modify.")
+            return
+
+        definitions[name] = description
+        self._mark_dirty("rewrite_options")
+        # Append just the new row instead of rebuilding all three lists
+        item = QListWidgetItem(name)
+        list_widget.addItem(item)
+        self._option_items[option_type][name] = item
+        list_widget.setCurrentItem(item)
+
+    def edit_rewrite_option(self, option_type, list_widget):
+        current_item = list_widget.currentItem()
+        if not current_item:
+            QMessageBox.warning(self, "Selection Error", f"Please select a {option_type} option to edit.")
+            return
+
+        original_name = current_item.text()
+        new_name = self.rewrite_option_name_edit.text().strip()
+        new_description = self.rewrite_option_description_edit.toPlainText().strip()
+        definitions = self._rewrite_kinds[option_type]["defs"]
+
+        if not new_name:
+            QMessageBox.warning(self, "Input Error", "Option name cannot be empty.")
+            return
+        if original_name != new_name and new_name in definitions:
+            QMessageBox.warning(self, "Duplicate Option", f"Option '{new_name}' already exists.")
+            return
+
+        if original_name != new_name:
+            del definitions[original_name]
+        definitions[new_name] = new_description
+        self._mark_dirty("rewrite_options")
+        # Retitle the existing row in place
+        if original_name != new_name:
+            current_item.setText(new_name)
+            items = self._option_items[option_type]
+            items[new_name] = items.pop(original_name)
+        list_widget.setCurrentItem(current_item)
+
+    def delete_rewrite_option(self, option_type, list_widget):
+        current_item = list_widget.currentItem()
+        if not current_item:
+            QMessageBox.warning(self, "Selection Error", f"Please select a {option_type} option to delete.")
+            return
+
+        option_name = current_item.text()
+        reply = QMessageBox.question(self, "Delete Option",
+                                     f"Are you sure you want to delete '{option_name}'?",
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            definitions = self._rewrite_kinds[option_type]["defs"]
+            del definitions[option_name]
+            self._mark_dirty("rewrite_options")
+            list_widget.takeItem(list_widget.row(current_item))
+            self._option_items[option_type].pop(option_name, None)
+
+    def setup_feed_manager_tab(self):
+        self.feed_manager_tab = QWidget()
+        layout = QVBoxLayout(self.feed_manager_tab)
+
+        self.feed_list = QListWidget()
+        self.feed_list.currentItemChanged.connect(self.display_feed_details)
+        layout.addWidget(self.feed_list)
+
+        form_layout = QVBoxLayout()
+        self.feed_name_edit = QLineEdit()
+        self.feed_name_edit.setPlaceholderText("Feed Name")
+        self.feed_url_edit = QLineEdit()
+        self.feed_url_edit.setPlaceholderText("Feed URL")
+
+        form_layout.addWidget(QLabel("Feed Name:"))
+        form_layout.addWidget(self.feed_name_edit)
+        form_layout.addWidget(QLabel("Feed URL:"))
+        form_layout.addWidget(self.feed_url_edit)
+        layout.addLayout(form_layout)
+
+        buttons_layout = QHBoxLayout()
+        self.add_feed_button = QPushButton("Add Feed")
+        self.add_feed_button.clicked.connect(self.add_feed)
+        self.edit_feed_button = QPushButton("Edit Feed")
+        self.edit_feed_button.clicked.connect(self.edit_feed)
+        self.delete_feed_button = QPushButton("Delete Feed")
+        self.delete_feed_button.clicked.connect(self.delete_feed)
+
+        buttons_layout.addWidget(self.add_feed_button)
+        buttons_layout.addWidget(self.edit_feed_button)
+        buttons_layout.addWidget(self.delete_feed_button)
+        layout.addLayout(buttons_layout)
+
+        layout.addStretch()
+
+        self.tabs.addTab(self.feed_manager_tab, "Feed Manager")
+        self.load_feeds_from_file() # Load feeds initially
+
+    def load_feeds_from_file(self):
+        try:
+            with open(FEEDS_FILE, 'r', encoding='utf-8') as f:
+                feeds = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            feeds = [dict(f) for f in DEFAULT_FEEDS]
+            self.save_feeds_to_file(feeds) # Save defaults if file not found or invalid JSON
+
+        # Canonical in-memory feed list; mutations edit this directly instead
+        # of round-tripping through the widget and the JSON file. The name
+        # index makes duplicate checks and edits O(1) instead of list walks.
+        self._feeds = feeds
+        self._feeds_by_name = {f["name"]: f for f in feeds}
+
+        self.feed_list.clear()
+        # name -> item map so mutations don't need a findItems() scan
+        self._feed_items = {}
+        for feed in feeds:
+            item = QListWidgetItem(feed["name"])
+            item.setData(Qt.UserRole, feed["url"]) # Store URL in UserRole
+            self.feed_list.addItem(item)
+            self._feed_items[feed["name"]] = item
+        if self.feed_list.count() > 0:
+            self.feed_list.setCurrentRow(0)
+
+    def save_feeds_to_file(self, feeds):
+        try:
+            data = json.dumps(feeds, indent=4).encode('utf-8')
+            # Skip the write entirely when the file already holds these bytes
+            try:
+                with open(FEEDS_FILE, 'rb') as f:
+                    if f.read() == data:
+                        return
+            except OSError:
+                pass
+            # Write to a sibling temp file and swap it in atomically, so a
+            # crash mid-write can't leave a truncated feeds file behind
+            tmp = FEEDS_FILE + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, FEEDS_FILE)
+        except IOError as e:
+            QMessageBox.critical(self, "Save Error", f"Could not save feeds: {e}")
+
+    def display_feed_details(self, current_item, previous_item):
+        if current_item:
+            self.feed_name_edit.setText(current_item.text())
+            self.feed_url_edit.setText(current_item.data(Qt.UserRole))
+        else:
+            self.feed_name_edit.clear()
+            self.feed_url_edit.clear()
+
+    def add_feed(self):
+        name = self.feed_name_edit.text().strip()
+        url = self.feed_url_edit.text().strip()
+
+        if not name or not url:
+            QMessageBox.warning(self, "Input Error", "Feed name and URL cannot be empty.")
+            return
+
+        if name in self._feeds_by_name:
+            QMessageBox.warning(self, "Duplicate Feed", f"Feed '{name}' already exists.")
+            return
+
+        feed = {"name": name, "url": url}
+        self._feeds.append(feed)
+        self._feeds_by_name[name] = feed
+        self._mark_dirty("feeds")
+        # Append just the new row instead of re-reading the file and
+        # rebuilding the whole list
+        item = QListWidgetItem(name)
+        item.setData(Qt.UserRole, url)
+        self.feed_list.addItem(item)
+        self._feed_items[name] = item
+        self.feed_list.setCurrentItem(item) # Select new feed
+
+    def edit_feed(self):
+        current_item = self.feed_list.currentItem()
+        if not current_item:
+            QMessageBox.warning(self, "Selection Error", "Please select a feed to edit.")
+            return
+
+        original_name = current_item.text()
+        new_name = self.feed_name_edit.text().strip()
+        new_url = self.feed_url_edit.text().strip()
+
+        if not new_name or not new_url:
+            QMessageBox.warning(self, "Input Error", "Feed name and URL cannot be empty.")
+            return
+
+        if original_name != new_name and new_name in self._feeds_by_name:
+            QMessageBox.warning(self, "Duplicate Feed", f"Feed '{new_name}' already exists.")
+            return
+
+        feed = self._feeds_by_name.get(original_name)
+        if feed is not None:
+            feed["name"] = new_name
+            feed["url"] = new_url
+            if original_name != new_name:
+                self._feeds_by_name[new_name] = self._feeds_by_name.pop(original_name)
+        self._mark_dirty("feeds")
+        # Update the existing row in place
+        current_item.setText(new_name)
+        current_item.setData(Qt.UserRole, new_url)
+        if original_name != new_name:
+            self._feed_items[new_name] = self._feed_items.pop(original_name)
+        self.feed_list.setCurrentItem(current_item) # Select updated feed
+
+
+    def delete_feed(self):
+        current_item = self.feed_list.currentItem()
+        if not current_item:
+            QMessageBox.warning(self, "Selection Error", "Please select a feed to delete.")
+            return
+
+        feed_name = current_item.text()
+        reply = QMessageBox.question(self, "Delete Feed",
+                                     f"Are you sure you want to delete feed '{feed_name}'?",
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            self._feeds = [f for f in self._feeds if f["name"] != feed_name]
+            self._feeds_by_name.pop(feed_name, None)
+            self._mark_dirty("feeds")
+            self.feed_list.takeItem(self.feed_list.row(current_item))
+            self._feed_items.pop(feed_name, None)
+
+    def get_current_feeds(self):
+        return self._feeds
+
+    def setup_articles_tab(self):
+        self.articles_tab = QWidget()
+        layout = QVBoxLayout()
+
+        # Top controls
+        controls_row_top = QHBoxLayout()
+        self.slider_label = QLabel("Stories per feed: 10")
+        self.story_limit_slider = QSlider(Qt.Horizontal)
+        self.story_limit_slider.setMinimum(1)
+        self.story_limit_slider.setMaximum(50)
+        self.story_limit_slider.setValue(10)
+        self.story_limit_slider.setFixedWidth(300)
+        # Throttle the label refresh (~25 fps): setText invalidates the
+        # label's size hint, so a drag across 50 values would otherwise do a
+        # layout pass per tick. The timer reads the latest value when it
+        # fires, so the final position is always shown.
+        self._slider_label_timer = QTimer(self)
+        self._slider_label_timer.setSingleShot(True)
+        self._slider_label_timer.setInterval(40)
+        self._slider_label_timer.timeout.connect(
+            lambda: self.slider_label.setText(f"Stories per feed: {self.story_limit_slider.value()}")
+        )
+        self.story_limit_slider.valueChanged.connect(self._on_story_limit_changed)
+
+        # Add filter category dropdown here
+        filter_category_label = QLabel("Category:")
+        # self.filter_category_dropdown is initialized and populated in __init__
+        self.filter_category_dropdown.currentIndexChanged.connect(self.filter_articles) # Connect to your filtering logic
+
+        self.pull_button = QPushButton("Pull Stories")
+        self.pull_button.clicked.connect(self.pull_stories)
+
+        controls_row_top.addWidget(self.slider_label)
+        controls_row_top.addWidget(self.story_limit_slider)
+        controls_row_top.addSpacing(20) # Add some space
+        controls_row_top.addWidget(filter_category_label)
+        controls_row_top.addWidget(self.filter_category_dropdown)
+        controls_row_top.addStretch()
+        controls_row_top.addWidget(self.pull_button)
+
+        # Tree setup: a plain QTreeView over StoriesModel, so Qt only asks
+        # for data() on rows it actually paints
+        self.stories_model = StoriesModel(self)
+        # Category filtering happens in a proxy, so a dropdown change just
+        # re-evaluates row visibility instead of rebuilding anything
+        self.stories_proxy = CategoryFilterProxy(self)
+        self.stories_proxy.setSourceModel(self.stories_model)
+        self.articles_tree = QTreeView()
+        self.articles_tree.setModel(self.stories_proxy)
+        # All story rows are the same height; lets Qt skip per-row measurement
+        self.articles_tree.setUniformRowHeights(True)
+
+        self.articles_tree.setIconSize(QSize(80, 80)) # Reduces size to prevent encroaching on checkbox
+
+        self.articles_tree.setStyleSheet("""
+            QTreeView::indicator {
+                width: 20px;
+                height: 20px;
+                margin-left: 6px;
+                margin-right: 10px;
+            }
+
+            QTreeView::item {
+                min-height: 60px;
+                padding: 0px;
+            }
+
+            QTreeView::icon {
+                margin-left: 4px;
+                margin-right: 4px;
+            }
+        """)
+
+        # Let the header keep the columns sized by itself: headline stretches,
+        # source/date track their contents. No manual width math on refresh.
+        header = self.articles_tree.header()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        self.articles_tree.doubleClicked.connect(self.open_article)
+        self.articles_tree.clicked.connect(self.toggle_category_expand)
+
+        layout.addLayout(controls_row_top)
+        layout.addWidget(self.articles_tree)
+
+        # Bottom controls
+        controls_row_bottom = QHBoxLayout()
+        self.log_output = QTextEdit()
+        self.log_output.setReadOnly(True)
+        self.log_output.setFixedHeight(100)
+        layout.addWidget(QLabel("Log Output"))
+        layout.addWidget(self.log_output)
+
+        self.send_to_rundown_button = QPushButton("Send to Rundown")
+        self.send_to_rundown_button.clicked.connect(self.send_to_rundown)
+        controls_row_bottom.addStretch()
+        controls_row_bottom.addWidget(self.send_to_rundown_button)
+
+        layout.addLayout(controls_row_bottom)
+
+        self.articles_tab.setLayout(layout)
+        self.tabs.addTab(self.articles_tab, "Articles")
+
+    def _on_story_limit_changed(self, value):
+        # Coalesce: while the timer is pending, further ticks are absorbed
+        if not self._slider_label_timer.isActive():
+            self._slider_label_timer.start()
+
+    def filter_articles(self, index):
+        """
+        Filters the articles displayed in articles_tree based on the selected category.
+        """
+        selected_category = self.filter_category_dropdown.currentText()
+        # One paint for the filter swap and the recursive expand together
+        self.articles_tree.setUpdatesEnabled(False)
+        try:
+            self.stories_proxy.set_category(selected_category)
+            # Rows re-shown by a filter change come back collapsed
+            self.articles_tree.expandAll()
+        finally:
+            self.articles_tree.setUpdatesEnabled(True)
+        self.log_output.append(f"Filtering articles by: {selected_category}")
+
+    def pull_stories(self):
+        self.log_output.clear()
+        self.log_output.append("Starting to pull stories...")
+        current_feeds = self.get_current_feeds()
+        story_limit = self.story_limit_slider.value()
+
+        if not current_feeds:
+            self.log_output.append("No feeds configured. Please add feeds in the Feed Manager tab.")
+            return
+
+        # Disable the pull button while fetching
+        self.pull_button.setEnabled(False)
+        self.pull_button.setText("Pulling...")
+
+        worker = PullStoriesWorker(current_feeds, story_limit, self.log_output)
+        worker.signals.stories_ready.connect(self.on_stories_ready)
+        # A real connection delivers queued, so pool-thread log lines land
+        # on the GUI thread instead of mutating the QTextEdit directly
+        worker.signals.log_message.connect(self.log_output.append)
+        self.threadpool.start(worker)
+
+    def on_stories_ready(self, results):
+        # Merge the per-feed results into the category buckets here on the
+        # main thread; the worker threads only ever produce their own tuple
+        merged = defaultdict(list)
+        for feed_name, category, stories in results:
+            merged[category].extend(stories)
+        self.display_stories(merged)
+
+    def display_stories(self, all_stories):
+        self.all_pulled_stories = all_stories # Store all stories for filtering later
+
+        # Create a mapping for category sorting order
+        category_order = {
+            "All": 0, "Technology": 1, "Sports": 2, "Politics": 3, "World News": 4,
+            "Business": 5, "Entertainment": 6, "Other": 7
+        }
+
+        # One model reset replaces all the per-item widget construction; the
+        # view then pulls data (and icons) lazily for the rows it shows.
+        # Suppress painting until the reset and the expandAll have both
+        # settled so the viewport redraws once, not once per step.
+        self.articles_tree.setUpdatesEnabled(False)
+        try:
+            self.stories_model.load(
+                all_stories,
+                category_key=lambda x: (category_order.get(x, len(category_order)), x),
+            )
+            self.articles_tree.expandAll()
+        finally:
+            self.articles_tree.setUpdatesEnabled(True)
+
+        # Kick off downloads for images we don't have yet; the GUI thread
+        # only enqueues workers, and each finished image repaints its rows.
+        # Bind the loop-invariant lookups once — this runs per story.
+        seen = set()
+        has_icon = self.stories_model.has_icon
+        start_worker = self.threadpool.start
+        on_ready = self._on_image_ready
+        for stories in all_stories.values():
+            for story_data in stories:
+                url = story_data.get("image_url")
+                if url and url not in seen and not has_icon(url) and not _cached_image(url):
+                    seen.add(url)
+                    worker = ImageFetchWorker(url)
+                    worker.signals.done.connect(on_ready)
+                    start_worker(worker)
+
+        self.log_output.append("Stories pulled successfully.")
+        self.pull_button.setEnabled(True)
+        self.pull_button.setText("Pull Stories")
+
+
+    def _on_image_ready(self, url, path):
+        if path:
+            self.stories_model.set_icon(url, QIcon(path))
+
+    def open_article(self, index):
+        if index.parent().isValid(): # Only open if it's a child (actual article)
+            story_data = index.data(Qt.UserRole)
+            if story_data and story_data["link"] and story_data["link"] != '#':
+                QDesktopServices.openUrl(QUrl(story_data["link"]))
+
+    def toggle_category_expand(self, index):
+        # This handles clicks on both category headers and article items
+        if not index.parent().isValid(): # It's a category header
+            self.articles_tree.setExpanded(index, not self.articles_tree.isExpanded(index))
+
+    def send_to_rundown(self):
+        selected_stories = self.stories_model.checked_stories()
+        for story_data in selected_stories:
+            # Add unique ID if not present. Use a keyed hash so the id is
+            # stable across runs — builtin hash() is salted per process, so
+            # ids minted with it would never match a saved rundown.
+            if "id" not in story_data:
+                h = hashlib.blake2b(digest_size=8)
+                h.update(story_data["link"].encode("utf-8"))
+                h.update(b"\0")  # Separator so link/title boundaries can't collide
+                h.update(story_data["title"].encode("utf-8"))
+                story_data["id"] = h.hexdigest()
+
+        if not selected_stories:
+            QMessageBox.warning(self, "No Selection", "Please select at least one article to send to rundown.")
+            return
+
+        current_rundown_items = self.get_rundown_items()
+        # Precompute membership sets so each duplicate check is O(1) instead
+        # of rescanning the whole rundown for every selected story
+        existing_links = {r.get("link") for r in current_rundown_items if r.get("link")}
+        existing_ids = {r.get("id") for r in current_rundown_items if r.get("id")}
+        new_items_added = 0
+        added_stories = []
+        for story in selected_stories:
+            # Check if item already exists in rundown by link or a unique ID
+            exists = story.get("link") in existing_links or story.get("id") in existing_ids
+            if not exists:
+                # Copy the story and add rundown defaults in one dict-literal
+                # merge instead of nine separate key assignments
+                story_for_rundown = {
+                    **story,
+                    "duration": "00:30", # Default 30 seconds
+                    "order": len(current_rundown_items), # Sequential order
+                    "backtime": "", # Will be calculated
+                    "active": True, # Default active
+                    "teleprompter_text": story["summary"], # Initial teleprompter text
+                    "profile": "Default Narrator", # Default profile
+                    "style": "Standard",
+                    "tone": "Objective",
+                    "length": "Standard",
+                }
+                current_rundown_items.append(story_for_rundown)
+                added_stories.append(story_for_rundown)
+                if story_for_rundown.get("link"):
+                    existing_links.add(story_for_rundown["link"])
+                if story_for_rundown.get("id"):
+                    existing_ids.add(story_for_rundown["id"])
+                new_items_added += 1
+
+        if new_items_added > 0:
+            # Only the new rows get built; the existing tree rows are reused
+            self._append_rundown_rows(added_stories)
+            self.calculate_backtimes() # Recalculate after adding
+            QMessageBox.information(self, "Sent to Rundown", f"{new_items_added} new articles sent to Rundown tab.")
+            self.tabs.setCurrentWidget(self.rundown_tab) # Switch to rundown tab
+        else:
+            QMessageBox.information(self, "No New Articles", "All selected articles are already in the rundown.")
+
+    def setup_rundown_tab(self):
+        self.rundown_tab = QWidget()
+        layout = QVBoxLayout(self.rundown_tab)
+
+        # Controls row
+        controls_row = QHBoxLayout()
+        self.new_rundown_button = QPushButton("New Rundown")
+        self.new_rundown_button.clicked.connect(self.new_rundown)
+        self.load_rundown_button = QPushButton("Load Rundown")
+        self.load_rundown_button.clicked.connect(self.load_rundown)
+        self.save_rundown_button = QPushButton("Save Rundown")
+        self.save_rundown_button.clicked.connect(self.save_rundown)
+        self.save_rundown_as_button = QPushButton("Save Rundown As...")
+        self.save_rundown_as_button.clicked.connect(self.save_rundown_as)
+
+        controls_row.addWidget(self.new_rundown_button)
+        controls_row.addWidget(self.load_rundown_button)
+        controls_row.addWidget(self.save_rundown_button)
+        controls_row.addWidget(self.save_rundown_as_button)
+        controls_row.addStretch() # Pushes buttons to the left
+
+        # Add rundown clock display
+        self.rundown_clock_label = QLabel("Backtime: --:--:--")
+        # One constructed QFont instead of copy+mutate; fall back to a fixed
+        # size when the base font is pixel-sized (pointSize() returns -1)
+        base_point_size = self.font().pointSize()
+        clock_point_size = base_point_size + 10 if base_point_size > 0 else 24
+        self.rundown_clock_label.setFont(QFont(self.font().family(), clock_point_size, QFont.Bold))
+        self.rundown_clock_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        controls_row.addWidget(self.rundown_clock_label)
+
+        layout.addLayout(controls_row)
+
+        # Rundown Tree setup
+        # Keep the canonical list's order in step with drag-and-drop moves
+        self.rundown_tree = RundownTreeWidget(on_reorder=self._sync_rundown_order)
+        self.rundown_tree.setColumnCount(6)
+        self.rundown_tree.setHeaderLabels(["Title", "Source", "Duration", "Backtime", "Character", "Active"])
+        # Configure the header once: the title column absorbs window resizes
+        # and the narrow columns track their content, so repopulating the
+        # tree never has to recompute pixel widths (same as the articles tab)
+        rundown_header = self.rundown_tree.header()
+        rundown_header.setSectionResizeMode(0, QHeaderView.Stretch) # Title
+        for col in (1, 2, 3, 4, 5): # Source/Duration/Backtime/Character/Active
+            rundown_header.setSectionResizeMode(col, QHeaderView.ResizeToContents)
+        self.rundown_tree.setDragDropMode(QAbstractItemView.InternalMove) # Enable drag-and-drop reordering
+        self.rundown_tree.setDropIndicatorShown(True)
+        self.rundown_tree.itemChanged.connect(self.handle_rundown_item_changed)
+        self.rundown_tree.currentItemChanged.connect(self.on_rundown_item_selected)
+        self.rundown_tree.customContextMenuRequested.connect(self.show_rundown_context_menu)
+        self.rundown_tree.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.rundown_tree.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked)
+
+        self.rundown_delegate = RundownItemDelegate(self, self.rundown_tree)
+        self.rundown_tree.setItemDelegateForColumn(0, self.rundown_delegate) # For multiline title
+        self.rundown_tree.setItemDelegateForColumn(2, self.rundown_delegate) # For duration validation
+        self.rundown_tree.setItemDelegateForColumn(3, self.rundown_delegate) # For time editing
+
+        layout.addWidget(self.rundown_tree)
+
+        # Teleprompter and Rewrite section
+        teleprompter_rewrite_layout = QHBoxLayout()
+
+        # Teleprompter controls
+        teleprompter_layout = QVBoxLayout()
+        teleprompter_layout.addWidget(QLabel("<h2>Teleprompter</h2>"))
+        # self.teleprompter_text_edit is already initialized in __init__
+        teleprompter_layout.addWidget(self.teleprompter_text_edit)
+
+        teleprompter_controls_layout = QHBoxLayout()
+        self.select_character_combo = QComboBox()
+        self.select_character_combo.setToolTip("Select a character profile for rewriting.")
+        self.select_character_combo.currentTextChanged.connect(self.on_character_changed)
+        teleprompter_controls_layout.addWidget(QLabel("Character:"))
+        teleprompter_controls_layout.addWidget(self.select_character_combo)
+
+        self.apply_to_teleprompter_button = QPushButton("Apply to Teleprompter")
+        self.apply_to_teleprompter_button.clicked.connect(self.apply_teleprompter_text)
+        teleprompter_controls_layout.addWidget(self.apply_to_teleprompter_button)
+        teleprompter_controls_layout.addStretch()
+        teleprompter_layout.addLayout(teleprompter_controls_layout)
+
+        teleprompter_rewrite_layout.addLayout(teleprompter_layout)
+
+
+        # Rewrite controls
+        rewrite_options_widget = QWidget()
+        rewrite_options_layout = QVBoxLayout(rewrite_options_widget)
+        rewrite_options_layout.addWidget(QLabel("<h2>Rewrite Options</h2>"))
+
+        # Style
+        style_layout = QHBoxLayout()
+        self.style_combo = QComboBox()
+        self.style_combo.setToolTip("Select a rewriting style.")
+        style_layout.addWidget(QLabel("Style:"))
+        style_layout.addWidget(self.style_combo)
+        style_layout.addStretch()
+        rewrite_options_layout.addLayout(style_layout)
+
+        # Tone
+        tone_layout = QHBoxLayout()
+        self.tone_combo = QComboBox()
+        self.tone_combo.setToolTip("Select a rewriting tone.")
+        tone_layout.addWidget(QLabel("Tone:"))
+        tone_layout.addWidget(self.tone_combo)
+        tone_layout.addStretch()
+        rewrite_options_layout.addLayout(tone_layout)
+
+        # Length
+        length_layout = QHBoxLayout()
+        self.length_combo = QComboBox()
+        self.length_combo.setToolTip("Select desired length.")
+        length_layout.addWidget(QLabel("Length:"))
+        length_layout.addWidget(self.length_combo)
+        length_layout.addStretch()
+        rewrite_options_layout.addLayout(length_layout)
+
+        self.rewrite_button = QPushButton("Rewrite Selected")
+        self.rewrite_button.clicked.connect(self.rewrite_selected_article)
+        rewrite_options_layout.addWidget(self.rewrite_button)
+        rewrite_options_layout.addStretch() # Pushes content to the top
+
+        teleprompter_rewrite_layout.addWidget(rewrite_options_widget)
+
+        layout.addLayout(teleprompter_rewrite_layout)
+
+        self.tabs.addTab(self.rundown_tab, "Rundown")
+        self.load_rundown() # Load default or last rundown
+        self.populate_character_dropdown()
+        self.populate_rewrite_dropdowns()
+
+        # Hook up the rewrite combos once, after their initial fill, so
+        # programmatic addItem calls never reach the slots
+        self.style_combo.currentTextChanged.connect(lambda text: self.update_selected_item_rewrite_option("style", text))
+        self.tone_combo.currentTextChanged.connect(lambda text: self.update_selected_item_rewrite_option("tone", text))
+        self.length_combo.currentTextChanged.connect(lambda text: self.update_selected_item_rewrite_option("length", text))
+
+        # Timer for backtime calculation
+        self.backtime_timer = QTimer(self)
+        self.backtime_timer.setInterval(1000) # Update every second
+        self.backtime_timer.timeout.connect(self.update_backtime_clock)
+        self.backtime_timer.start()
+
+    def new_rundown(self):
+        reply = QMessageBox.question(self, "New Rundown",
+                                     "Create a new, empty rundown? Any unsaved changes will be lost.",
+                                     QMessageBox.Yes | QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            self.update_rundown_tree([])
+            self.current_rundown_filename = None
+            self.statusBar().showMessage("New rundown created.")
+            self.calculate_backtimes() # Recalculate for empty rundown
+            self.teleprompter_text_edit.clear()
+
+    def load_rundown(self):
+        filename, _ = QFileDialog.getOpenFileName(self, "Load Rundown", "", "Rundown Files (*.json);;All Files (*)")
+        if filename:
+            try:
+                with open(filename, 'rb') as f:
+                    raw = f.read()
+                if orjson is not None:
+                    rundown_data = orjson.loads(raw)
+                else:
+                    rundown_data = json.loads(raw)
+                self.update_rundown_tree(rundown_data)
+                self.current_rundown_filename = filename
+                self.statusBar().showMessage(f"Rundown loaded from {os.path.basename(filename)}")
+                self.calculate_backtimes()
+                self.teleprompter_text_edit.clear()
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Could not load rundown: {e}")
+
+    def save_rundown(self):
+        if self.current_rundown_filename:
+            self._save_rundown_to_file(self.current_rundown_filename)
+        else:
+            self.save_rundown_as()
+
+    def save_rundown_as(self):
+        filename, _ = QFileDialog.getSaveFileName(self, "Save Rundown As", "", "Rundown Files (*.json);;All Files (*)")
+        if filename:
+            if not filename.lower().endswith(".json"):
+                filename += ".json"
+            self._save_rundown_to_file(filename)
+            self.current_rundown_filename = filename
+
+    def _save_rundown_to_file(self, filename):
+        try:
+            # Underscored keys are view-side caches (parsed durations), not
+            # rundown data; keep them out of the saved file
+            rundown_data = [
+                {k: v for k, v in story.items() if not k.startswith("_")}
+                for story in self.get_rundown_items()
+            ]
+            # Encode once, write once — avoids the many small writes json.dump issues
+            if orjson is not None:
+                payload = orjson.dumps(rundown_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(rundown_data, indent=2).encode("utf-8")
+            with open(filename, 'wb') as f:
+                f.write(payload)
+            self.statusBar().showMessage(f"Rundown saved to {os.path.basename(filename)}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Could not save rundown: {e}")
+
+    def get_rundown_items(self):
+        # handle_rundown_item_changed and calculate_backtimes keep the story
+        # dicts current as edits happen, so no tree walk is needed here
+        return self._rundown_items
+
+    def _sync_rundown_order(self, *args):
+        # Drag-and-drop (InternalMove) reorders the tree behind our back;
+        # re-derive list order from the view's UserRole pointers
+        tree = self.rundown_tree
+        reordered = []
+        for i in range(tree.topLevelItemCount()):
+            story_data = tree.topLevelItem(i).data(0, Qt.UserRole)
+            if story_data:
+                reordered.append(story_data)
+        self._rundown_items = reordered
+        # Row order changed, so the cached per-row datetimes are stale
+        self._backtime_datetimes = []
+        self._rundown_dirty = True
+        self._schedule_backtimes()
+
+    def _build_rundown_rows(self, rundown_data):
+        """Build detached tree rows for rundown_data; callers attach them."""
+        # Bind the loop-invariant lookups once — this runs per rundown row
+        checked, unchecked = Qt.Checked, Qt.Unchecked
+        user_role = Qt.UserRole
+        extra_flags = Qt.ItemIsEditable | Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled
+        tooltip_for = self.profile_tooltips.__getitem__
+        parse_duration = NewsAggregatorApp.parse_duration_string
+        items = []
+        for story_data in rundown_data:
+            duration_str = story_data.get("duration", "00:00")
+            profile_name = story_data.get("profile", "Default Narrator")
+            item = QTreeWidgetItem()
+            item.setText(0, story_data["title"])
+            item.setText(1, story_data["source"])
+            item.setText(2, duration_str)
+            item.setText(3, story_data.get("backtime", "00:00 AM")) # Placeholder
+            item.setText(4, profile_name)
+            item.setCheckState(5, checked if story_data.get("active", True) else unchecked)
+            item.setData(0, user_role, story_data) # Store full data
+            # Cache the parsed duration so backtime passes skip the string parse
+            story_data["_duration_seconds"] = parse_duration(duration_str)
+
+            item.setFlags(item.flags() | extra_flags)
+
+            # Set a tooltip for the character column
+            item.setToolTip(4, tooltip_for(profile_name))
+            items.append(item)
+        return items
+
+    def _append_rundown_rows(self, new_stories):
+        # Incremental append: existing rows stay untouched instead of the
+        # whole tree being cleared and rebuilt
+        tree = self.rundown_tree
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        try:
+            tree.addTopLevelItems(self._build_rundown_rows(new_stories))
+        finally:
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
+
+    def update_rundown_tree(self, rundown_data):
+        self._rundown_items = list(rundown_data)
+        tree = self.rundown_tree
+        # Batch the rebuild: detached items don't trigger per-cell relayout,
+        # and blocked signals keep every setText from firing itemChanged
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        try:
+            tree.clear()
+            tree.addTopLevelItems(self._build_rundown_rows(rundown_data)) # One insertion
+            tree.expandAll()
+        finally:
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
+
+
+    def handle_rundown_item_changed(self, item, column):
+        story_data = item.data(0, Qt.UserRole)
+        if story_data:
+            self._rundown_dirty = True
+            if column == 2: # Duration changed
+                new_duration_str = item.text(2)
+                story_data["duration"] = new_duration_str
+                # Refresh the cached seconds so calculate_backtimes doesn't reparse
+                old_seconds = story_data.get("_duration_seconds")
+                new_seconds = NewsAggregatorApp.parse_duration_string(new_duration_str)
+                story_data["_duration_seconds"] = new_seconds
+                if story_data.get("active", True):
+                    # Single-row edit: shift rows 0..k rather than redo all N
+                    if old_seconds is None or new_seconds is None \
+                            or not self._shift_backtimes(item, new_seconds - old_seconds):
+                        self._schedule_backtimes()
+            elif column == 3: # Backtime edited directly
+                story_data["backtime"] = item.text(3)
+                self._cached_target_str = None # Force the clock to reparse
+                self._schedule_backtimes()
+            elif column == 4: # Character changed
+                new_profile = item.text(4)
+                story_data["profile"] = new_profile
+                tooltip = self.profile_tooltips[new_profile]
+                item.setToolTip(4, tooltip) # Update tooltip
+            elif column == 5: # Active checkbox changed
+                was_active = story_data.get("active", True)
+                is_active = item.checkState(5) == Qt.Checked
+                story_data["active"] = is_active
+                if was_active != is_active:
+                    seconds = story_data.get("_duration_seconds")
+                    if seconds is None:
+                        self._schedule_backtimes()
+                    else:
+                        # Activating adds the row's seconds; deactivating removes them
+                        delta = seconds if is_active else -seconds
+                        if not self._shift_backtimes(item, delta):
+                            self._schedule_backtimes()
+            elif column == 0: # Title changed (if edited directly)
+                story_data["title"] = item.text(0)
+
+            # Recalculate item height for multiline if column 0 changed
+            if column == 0:
+                self.rundown_delegate.text_height_cache.clear() # Clear cache for recalculation
+                self.rundown_tree.setRowHeight(self.rundown_tree.indexOfTopLevelItem(item), self.rundown_delegate.sizeHint(self.rundown_tree.viewOptions(), item.index()).height())
+
+
+    def _schedule_backtimes(self):
+        # Coalesce bursts of edits into one recalculation per event-loop
+        # tick, the same trick the debounced settings writer uses
+        if not self._backtime_pending:
+            self._backtime_pending = True
+            QTimer.singleShot(0, self._run_backtimes)
+
+    def _run_backtimes(self):
+        self._backtime_pending = False
+        self.calculate_backtimes()
+
+    def _shift_backtimes(self, item, delta_seconds):
+        """Apply a single-row duration delta incrementally.
+
+        A backtime only depends on the durations at and after its row, so a
+        change of delta seconds at row k just shifts rows 0..k by -delta.
+        Returns False when the cached datetimes can't be trusted and the
+        caller should fall back to a full recalculation.
+        """
+        tree = self.rundown_tree
+        dts = self._backtime_datetimes
+        row = tree.indexOfTopLevelItem(item)
+        if row < 0 or len(dts) != tree.topLevelItemCount():
+            return False
+        if delta_seconds == 0:
+            return True
+
+        shift = timedelta(seconds=delta_seconds)
+        user_role = Qt.UserRole
+        tree.blockSignals(True)
+        try:
+            for i in range(row + 1):
+                dts[i] -= shift
+                backtime_str = dts[i].strftime("%I:%M %p")
+                shifted = tree.topLevelItem(i)
+                shifted.setText(3, backtime_str)
+                story_data = shifted.data(0, user_role)
+                if story_data:
+                    story_data["backtime"] = backtime_str
+        finally:
+            tree.blockSignals(False)
+
+        self.rundown_clock_label.setText(f"Backtime: {dts[0].strftime('%I:%M:%S %p')}")
+        self._cached_target_str = None # Row 0 moved; clock must reparse
+        self._rundown_dirty = False # Incremental shift left rows consistent
+        return True
+
+    def calculate_backtimes(self):
+        if self._recalculating_backtimes:
+            return # Prevent re-entry
+
+        self._recalculating_backtimes = True
+        try:
+            # Hoist per-item lookups out of the walk below
+            tree = self.rundown_tree
+            top_level_item = tree.topLevelItem
+            item_count = tree.topLevelItemCount()
+            user_role = Qt.UserRole
+            parse_duration = NewsAggregatorApp.parse_duration_string
+
+            # Get current time for backtime calculation reference
+            now = datetime.now()
+            # If a backtime has been set for the last item, use that as the show's end time
+            last_item_backtime_str = ""
+            if item_count > 0:
+                last_item_backtime_str = top_level_item(item_count - 1).text(3) # Get last item's backtime
+
+            show_end_time = None
+            if last_item_backtime_str:
+                parsed_time = NewsAggregatorApp.parse_backtime_string(last_item_backtime_str)
+                if parsed_time:
+                    # Construct datetime for today with the parsed time
+                    show_end_time = datetime(now.year, now.month, now.day,
+                                             parsed_time.hour, parsed_time.minute, parsed_time.second)
+                    # If the parsed time is in the past compared to now, assume it's for tomorrow
+                    if show_end_time < now and (now - show_end_time).total_seconds() > 3600: # More than 1 hour difference
+                        show_end_time += timedelta(days=1)
+                else:
+                    self.log_output.append(f"Invalid backtime format for last item: {last_item_backtime_str}")
+
+            if show_end_time is None:
+                # Default: Show ends in the near future (e.g., 30 minutes from now, rounded to nearest minute)
+                show_end_time = now + timedelta(minutes=30)
+                show_end_time = show_end_time.replace(second=0, microsecond=0) # Round to nearest minute
+
+            current_time = show_end_time
+            # Single reverse walk assigns every backtime; cached seconds from
+            # update_rundown_tree/handle_rundown_item_changed avoid reparsing.
+            # Signals stay blocked so the setText writes below can't re-fire
+            # itemChanged for every row.
+            tree.blockSignals(True)
+            backtime_dts = [None] * item_count
+            for i in range(item_count - 1, -1, -1):
+                item = top_level_item(i)
+                story_data = item.data(0, user_role)
+
+                duration_seconds = 0
+                if story_data and story_data.get("active", True):
+                    seconds = story_data.get("_duration_seconds")
+                    if seconds is None:
+                        seconds = parse_duration(item.text(2))
+                        story_data["_duration_seconds"] = seconds
+                    if seconds is not None:
+                        duration_seconds = seconds
+                    else:
+                        self.log_output.append(f"Invalid duration format for '{item.text(0)}': {item.text(2)}")
+
+                current_time -= timedelta(seconds=duration_seconds)
+                backtime_dts[i] = current_time
+                backtime_str = current_time.strftime("%I:%M %p") # Format as HH:MM AM/PM
+                item.setText(3, backtime_str)
+                if story_data:
+                    story_data["backtime"] = backtime_str # Keep canonical dict current
+            self._backtime_datetimes = backtime_dts
+
+            # Update the main rundown clock display
+            self.rundown_clock_label.setText(f"Backtime: {current_time.strftime('%I:%M:%S %p')}")
+
+            # Backtime texts were rewritten; make the clock re-derive its target
+            self._cached_target_str = None
+            self._rundown_dirty = False # Everything is consistent again
+
+        finally:
+            self.rundown_tree.blockSignals(False)
+            self._recalculating_backtimes = False # Allow re-entry
+
+    def _target_datetime_from(self, bt_str):
+        """Resolve a backtime string to today's (or tomorrow's) datetime."""
+        parsed_time = NewsAggregatorApp.parse_backtime_string(bt_str)
+        if not parsed_time:
+            return None
+        now = datetime.now()
+        # Construct datetime for today with the parsed time
+        target_datetime = datetime(now.year, now.month, now.day,
+                                   parsed_time.hour, parsed_time.minute, parsed_time.second)
+        # If the target time is in the past, assume it's for tomorrow
+        if target_datetime < now and (now - target_datetime).total_seconds() > 3600: # More than 1 hour difference
+            target_datetime += timedelta(days=1)
+        return target_datetime
+
+    def update_backtime_clock(self):
+        if self.rundown_tree.topLevelItemCount() == 0:
+            self.rundown_clock_label.setText("Backtime: --:--:--") # No items, no backtime
+            return
+
+        # The target only moves when the first item's backtime text does, so
+        # each timer tick is normally just a subtraction and a divmod
+        first_item_backtime_str = self.rundown_tree.topLevelItem(0).text(3)
+        if first_item_backtime_str != self._cached_target_str:
+            self._cached_target_str = first_item_backtime_str
+            self._cached_target_datetime = self._target_datetime_from(first_item_backtime_str)
+
+        target_datetime = self._cached_target_datetime
+        if target_datetime is None:
+            self.rundown_clock_label.setText("Backtime: --:--:--")
+            return
+
+        total_seconds = int((target_datetime - datetime.now()).total_seconds())
+        if total_seconds < 0:
+            display_text = "Show Over"
+        else:
+            hours, remainder = divmod(total_seconds, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            display_text = f"Show Starts In: {hours:02}:{minutes:02}:{seconds:02}"
+        self.rundown_clock_label.setText(display_text)
+
+    def show_rundown_context_menu(self, position):
+        item = self.rundown_tree.itemAt(position)
+        if not item:
+            return
+
+        # The menu is built lazily and cached; rebuild only when the
+        # profile/option names it was built from have actually changed
+        signature = (tuple(self.character_profiles), tuple(self.style_definitions),
+                     tuple(self.tone_definitions), tuple(self.length_definitions))
+        if self._rundown_menu is None or signature != self._rundown_menu_signature:
+            self._build_rundown_menu()
+            self._rundown_menu_signature = signature
+
+        # Slots read the right-clicked item from here instead of binding it
+        # into freshly built lambdas on every right-click
+        self._context_item = item
+        self._rundown_menu.exec(self.rundown_tree.mapToGlobal(position))
+
+    def _build_rundown_menu(self):
+        menu = QMenu(self)
+
+        move_up_action = QAction("Move Up", self)
+        move_up_action.triggered.connect(lambda: self.move_rundown_item(self._context_item, -1))
+        menu.addAction(move_up_action)
+
+        move_down_action = QAction("Move Down", self)
+        move_down_action.triggered.connect(lambda: self.move_rundown_item(self._context_item, 1))
+        menu.addAction(move_down_action)
+
+        delete_action = QAction("Delete Item", self)
+        delete_action.triggered.connect(lambda: self.delete_rundown_item(self._context_item))
+        menu.addAction(delete_action)
+
+        # --- Rewrite Options Submenu ---
+        rewrite_menu = menu.addMenu("Rewrite Teleprompter Text")
+
+        # Character Profile submenu
+        character_menu = rewrite_menu.addMenu("Character Profile")
+        for profile_name in self.character_profiles.keys():
+            action = QAction(profile_name, self)
+            action.setToolTip(self.profile_tooltips.get(profile_name, ""))
+            action.triggered.connect(lambda checked, p=profile_name: self.set_item_profile(self._context_item, p))
+            character_menu.addAction(action)
+
+        # Style/Tone/Length submenus share one build loop
+        for label, option_type, definitions in (("Style", "style", self.style_definitions),
+                                                ("Tone", "tone", self.tone_definitions),
+                                                ("Length", "length", self.length_definitions)):
+            submenu = rewrite_menu.addMenu(label)
+            for name, desc in definitions.items():
+                action = QAction(name, self)
+                action.setToolTip(desc)
+                action.triggered.connect(lambda checked, t=option_type, n=name: self.set_item_rewrite_option(self._context_item, t, n))
+                submenu.addAction(action)
+
+        # Separator for rewrite action
+        rewrite_menu.addSeparator()
+        rewrite_selected_action = QAction("Generate Rewritten Text", self)
+        rewrite_selected_action.triggered.connect(lambda: self.rewrite_selected_article(self._context_item))
+        rewrite_menu.addAction(rewrite_selected_action)
+
+        # --- Open Original Article ---
+        open_original_action = QAction("Open Original Article", self)
+        open_original_action.triggered.connect(self._open_context_article)
+        menu.addAction(open_original_action)
+
+        self._rundown_menu = menu
+
+    def _open_context_article(self):
+        item = self._context_item
+        if item:
+            story_data = item.data(0, Qt.UserRole)
+            if story_data and story_data.get("link") and story_data["link"] != '#':
+                QDesktopServices.openUrl(QUrl(story_data["link"]))
+
+    def set_item_profile(self, item, profile_name):
+        story_data = item.data(0, Qt.UserRole)
+        if story_data:
+            story_data["profile"] = profile_name
+            item.setText(4, profile_name) # Update displayed character
+            tooltip = self.profile_tooltips[profile_name]
+            item.setToolTip(4, tooltip) # Update tooltip
+
+    def set_item_rewrite_option(self, item, option_type, option_name):
+        story_data = item.data(0, Qt.UserRole)
+        if story_data:
+            story_data[option_type] = option_name
+            # Optionally update UI if you decide to display these settings directly in the tree
+
+    def move_rundown_item(self, item, direction):
+        current_row = self.rundown_tree.indexOfTopLevelItem(item)
+        new_row = current_row + direction
+
+        if 0 <= new_row < self.rundown_tree.topLevelItemCount():
+            # takeTopLevelItem detaches the item, so it can be re-inserted
+            # as-is — text, flags, tooltips and UserRole data all survive
+            taken = self.rundown_tree.takeTopLevelItem(current_row)
+            self.rundown_tree.insertTopLevelItem(new_row, taken)
+            self.rundown_tree.setCurrentItem(taken) # Select the moved item
+            # Mirror the move in the canonical list
+            self._rundown_items.insert(new_row, self._rundown_items.pop(current_row))
+            self.calculate_backtimes() # Recalculate backtimes after reordering
+
+    def delete_rundown_item(self, item):
+        reply = QMessageBox.question(self, "Delete Rundown Item",
+                                     f"Are you sure you want to delete '{item.text(0)}' from the rundown?",
+                                     QMessageBox.Yes | QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            row = self.rundown_tree.indexOfTopLevelItem(item)
+            root = self.rundown_tree.invisibleRootItem()
+            root.removeChild(item)
+            if 0 <= row < len(self._rundown_items):
+                del self._rundown_items[row]
+            self.calculate_backtimes() # Recalculate backtimes after deletion
+            self.teleprompter_text_edit.clear() # Clear teleprompter if deleted item was selected
+
+    def on_tab_changed(self, index):
+        # Only recalculate when something actually changed since the last
+        # pass; reference flips between tabs stay instant
+        if self.tabs.widget(index) is self.rundown_tab and self._rundown_dirty:
+            self.calculate_backtimes() # Recalculate when rundown tab is shown
+
+    def populate_character_dropdown(self):
+        combo = self.select_character_combo
+        # Block signals for the whole refill so clear/addItem/setCurrentText
+        # can't fire on_character_changed with transient values
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            for i, name in enumerate(self.character_profiles.keys()):
+                combo.addItem(name)
+                # Tooltip per row; the row just added is index i
+                combo.setItemData(i, self.profile_tooltips.get(name, ""), Qt.ToolTipRole)
+            # Select the profile of the currently selected rundown item if available
+            current_item = self.rundown_tree.currentItem()
+            if current_item:
+                story_data = current_item.data(0, Qt.UserRole)
+                if story_data and "profile" in story_data:
+                    combo.setCurrentText(story_data["profile"])
+        finally:
+            combo.blockSignals(False)
+
+
+    def on_character_changed(self, profile_name):
+        current_item = self.rundown_tree.currentItem()
+        if current_item:
+            story_data = current_item.data(0, Qt.UserRole)
+            if story_data:
+                story_data["profile"] = sys.intern(profile_name)
+                # self.update_rundown_tree_item(current_item, story_data) # Update tree item if needed
+
+    def populate_rewrite_dropdowns(self):
+        # Silent refill: no currentTextChanged per addItem, and no stale
+        # connection piling up on repeat calls (hookup lives in setup)
+        for combo, definitions in ((self.style_combo, self.style_definitions),
+                                   (self.tone_combo, self.tone_definitions),
+                                   (self.length_combo, self.length_definitions)):
+            combo.blockSignals(True)
+            try:
+                combo.clear()
+                for i, (name, desc) in enumerate(definitions.items()):
+                    combo.addItem(name)
+                    combo.setItemData(i, desc, Qt.ToolTipRole)
+            finally:
+                combo.blockSignals(False)
+
+        # Update dropdowns based on currently selected item in rundown_tree
+        self.on_rundown_item_selected(self.rundown_tree.currentItem(), None)
+
+
+    def update_selected_item_rewrite_option(self, option_type, option_name):
+        current_item = self.rundown_tree.currentItem()
+        if current_item:
+            story_data = current_item.data(0, Qt.UserRole)
+            if story_data:
+                # Combo text is a fresh str; intern so later lookups against
+                # the interned definition keys compare by pointer
+                story_data[option_type] = sys.intern(option_name)
+                # self.update_rundown_tree_item(current_item, story_data) # If you want to update tree display
+
+    def rewrite_selected_article(self, item=None):
+        if not item: # Called from button, get current selection
+            item = self.rundown_tree.currentItem()
+
+        if not item:
+            QMessageBox.warning(self, "No Article Selected", "Please select an article in the rundown to rewrite.")
+            return
+
+        story_data = item.data(0, Qt.UserRole)
+        if not story_data:
+            QMessageBox.warning(self, "Error", "Selected item has no story data.")
+            return
+
+        original_summary = story_data.get("original_summary", story_data.get("summary", "No summary available."))
+        selected_profile_name = story_data.get("profile", self.select_character_combo.currentText())
+        selected_style_name = story_data.get("style", self.style_combo.currentText())
+        selected_tone_name = story_data.get("tone", self.tone_combo.currentText())
+        selected_length_name = story_data.get("length", self.length_combo.currentText())
+
+        # The combined prompt prefix only depends on the four selection
+        # names, so batch rewrites with one selection build it exactly once
+        prefix_key = (selected_profile_name, selected_style_name, selected_tone_name, selected_length_name)
+        prompt_prefix = self._prompt_prefix_cache.get(prefix_key)
+        if prompt_prefix is None:
+            table = self._prompt_table
+            parts = (table.get(("profile", selected_profile_name), DEFAULT_PROMPT),
+                     table.get(("style", selected_style_name), ""),
+                     table.get(("tone", selected_tone_name), ""),
+                     table.get(("length", selected_length_name), ""))
+            # join pre-sizes the result and skipping empties avoids the
+            # doubled spaces the old f-string left behind
+            prompt_prefix = " ".join(p for p in parts if p)
+            self._prompt_prefix_cache[prefix_key] = prompt_prefix
+
+        # Construct a combined prompt for the AI (replace with actual AI call)
+        ai_prompt = prompt_prefix + "\nRewrite the following news summary: " + original_summary
+
+        # Simulate AI rewriting (replace with actual API call). One append,
+        # one QTextEdit relayout — not one per line during batch rewrites
+        self.log_output.append(
+            f"Rewriting for '{story_data['title']}' with profile '{selected_profile_name}'...\n"
+            f"AI Prompt (simulated): {ai_prompt[:100]}..." # Show a snippet of the prompt
+        )
+
+        # Run the (eventual) API call off the GUI thread so the rundown
+        # stays responsive while rewrites are in flight
+        header = f"[[Rewritten by AI for {selected_profile_name} in {selected_style_name}, {selected_tone_name}, {selected_length_name} style]]\n\n" # Placeholder
+        worker = RewriteWorker(story_data, ai_prompt, header, original_summary)
+        worker.signals.done.connect(self._on_rewrite_done)
+        self.threadpool.start(worker)
+
+    def _on_rewrite_done(self, story_data, rewritten_text):
+        story_data["teleprompter_text"] = rewritten_text
+        story_data["rewritten"] = True
+        # Only refresh the editor if the rewritten story is still selected
+        current_item = self.rundown_tree.currentItem()
+        if current_item and current_item.data(0, Qt.UserRole) is story_data:
+            self.teleprompter_text_edit.setText(rewritten_text)
+        self.log_output.append(f"Rewriting for '{story_data['title']}' complete.")
+
+    def on_rundown_item_selected(self, current, previous):
+        # Repeat notifications for the same row (programmatic re-selects,
+        # dropdown refreshes) have nothing new to show
+        if current is self._last_selected_item:
+            return
+        self._last_selected_item = current
+
+        # The combos are being synced to the selection, not edited; keep
+        # their currentTextChanged handlers out of it
+        combos = (self.select_character_combo, self.style_combo,
+                  self.tone_combo, self.length_combo)
+        for combo in combos:
+            combo.blockSignals(True)
+        try:
+            if current:
+                story_data = current.data(0, Qt.UserRole)
+                if story_data:
+                    self.teleprompter_text_edit.setText(story_data.get("teleprompter_text", story_data.get("summary", "")))
+
+                    # Update character dropdown
+                    profile = story_data.get("profile")
+                    if profile and profile in self.character_profiles:
+                        self.select_character_combo.setCurrentText(profile)
+
+                    # Update rewrite options dropdowns
+                    self.style_combo.setCurrentText(story_data.get("style", "Standard"))
+                    self.tone_combo.setCurrentText(story_data.get("tone", "Objective"))
+                    self.length_combo.setCurrentText(story_data.get("length", "Standard"))
+
+            else:
+                self.teleprompter_text_edit.clear()
+                # Signals are blocked above; also skip the index write (and
+                # the repaint it forces) for combos already at the default
+                for combo in combos:
+                    if combo.currentIndex() != 0:
+                        combo.setCurrentIndex(0) # Default to first item
+        finally:
+            for combo in combos:
+                combo.blockSignals(False)
+
+    def apply_teleprompter_text(self):
+        current_item = self.rundown_tree.currentItem()
+        if current_item:
+            story_data = current_item.data(0, Qt.UserRole)
+            if story_data:
+                new_text = self.teleprompter_text_edit.toPlainText()
+                if story_data.get("teleprompter_text") == new_text:
+                    return # Nothing changed; skip the write and the message
+                story_data["teleprompter_text"] = new_text
+                # Non-blocking confirmation instead of a modal to dismiss
+                self.statusBar().showMessage("Teleprompter text updated for selected article.", 2000)
+        else:
+            QMessageBox.warning(self, "No Article Selected", "Please select an article in the rundown to apply text to.")
+
+    @staticmethod
+    def parse_duration_string(duration_str):
+        """Parse HH:MM or MM:SS duration string into total seconds.
+
+        Pure string -> seconds, so results are memoized; rundowns reuse a
+        handful of durations ("00:30", "01:00") and repeat calls are dict hits.
+        """
+        if not isinstance(duration_str, str):
+            return None
+        return _parse_duration_cached(duration_str.strip())
+
+    @staticmethod
+    def parse_backtime_string(bt_str):
+        """Try multiple time formats and return a datetime.time object or None.
+
+        Memoized for the same reason as parse_duration_string: the clock
+        timer reparses the first item's backtime once a second.
+        """
+        if not bt_str:
+            return None
+        bt_str = bt_str.strip()
+        if not bt_str:
+            return None
+        return _parse_backtime_cached(bt_str)
+
+def launch_app():
+    # os, QApplication and Qt are already imported at module scope; a second
+    # import here would just re-run import bytecode and take the import lock
+    os.environ["QT_SCALE_FACTOR_ROUNDING_POLICY"] = "PassThrough"
+
+    # Removed: QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True) - Handled by QGuiApplication.setHighDpiScaleFactorRoundingPolicy earlier
+
+    QApplication.setStyle("Fusion")
+    app = QApplication(sys.argv)
+    app.setStyleSheet(_APP_QSS)
+
+    main_window = NewsAggregatorApp()
+    main_window.show()
+    sys.exit(app.exec())
+
+if __name__ == "__main__":
     launch_app()
\ No newline at end of file
@@ -1,4 +1,3 @@
-import sys
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QGuiApplication
 
@@ -6,7 +5,6 @@ from PySide6.QtGui import QGuiApplication
 QGuiApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
 
 # ✅ Now import the rest of the modules that might initialize a GUI
-from PySide6.QtWidgets import QApplication
 import news_aggregator
 
 news_aggregator.launch_app()